@@ -1,45 +1,106 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
+import numpy as np
+import time
+from collections import deque
 from pathlib import Path
-import numpy as np  # for jitter offsets
+
+from dashboard import (charts, elections, ensemble, montecarlo, pathways, payload, policy,
+                       wrangle)
+from dashboard.similarity import DEFAULT_CLUSTERS, HEATMAP_MAX, PartySimilarity
+from dashboard.charts import FigureCache
+from dashboard.constants import BASE_SCN, BUILDER_SOURCES, CUSTOM_SCENARIO, TARGET_SCN
+from dashboard.pathways import PathwaySpec
+from dashboard.policy import CYCLES, PolicyStore
+from dashboard.profiling import Profiler, rss_bytes
+from dashboard.scenario import IncrementalScenario
+from dashboard.store import SharedStore
+from dashboard.watcher import WorkbookWatcher
 
 # ---------------------------------------------------------------------#
 # 0. Page configuration & constants
 # ---------------------------------------------------------------------#
 st.set_page_config(page_title="2025 대선 기후 정책 종합 분석", layout="wide")
 
-BASELINE_PARTY = "2018년 기준"
-NDC_PARTY      = "2030 NDC"
-
-# 정당별 대표색 (필요에 따라 추가)
-PARTY_COLORS = {
-    "국민의힘":   "#E61E2B",  # 빨강
-    "더불어민주당": "#0066FF",  # 파랑
-    "개혁신당":     "#FF8800",  # 주황
-    "민주노동당":   "#FFD700",  # 노랑
-    "녹색정의당":  "#FFD700",  # 노랑
-    BASELINE_PARTY: "#999999",
-    NDC_PARTY:      "#000000",
-}
+# Party / energy colours live in dashboard/constants.py
 
 # ---------------------------------------------------------------------#
 # 1. Load Excel
 # ---------------------------------------------------------------------#
 EXCEL_PATH = Path(__file__).parent / "data" / "climate_data.xlsx"
 
-@st.cache_data
-def load_sheets(path: Path) -> dict[str, pd.DataFrame]:
-    """Read every sheet in an Excel file into a dict of DataFrames."""
-    if not path.exists():
-        st.error(f"엑셀 파일 '{path.name}'이(가) 존재하지 않습니다.")
-        st.stop()
+@st.cache_resource
+def workbook_watcher(path: Path) -> WorkbookWatcher:
+    """
+    The workbook as a lazy sheet registry shared by all sessions, kept
+    current by a background thread (dashboard/watcher.py). Each sheet is
+    parsed (or memory‑mapped from the Arrow snapshot, see
+    dashboard/snapshot.py) on first access; after an edit only the changed
+    sheets are re‑parsed, off the request path.
+    """
+    return WorkbookWatcher(path).start()
+
+
+@st.cache_resource
+def figure_cache() -> FigureCache:
+    """Process‑wide LRU of built figures, shared by all sessions."""
+    return FigureCache(maxsize=256)
+
+
+@st.cache_resource
+def shared_store() -> SharedStore:
+    """
+    Tidy frames built once per process and handed to every session as the
+    same read‑only object (dashboard/store.py) – unlike ``cache_data``,
+    which unpickles a fresh copy on every hit.
+    """
+    return SharedStore()
+
+
+if not EXCEL_PATH.exists():
+    st.error(f"엑셀 파일 '{EXCEL_PATH.name}'이(가) 존재하지 않습니다.")
+    st.stop()
+
+watcher = workbook_watcher(EXCEL_PATH)
+sheets = watcher.current        # one consistent workbook for this whole run
+FIGS = figure_cache()
+STORE = shared_store()
+
+# Opt‑in per‑stage profiling of this rerun (sidebar panel or ?profile=1)
+PROF = Profiler(enabled=st.session_state.get("profiling", False)
+                or st.query_params.get("profile") == "1")
+
+
+def cached_figure(key, build):
+    """``FIGS.get`` timed as the figure stage; figures are cached compacted."""
+    with PROF.stage("figure"):
+        return FIGS.get(key, lambda: payload.compact(build()))
 
-    xls = pd.ExcelFile(path)
-    return {name: pd.read_excel(xls, sheet_name=name) for name in xls.sheet_names}
 
+def show(fig, where=st, **kwargs):
+    """``plotly_chart`` timed as the serialize stage; returns its selection state."""
+    if PROF.enabled:
+        PROF.payload_bytes += payload.nbytes(fig)
+    with PROF.stage("serialize"):
+        return where.plotly_chart(fig, use_container_width=True, **kwargs)
 
-sheets = load_sheets(EXCEL_PATH)
+
+def _evict_stale_figures(old, new, changed):
+    """After a reload, drop only figures keyed on a changed sheet's version."""
+    FIGS.evict({old.part_hashes[n] for n in changed if n in old.part_hashes})
+
+watcher.subscribe("figures", _evict_stale_figures)
+
+def load_sheet(name: str) -> pd.DataFrame:
+    """
+    ``sheets[name]``; a parse this rerun triggers (or waits on, when another
+    session got there first) is timed as its load stage, inside the
+    wrangle stage it happens in.
+    """
+    if name in sheets.loaded():
+        return sheets[name]
+    with PROF.stage("load"):
+        return sheets[name]
 
 # --- Debug sidebar: show all sheet names -----------------------------#
 with st.sidebar.expander("📄 엑셀 시트 목록", expanded=False):
@@ -49,10 +110,11 @@ def find_sheet(keywords: list[str]) -> pd.DataFrame:
     """
     Return the first sheet whose name contains ANY of the given keywords.
     If nothing matches, raise a descriptive error listing available sheets.
+    Only the matched sheet is parsed.
     """
-    for name, df in sheets.items():
-        if any(k in name for k in keywords):
-            return df.copy()
+    name = sheets.find(keywords)
+    if name is not None:
+        return load_sheet(name)     # frozen and shared: never modified in place
 
     kw = ", ".join(keywords)
     st.error(
@@ -64,60 +126,43 @@ def find_sheet(keywords: list[str]) -> pd.DataFrame:
 # ---------------------------------------------------------------------#
 # 2. Data wrangling
 # ---------------------------------------------------------------------#
+# Each step is a pure function in dashboard/wrangle.py whose result is a
+# shared read‑only view in STORE, keyed on the content hash of the sheet it
+# reads (sheets.sheet_version): every session and rerun reads the same
+# frames without copying them, and a workbook edit only rebuilds the views
+# of the sheets that changed.
+ENERGY_KEYWORDS = ["에너지믹스"]
+TEMPERATURE_KEYWORDS = ["온도경로"]
+DESC_KEYWORDS = ["에너지설명", "energy_desc"]
+ENERGY_V = sheets.sheet_version(ENERGY_KEYWORDS)
+TEMP_V = sheets.sheet_version(TEMPERATURE_KEYWORDS)
+BANDS_V = sheets.sheet_version(ensemble.ENSEMBLE_KEYWORDS)
+
 # 2‑1. Emissions ──────────────────────────────────────────────────────
 EMISSION_KEYWORDS = ["배출", "emission", "총배출"]
-em_sheet_name = next(
-    (name for name in sheets if any(k in name for k in EMISSION_KEYWORDS)),
-    None,
-)
-
-if em_sheet_name:
-    em_raw = sheets[em_sheet_name]
 
-    # wide → long 변환 여부 판단
-    if "정당" not in em_raw.columns:
-        emissions_df = em_raw.melt(id_vars="부문", var_name="정당", value_name="값")
-    else:
-        emissions_df = em_raw.rename(columns=str).copy()
-else:
-    # 시트가 없으면 빈 DF로 설정하고 이후 탭에서 안내만 표시
-    emissions_df = pd.DataFrame()
+def emissions_data() -> pd.DataFrame:
+    em_sheet_name = sheets.find(EMISSION_KEYWORDS)
+    if em_sheet_name is None:
+        # 시트가 없으면 빈 DF로 설정하고 이후 탭에서 안내만 표시
+        return pd.DataFrame()
+    return wrangle.tidy_emissions(load_sheet(em_sheet_name))
 
+with PROF.stage("wrangle"):
+    emissions_df = STORE.view("emissions", sheets.sheet_version(EMISSION_KEYWORDS),
+                              emissions_data)
 sectors = [s for s in emissions_df["부문"].unique() if s != "총배출"] if not emissions_df.empty else []
 parties  = emissions_df["정당"].unique().tolist() if not emissions_df.empty else []
 
-# Color palette for energy sources (stacked bar)
-ENERGY_COLORS = {
-    "석탄":    "#000000",  # 검정
-    "LNG":     "#808080",  # 회색
-    "원자력":  "#0066FF",  # 파랑
-    "재생에너지": "#22C55E",  # 초록
-    "기타":    "#60A5FA",  # 하늘
-    "청정수소/암모니아": "#06B6D4",
-    "바이오":  "#A855F7",
-    "연료전지": "#10B981",
-}
-
 # 2‑2. Energy mix ─────────────────────────────────────────────────────
-en_raw = find_sheet(["에너지믹스"])
-if en_raw.empty:
-    energy_df = pd.DataFrame()             # 처리 없이 빈 DF
-else:
-    energy_df = (en_raw if "시나리오" in en_raw.columns
-                 else en_raw.melt(id_vars="에너지원",
-                                  var_name="시나리오",
-                                  value_name="비중"))
-
-    # --- Standardize column names ------------------------------------------------
-    energy_df = energy_df.rename(columns=lambda c: c.strip().replace("(TWh)", "").replace(" ", ""))
+with PROF.stage("wrangle"):
+    energy_df = STORE.view("energy", ENERGY_V,
+                           lambda: wrangle.tidy_energy(find_sheet(ENERGY_KEYWORDS)))
 
 # 2‑5. Energy source descriptions (optional sheet) --------------------
-# (Load energy source descriptions from sheet if present)
-desc_df_raw = find_sheet(["에너지설명", "energy_desc"])
-if not desc_df_raw.empty and {"energy_source", "description"}.issubset(desc_df_raw.columns):
-    desc_df = desc_df_raw.copy()
-else:
-    desc_df = pd.DataFrame(columns=["energy_source", "description"])
+with PROF.stage("wrangle"):
+    desc_df = STORE.view("descriptions", sheets.sheet_version(DESC_KEYWORDS),
+                         lambda: wrangle.tidy_descriptions(find_sheet(DESC_KEYWORDS)))
 
 # Helper to get description for an energy source
 def get_energy_desc(source: str) -> str:
@@ -139,52 +184,65 @@ def get_energy_desc(source: str) -> str:
 # (Removed automatic share conversion as per instructions)
 
 # 2‑3. Temperature pathways ───────────────────────────────────────────
-tp_raw = find_sheet(["온도경로"])
-temp_df = (tp_raw if tp_raw.empty or "경로" in tp_raw.columns
-           else tp_raw.melt(id_vars="연도",
-                            var_name="경로",
-                            value_name="배출량"))
-
-# 2‑4. Policies (optional) ────────────────────────────────────────────
-policy_df = find_sheet(["정성평가", "policy"])
-
-def cmap(parties: list[str]) -> dict[str, str]:
-    return {p: PARTY_COLORS.get(p, "#808080") for p in parties}
+with PROF.stage("wrangle"):
+    temp_df = STORE.view("temperature", TEMP_V,
+                         lambda: wrangle.tidy_temperature(find_sheet(TEMPERATURE_KEYWORDS)))
+
+# Pathways recomputed from the energy mix (dashboard/pathways.py) for
+# user‑edited emission factors; keyed on the factor values.
+@st.cache_data(show_spinner=False, max_entries=256)
+def model_pathways(version: str, factors: tuple[tuple[str, float], ...]) -> pd.DataFrame:
+    return pathways.compute_pathways(energy_df, dict(factors))
+
+# Engine pathway of the government target scenario (scenario builder)
+def target_pathway(version: str) -> pd.DataFrame:
+    return STORE.view("target_pathway", version,
+                      lambda: pathways.compute_pathways(energy_df, scenarios=[TARGET_SCN]))
+
+# Optional Monte Carlo ensemble (연도, 경로, 표본, 배출량), reduced to
+# percentile bands once per sheet version – raw members never leave
+# the server.
+def temperature_bands() -> pd.DataFrame:
+    name = sheets.find(ensemble.ENSEMBLE_KEYWORDS)
+    ens_df = load_sheet(name) if name is not None else pd.DataFrame()
+    return ensemble.percentile_bands(ens_df)
+
+with PROF.stage("wrangle"):
+    temp_bands = STORE.view("temperature_bands", BANDS_V, temperature_bands)
+
+# Monte Carlo bands over factor / demand / non‑power uncertainty
+# (dashboard/montecarlo.py); computed in‑process, once per draw count.
+MC_DRAWS = [0, 10_000, 100_000]
+
+@st.cache_data(show_spinner="몬테카를로 계산 중…", max_entries=8)
+def montecarlo_bands(version: str, draws: int) -> pd.DataFrame:
+    return montecarlo.run(energy_df, draws, workers=1)
 
 # ---------------------------------------------------------------------#
 # Helper for policy scatter chart
 # ---------------------------------------------------------------------#
-def load_policy_df(sheet_keywords: list[str]) -> pd.DataFrame:
-    """
-    Return policy DataFrame in long format:
-    columns = ['category','party','level','description']
-    """
-    try:
-        df_raw = find_sheet(sheet_keywords)
-    except st.runtime.scriptrunner.StopException:  # find_sheet already showed error
-        return pd.DataFrame()
+# Every policy sheet (dashboard/policy.py CYCLES) in one indexed store,
+# built once per combination of sheet versions and shared read‑only by
+# all sessions.
+@st.cache_resource(show_spinner=False, max_entries=4)
+def policy_store(versions: tuple[str, ...]) -> PolicyStore:
+    names = set(sheets)         # names only: ``in sheets`` would parse the sheet
+    return PolicyStore.from_sheets({c.sheet: load_sheet(c.sheet)
+                                    for c in CYCLES if c.sheet in names})
 
-    # Expect either already long‑form, or wide JSON‑like sheet
-    if set(["category", "party", "level", "description"]).issubset(df_raw.columns):
-        return df_raw.copy()
-
-    # Otherwise, try to normalize a nested JSON style
-    records = []
-    for _, row in df_raw.iterrows():
-        cat = row["category"] if "category" in df_raw.columns else row.iloc[0]
-        parties_dict = row["parties"] if "parties" in df_raw.columns else None
-        if isinstance(parties_dict, dict):
-            for p, d in parties_dict.items():
-                records.append({
-                    "category": cat,
-                    "party": p,
-                    "level": d.get("level"),
-                    "description": d.get("description")
-                })
-    return pd.DataFrame(records)
-
-
-def policy_scatter(policy_df: pd.DataFrame, title: str):
+POLICY_V = {c.label: sheets.part_hashes.get(c.sheet, "") for c in CYCLES}
+with PROF.stage("wrangle"):
+    policies = policy_store(tuple(POLICY_V.values()))
+
+
+# Precinct election results (data/elections/<cycle>/*.csv), streamed and
+# aggregated to districts once per set of files (dashboard/elections.py)
+RESULTS_V = elections.results_version()
+with PROF.stage("wrangle"), st.spinner("선거 결과 집계 중…"):
+    results_df = STORE.view("elections", RESULTS_V, elections.load_results)
+
+
+def policy_scatter(policy_df: pd.DataFrame, title: str, version: str):
     if policy_df.empty:
         st.info("정책 데이터를 찾지 못했습니다.")
         return
@@ -199,40 +257,78 @@ def policy_scatter(policy_df: pd.DataFrame, title: str):
     if sel_parties:
         policy_df = policy_df.query("party in @sel_parties")
 
-    # Jitter duplicates horizontally so all circles are visible
-    parties_local = list(policy_df["party"].unique())
-    offsets = np.linspace(-0.15, 0.15, len(parties_local))
-    offset_map = dict(zip(parties_local, offsets))
-    policy_df = policy_df.assign(level_offset=policy_df.apply(
-        lambda r: r["level"] + offset_map[r["party"]], axis=1))
+    # Descriptions are not in the figure; a clicked point shows its own
+    fig = cached_figure(("policy", version, title, tuple(sel_parties)),
+                        lambda: charts.policy_scatter(policy_df, title, descriptions=False))
+    event = show(fig, on_select="rerun", selection_mode="points", key=f"scatter_{title}")
+    picked = charts.policy_points(policy_df, event.selection.points if event else [])
+    for row in picked.itertuples():
+        st.markdown(f"**{row.party} · {row.category}** — {row.description}")
 
-    policy_df["symbol"] = policy_df["level"].apply(
-        lambda v: 'x' if pd.isna(v) else 'circle'
-    )
-
-    fig = px.scatter(
-        policy_df,
-        x="level_offset",
-        y="category",
-        color="party",
-        symbol="symbol",
-        symbol_map={'circle':'circle','x':'x'},
-        hover_data=["description"],
-        color_discrete_map=PARTY_COLORS,
-        height=700,
-    )
-    fig.update_traces(marker_size=16)
-    # Make 'X' markers bigger & grey
-    fig.update_traces(selector=dict(symbol='x'),
-                      marker_size=18,
-                      marker_color="#BBBBBB")
-    fig.update_xaxes(
-        range=[0.5, 3.5],
-        tickvals=[1, 2, 3],
-        ticktext=["공약없음", "정책명시", "정책강화"]
+# ---------------------------------------------------------------------#
+# Scenario builder (runs as a fragment: a slider tick reruns only this)
+# ---------------------------------------------------------------------#
+@st.fragment
+def scenario_builder():
+    t0 = time.perf_counter()
+    value_col = wrangle.value_column(energy_df)
+    scenarios = energy_df["시나리오"].unique().tolist()
+
+    s1, s2 = st.columns([3, 1])
+    start_scn = s1.selectbox("시작 시나리오", scenarios, key="builder_start",
+                             index=scenarios.index(TARGET_SCN) if TARGET_SCN in scenarios else 0)
+    target_year = s2.radio("목표 연도", [2035, 2040], index=1, horizontal=True,
+                           key="builder_year")
+
+    # Per‑session incremental state; rebuilt only when the anchor year changes
+    state = st.session_state.get("builder_state")
+    if state is None or state.spec.target_year != target_year:
+        state = IncrementalScenario(BUILDER_SOURCES, spec=PathwaySpec(target_year=target_year))
+        st.session_state["builder_state"] = state
+
+    # Seed the sliders from the chosen starting scenario
+    if st.session_state.get("builder_seed") != start_scn:
+        start_mix = energy_df.query("시나리오 == @start_scn").set_index("에너지원")[value_col]
+        for src in BUILDER_SOURCES:
+            st.session_state[f"builder_{src}"] = float(start_mix.get(src, 0.0))
+        st.session_state["builder_seed"] = start_scn
+
+    cols = st.columns(3)
+    values = {src: cols[i % 3].slider(f"{src} (TWh)", 0.0, 800.0, step=0.1,
+                                      key=f"builder_{src}")
+              for i, src in enumerate(BUILDER_SOURCES)}
+    changed = state.update(values)
+
+    # Base / target bars come straight from the shared figure cache
+    c1, c2, c3 = st.columns(3)
+    for scn, col in [(BASE_SCN, c1), (TARGET_SCN, c2)]:
+        if scn in scenarios:
+            show(cached_figure(("stacked_mix", ENERGY_V, scn),
+                               lambda scn=scn: charts.stacked_mix(energy_df, scn)),
+                 col, key=f"builder_mix_{scn}")
+    with PROF.stage("figure"):
+        fig_mix = payload.compact(charts.stacked_mix(
+            state.mix_frame(CUSTOM_SCENARIO, value_col), CUSTOM_SCENARIO))
+    show(fig_mix, c3)
+
+    ref_paths = wrangle.split_paths(temp_df)[0] if not temp_df.empty else []
+    target = target_pathway(ENERGY_V)
+    plot_df = pd.concat([temp_df[temp_df["경로"].isin(ref_paths)] if ref_paths else None,
+                         target, state.pathway_frame(CUSTOM_SCENARIO)], ignore_index=True)
+    with PROF.stage("figure"):
+        fig_path = payload.compact(charts.temperature_lines(
+            plot_df, ref_paths, [*target["경로"].unique(), CUSTOM_SCENARIO]))
+    show(fig_path)
+
+    # Slider‑to‑render latency (server side, this fragment only)
+    lat = st.session_state.setdefault("builder_latency", deque(maxlen=50))
+    lat.append((time.perf_counter() - t0) * 1000)
+    st.caption(
+        f"총 {sum(values.values()):.1f} TWh · 전력 배출 {state.power:.1f} Mt · "
+        f"재계산된 전원: {', '.join(changed) or '없음'} · "
+        f"응답 {lat[-1]:.0f} ms (p50 {np.percentile(lat, 50):.0f} / "
+        f"p95 {np.percentile(lat, 95):.0f} ms, 최근 {len(lat)}회)"
     )
-    fig.update_layout(title=title, yaxis_title="", xaxis_title="정책 강도")
-    st.plotly_chart(fig, use_container_width=True)
 
 # ---------------------------------------------------------------------#
 # 3. Layout
@@ -240,81 +336,60 @@ def policy_scatter(policy_df: pd.DataFrame, title: str):
 st.markdown("<h1 style='text-align:center;'>2025 대선 기후 정책 종합 분석</h1>",
             unsafe_allow_html=True)
 
-# Top‑level tabs
+# Top‑level tabs. They track the selected tab (on_change="rerun") so only
+# the open one runs; each tab body is a function below, and those with
+# widgets are fragments, so an interaction reruns that tab alone.
 TABS = st.tabs([
     "⚡ 전력 에너지믹스 후보 비교",          # index 0
     "⚡ 전력 에너지믹스 (기준 비교)",  # index 1
     "🌡 온도경로",                    # 2
     "📊 정책-대선",                  # 3
     "📊 정책-지난총선",              # 4
-    "ℹ️ 설명"                        # 5
-])
+    "📈 정책 변화",                  # 5
+    "🤝 정당 유사도",                # 6
+    "🛠 시나리오 빌더",               # 7
+    "ℹ️ 설명"                        # 8
+], key="tab", on_change="rerun")
 
 # ────────────────────────────────────────────────────────────────────#
 # Tab 0 : Energy mix – all candidates side‑by‑side
 # ────────────────────────────────────────────────────────────────────#
-with TABS[0]:
+def energy_all_tab():
     st.subheader("전력 에너지 믹스 - 후보/정당 간 비교")
 
     # Recompute scenario list locally
     scenarios = energy_df["시나리오"].unique().tolist() if not energy_df.empty else []
-    base_scn   = "정부(실적)-2018"
-    target_scn = "정부(계획)-2038"
 
     if energy_df.empty:
         st.info("에너지 믹스 시트를 찾지 못했습니다.")
     else:
         # 후보 시나리오 = everything except base & target
-        candidate_scn = [s for s in scenarios if s not in [base_scn, target_scn]]
+        candidate_scn = [s for s in scenarios if s not in [BASE_SCN, TARGET_SCN]]
         if not candidate_scn:
             st.warning("후보 시나리오가 없습니다.")
         else:
-            # determine which numeric column to use
-            if "비중" in energy_df.columns:
-                value_col = "비중"
-            else:
-                numeric_cols = energy_df.select_dtypes("number").columns
-                value_col = next(col for col in numeric_cols if col not in ["에너지원"])
-            fig_all = px.bar(
-                energy_df.query("시나리오 in @candidate_scn"),
-                y="시나리오",
-                x=value_col,
-                color="에너지원",
-                orientation="h",
-                color_discrete_map=ENERGY_COLORS,
-                category_orders={
-                    "에너지원": ["석탄","LNG","원자력","재생에너지","기타"],
-                    "시나리오": candidate_scn  # keep order as in data
-                },
-                barmode="stack",
-                height=500
-            )
-            if value_col == "비중":
-                fig_all.update_xaxes(range=[0, 100], title="비중 (%)")
-            else:
-                fig_all.update_xaxes(title=value_col)
-            fig_all.update_layout(legend_title="에너지원")
-            st.plotly_chart(fig_all, use_container_width=True)
+            fig_all = cached_figure(("energy_all", ENERGY_V),
+                                    lambda: charts.energy_all_bar(energy_df, candidate_scn))
+            show(fig_all)
 
 
 # ────────────────────────────────────────────────────────────────────#
 # Tab 1 : Energy mix (기준·목표·선택)
 # ────────────────────────────────────────────────────────────────────#
-with TABS[1]:
+@st.fragment
+def energy_mix_tab():
     st.subheader("전력 에너지 믹스 – 2018 vs 2038 vs 선택 시나리오")
 
     if energy_df.empty:
         st.info("에너지 믹스 시트를 찾지 못했습니다.")
     else:
         scenarios = energy_df["시나리오"].unique().tolist()
-        base_scn   = "정부(실적)-2018"
-        target_scn = "정부(계획)-2038"
-        if base_scn not in scenarios or target_scn not in scenarios:
+        if BASE_SCN not in scenarios or TARGET_SCN not in scenarios:
             st.error("에너지 믹스 시트에 기준·목표 시나리오 이름이 없습니다. "
                      "현재 시나리오 목록: " + ", ".join(scenarios))
             st.stop()
 
-        selectable = [s for s in scenarios if s not in [base_scn, target_scn]]
+        selectable = [s for s in scenarios if s not in [BASE_SCN, TARGET_SCN]]
 
         if not selectable:
             st.error("선택할 추가 시나리오가 없습니다. 시트에 정당/시나리오를 더 추가해 주세요.")
@@ -323,99 +398,204 @@ with TABS[1]:
         sel_scn = st.selectbox("정당/시나리오 선택", selectable)
 
         def stacked_mix(scn, col):
-            df_plot = energy_df.query("시나리오 == @scn")
-
-            if "비중" in df_plot.columns:
-                value_col = "비중"
-                y_label   = "비중 (%)"
-            else:
-                # pick the first numeric column that is not '에너지원' or '시나리오'
-                numeric_cols = df_plot.select_dtypes("number").columns
-                value_col = next(col for col in numeric_cols if col not in ["에너지원"])
-                y_label   = value_col
-
-            # create a single‑column label so the scenario shows as one bar
-            df_plot = df_plot.assign(scn_label=scn)
-
-            fig = px.bar(
-                df_plot,
-                x="scn_label",           # one bar per scenario
-                y=value_col,
-                color="에너지원",
-                color_discrete_map=ENERGY_COLORS,
-                category_orders={"에너지원": ["석탄","LNG","원자력","재생에너지","기타"]},
-                barmode="stack",
-                height=450
-            )
-            if value_col == "비중":
-                fig.update_yaxes(range=[0, 100])
-            fig.update_xaxes(title="")
-            fig.update_yaxes(title=y_label)
-            fig.update_layout(showlegend=True, legend_title="에너지원", title=scn)
-            col.plotly_chart(fig, use_container_width=True)
+            fig = cached_figure(("stacked_mix", ENERGY_V, scn),
+                                lambda: charts.stacked_mix(energy_df, scn))
+            show(fig, col)
 
         c1, c2, c3 = st.columns(3)
-        stacked_mix(base_scn,   c1)
-        stacked_mix(target_scn, c2)
+        stacked_mix(BASE_SCN,   c1)
+        stacked_mix(TARGET_SCN, c2)
         stacked_mix(sel_scn,    c3)
 
 #
 # Tab 2 : Temperature pathways
 # ────────────────────────────────────────────────────────────────────#
-with TABS[2]:
+@st.fragment
+def temperature_tab():
     st.subheader("온도 경로 분석")
 
     if temp_df.empty:
         st.info("온도경로 시트를 찾지 못했습니다.")
     else:
-        paths_all = temp_df["경로"].unique()
-        ref_paths = [p for p in paths_all if "°C" in p]
-        party_paths = [p for p in paths_all if p not in ref_paths]
+        ref_paths, party_paths = wrangle.split_paths(temp_df)
+
+        # Live recomputation from the energy mix with adjustable factors
+        with st.expander("⚙️ 배출계수로 경로 재계산", expanded=False):
+            use_model = st.toggle("에너지믹스 기반 모델 경로 사용", value=False,
+                                  disabled=energy_df.empty)
+            fc = st.columns(3)
+            factors = {
+                src: fc[i].number_input(f"{src} (kgCO₂/kWh)", min_value=0.0,
+                                        max_value=2.0, step=0.01, format="%.4f",
+                                        value=pathways.DEFAULT_FACTORS[src])
+                for i, src in enumerate(["석탄", "LNG", "기타"])
+            }
+        factor_key = tuple(sorted({**pathways.DEFAULT_FACTORS, **factors}.items()))
+        tab_temp_df = temp_df
+        if use_model and not energy_df.empty:
+            modelled = model_pathways(ENERGY_V, factor_key)
+            tab_temp_df = pd.concat(
+                [temp_df[~temp_df["경로"].isin(modelled["경로"].unique())], modelled],
+                ignore_index=True)
+
+        # Uncertainty bands from the Monte Carlo batch mode
+        with st.expander("🎲 불확실성 밴드 (몬테카를로)", expanded=False):
+            mc_draws = st.select_slider(
+                "표본 수 (0 = 끄기)", options=MC_DRAWS, value=0,
+                format_func=lambda n: f"{n:,}", disabled=energy_df.empty)
+            st.caption("배출계수(±10 %), 전력수요 증가율(연 1 ± 0.5 %), "
+                       "비전력 부문(±5 %)을 무작위로 뽑아 5–95 백분위 밴드를 그립니다.")
+        tab_bands = temp_bands
+        if mc_draws and not energy_df.empty:
+            mc_bands = montecarlo_bands(ENERGY_V, mc_draws)
+            tab_bands = pd.concat(
+                [temp_bands[~temp_bands["경로"].isin(mc_bands["경로"].unique())], mc_bands],
+                ignore_index=True)
 
         sel_paths = st.multiselect("정당 경로 선택", party_paths,
                                    default=party_paths)  # 모든 경로 기본 선택
-        plot_df = temp_df.query("경로 in @ref_paths or 경로 in @sel_paths")
 
-        line_dash = plot_df["경로"].apply(
-            lambda x: "dash" if x in ref_paths else "solid")
-
-        fig = px.line(
-            plot_df, x="연도", y="배출량", color="경로",
-            line_dash=line_dash,
-            color_discrete_map={**cmap(sel_paths),
-                                **{p: "#000000" for p in ref_paths}},   # reference paths in black
-            labels={"배출량": "배출량 (백만톤 CO₂eq)"}, height=600
+        # WebGL + server‑side downsampling once the data gets dense
+        high_volume = st.toggle(
+            "대용량 모드 (WebGL·다운샘플링)",
+            value=len(tab_temp_df) > charts.HIGH_VOLUME_POINTS or not tab_bands.empty,
         )
-
-        # Make reference (°C) paths thick black, and increase others by one step
-        for t in fig.data:
-            if "°C" in t.name:
-                t.update(line=dict(width=7, color="#000000"))  # reference paths
-            else:
-                current = t.line.width or 2
-                t.update(line=dict(width=current + 1))         # party paths +1 px
-        st.plotly_chart(fig, use_container_width=True)
+        model_key = factor_key if use_model else None
+        if high_volume:
+            fig = cached_figure(("temperature_gl", TEMP_V, ENERGY_V, BANDS_V, model_key,
+                                 mc_draws, tuple(sel_paths)),
+                                lambda: charts.temperature_lines_gl(
+                                    tab_temp_df, ref_paths, sel_paths, bands=tab_bands))
+        else:
+            fig = cached_figure(("temperature", TEMP_V, ENERGY_V, model_key, tuple(sel_paths)),
+                                lambda: charts.temperature_lines(tab_temp_df, ref_paths, sel_paths))
+        show(fig)
 
 # ────────────────────────────────────────────────────────────────────#
 # Tab 3 : Policy – current election
 # ────────────────────────────────────────────────────────────────────#
-with TABS[3]:
+@st.fragment
+def policy_current_tab():
     st.subheader("정책 비교 – 2025 대선")
-    df_policy_current = load_policy_df(["policy", "정책"])
-    policy_scatter(df_policy_current, "2025 대선 정책 강도 분포")
+    policy_scatter(policies.cycle_frame("2025 대선"), policy.cycle("2025 대선").title,
+                   POLICY_V["2025 대선"])
 
 # ────────────────────────────────────────────────────────────────────#
 # Tab 4 : Policy – previous general election
 # ────────────────────────────────────────────────────────────────────#
-with TABS[4]:
+@st.fragment
+def policy_previous_tab():
     st.subheader("정책 비교 – 지난 총선")
-    df_policy_gen = load_policy_df(["총선", "policy_gen"])
-    policy_scatter(df_policy_gen, "지난 총선 정책 강도 분포")
+    policy_scatter(policies.cycle_frame("2024 총선"), policy.cycle("2024 총선").title,
+                   POLICY_V["2024 총선"])
+
+# ────────────────────────────────────────────────────────────────────#
+# Tab 5 : Policy – change between cycles
+# ────────────────────────────────────────────────────────────────────#
+@st.fragment
+def policy_change_tab():
+    st.subheader("정책 변화 – 선거 간 비교")
+
+    if len(policies.cycles) < 2:
+        st.info("비교할 정책 시트가 두 개 이상 필요합니다.")
+    else:
+        p1, p2 = st.columns(2)
+        old_cycle = p1.selectbox("이전 선거", policies.cycles[:-1], index=0)
+        new_cycle = p2.selectbox("비교 선거", [c for c in policies.cycles[::-1] if c != old_cycle],
+                                 index=0)
+        fig = cached_figure(("policy_change", old_cycle, new_cycle,
+                             POLICY_V[old_cycle], POLICY_V[new_cycle]),
+                            lambda: charts.policy_change_heatmap(
+                                policies.level_change(old_cycle, new_cycle),
+                                f"{old_cycle} → {new_cycle} 정책 강도 변화"))
+        show(fig)
+
+        sel_cat = st.selectbox("분야별 상세", policies.categories())
+        detail = (policies.level_change(old_cycle, new_cycle, category=sel_cat)
+                  .drop(columns="category")
+                  .rename(columns={"party": "정당", "level_old": old_cycle,
+                                   "level_new": new_cycle, "change": "변화"}))
+        st.dataframe(detail, hide_index=True, use_container_width=True)
+
+        vote_cycles = [c for c in policies.cycles if c in set(results_df["cycle"])]
+        if vote_cycles:
+            with st.expander("🗳 지역별 득표 × 정책 강도", expanded=False):
+                v1, v2 = st.columns(2)
+                vote_cycle = v1.selectbox("선거", vote_cycles[::-1], key="vote_cycle")
+                vote_cat = v2.selectbox("분야", policies.categories(vote_cycle),
+                                        key="vote_category")
+                fig = cached_figure(("vote_share", RESULTS_V, POLICY_V[vote_cycle],
+                                     vote_cycle, vote_cat),
+                                    lambda: charts.vote_share_by_level(
+                                        elections.vote_share_by_level(
+                                            results_df, policies, vote_cycle, vote_cat),
+                                        f"{vote_cycle} · {vote_cat}"))
+                show(fig)
+                if not energy_df.empty:
+                    st.caption("득표로 가중한 후보 에너지믹스 (%)")
+                    st.dataframe(elections.vote_weighted_mix(results_df, energy_df,
+                                                             vote_cycle).round(1),
+                                 use_container_width=True)
+
+        with st.expander(CYCLES[0].title, expanded=False):
+            policy_scatter(policies.cycle_frame(CYCLES[0].label), CYCLES[0].title,
+                           POLICY_V[CYCLES[0].label])
 
 # ────────────────────────────────────────────────────────────────────#
-# Tab 5 : Explanation
+# Tab 6 : Party similarity across all cycles
 # ────────────────────────────────────────────────────────────────────#
-with TABS[5]:
+# Distances and clustering (dashboard/similarity.py) depend only on the
+# policy sheets: computed once per combination of versions, like the store.
+@st.cache_resource(show_spinner="정당 유사도 계산 중…", max_entries=4)
+def party_similarity(versions: tuple[str, ...]) -> PartySimilarity:
+    return PartySimilarity.from_store(policies)
+
+@st.fragment
+def similarity_tab():
+    st.subheader("정당 유사도 – 전체 선거·분야의 정책 강도 비교")
+
+    sim = party_similarity(tuple(POLICY_V.values()))
+    if len(sim) < 2:
+        st.info("비교할 정당이 두 곳 이상 필요합니다.")
+        return
+    st.caption("두 정당이 모두 입장을 낸 (선거, 분야)만 비교한 정책 강도 차이의 제곱평균제곱근 "
+               "(0 = 같음, 2 = 정반대). 공약이 없는 항목(x)은 제외합니다.")
+    k = st.slider("클러스터 수", 1, min(len(sim), 10), min(DEFAULT_CLUSTERS, len(sim)))
+    if len(sim) <= HEATMAP_MAX:
+        fig = cached_figure(("party_similarity", tuple(POLICY_V.values())),
+                            lambda: charts.party_similarity_heatmap(sim.frame(),
+                                                                    "정당 간 정책 거리"))
+    else:
+        fig = cached_figure(("cluster_similarity", tuple(POLICY_V.values()), k),
+                            lambda: charts.party_similarity_heatmap(sim.cluster_distance(k),
+                                                                    "클러스터 간 평균 정책 거리"))
+    show(fig)
+
+    c1, c2 = st.columns(2)
+    c1.caption("가장 가까운 정당 쌍")
+    c1.dataframe(sim.closest(10).round({"distance": 2})
+                 .rename(columns={"party_a": "정당 A", "party_b": "정당 B",
+                                  "distance": "거리", "shared": "비교 항목 수"}),
+                 hide_index=True, use_container_width=True)
+    c2.caption("클러스터")
+    c2.dataframe(sim.clusters(k).rename("클러스터").rename_axis("정당").reset_index(),
+                 hide_index=True, use_container_width=True)
+
+# ────────────────────────────────────────────────────────────────────#
+# Tab 7 : Scenario builder
+# ────────────────────────────────────────────────────────────────────#
+def builder_tab():
+    st.subheader("시나리오 빌더 – 전원 구성을 직접 조정")
+
+    if energy_df.empty:
+        st.info("에너지 믹스 시트를 찾지 못했습니다.")
+    else:
+        scenario_builder()
+
+# ────────────────────────────────────────────────────────────────────#
+# Tab 8 : Explanation
+# ────────────────────────────────────────────────────────────────────#
+def explanation_tab():
     st.subheader("대시보드 설명서")
     
     st.markdown("""
@@ -489,6 +669,14 @@ with TABS[5]:
 * **2050 전망** 0 MtCO₂eq *(완전 탄소중립)*
 """)
 
+TAB_VIEWS = [energy_all_tab, energy_mix_tab, temperature_tab, policy_current_tab,
+             policy_previous_tab, policy_change_tab, similarity_tab, builder_tab,
+             explanation_tab]
+for tab, view in zip(TABS, TAB_VIEWS):
+    if tab.open:
+        with tab:
+            view()
+
 # ---------------------------------------------------------------------#
 # 4. Sidebar & footer
 # ---------------------------------------------------------------------#
@@ -498,8 +686,40 @@ st.sidebar.write(
     "경로 또는 파일 이름이 바뀌면 코드의 `EXCEL_PATH`도 함께 수정해 주세요."
 )
 
+# Per‑sheet load cost (filled lazily as tabs touch their sheets)
+with st.sidebar.expander("⏱ 시트 로드 시간", expanded=False):
+    st.dataframe(
+        pd.DataFrame(
+            [{"시트": n, "ms": round(t.seconds * 1000, 1), "출처": t.source}
+             for n, t in sheets.timings.items()],
+            columns=["시트", "ms", "출처"],
+        ),
+        hide_index=True,
+    )
+    if watcher.reloads:
+        st.caption(f"자동 갱신 {watcher.reloads}회 · 최근 변경 시트: "
+                   f"{', '.join(watcher.last_changed) or '없음'}")
+
 st.markdown(
     "<div style='text-align:center; margin-top:3rem; font-size:0.9rem; "
     "color:#666;'>© 2025 기후 정책 분석 대시보드</div>",
     unsafe_allow_html=True
 )
+
+# --- Profiling panel (opt‑in; dashboard/profiling.py) ----------------#
+with st.sidebar.expander("🧪 프로파일링", expanded=PROF.enabled):
+    st.toggle("실행마다 단계별 시간·메모리 기록", key="profiling")
+    if PROF.enabled:
+        stages = PROF.frame()
+        total_ms = PROF.total * 1e3
+        runs = st.session_state.setdefault("profile_runs", deque(maxlen=20))
+        runs.append({"tab": st.session_state.get("tab"), "total": round(total_ms, 1), **dict(zip(stages["stage"], stages["ms"])),
+                     "KB": round(PROF.payload_bytes / 1024, 1)})
+        rss = rss_bytes()
+        st.dataframe(stages, hide_index=True)
+        st.caption(f"이번 실행 {total_ms:.0f} ms (기타 {total_ms - stages['ms'].sum():.0f} ms)"
+                   + f" · 차트 {PROF.payload_bytes / 1024:.1f} KB"
+                   + f" · 공유 프레임 {STORE.nbytes() / 1024:.0f} KB"
+                   + (f" · RSS {rss / 2**20:.0f} MB" if rss else ""))
+        st.caption("최근 실행 (ms)")
+        st.dataframe(pd.DataFrame(runs), hide_index=True)
@@ -0,0 +1 @@
+"""Stand‑alone benchmarks; run each module with ``python -m benchmarks.<name>``."""
@@ -0,0 +1,100 @@
+"""Data API: per‑request cost and bytes of a polling embed.
+
+Starts ``dashboard.api`` on a free port over a ``benchmarks.synthetic``
+workbook and times requests over one keep‑alive connection, as an embed
+that polls would make them:
+
+* ``naive`` – what an endpoint without preparation does per request:
+  wrangle the sheet, filter, serialise (no HTTP, so a lower bound);
+* ``prepared`` – the unfiltered dataset, built with the dataset;
+* ``filtered`` – a filter combination after its first request;
+* ``304`` – the same request revalidated with ``If-None-Match``.
+
+Sizes are those of the unfiltered dataset's identity and gzip bodies (and
+brotli when installed)::
+
+    python -m benchmarks.api --scale 1 10 100
+"""
+from __future__ import annotations
+
+import argparse
+import http.client
+import statistics
+import sys
+import threading
+import time
+from urllib.parse import quote
+
+from benchmarks.synthetic import synthetic_workbook
+from dashboard import api
+from dashboard.watcher import WorkbookWatcher
+from dashboard.workbook import LazyWorkbook
+
+
+def _timed_requests(conn: http.client.HTTPConnection, path: str, n: int,
+                    headers: dict | None = None) -> tuple[float, int, dict]:
+    """Median ms of ``n`` requests; status and headers of the last."""
+    times = []
+    for _ in range(n):
+        t0 = time.perf_counter()
+        conn.request("GET", quote(path, safe="/?=&,"), headers=headers or {})
+        resp = conn.getresponse()
+        resp.read()
+        times.append(time.perf_counter() - t0)
+    return statistics.median(times) * 1e3, resp.status, dict(resp.getheaders())
+
+
+def _naive(path: str, dataset: str, column: str, value: str) -> float:
+    t0 = time.perf_counter()
+    frame = api.DATASETS[dataset].build(LazyWorkbook(path))
+    frame[frame[column] == value].to_json(orient="records", force_ascii=False).encode()
+    return (time.perf_counter() - t0) * 1e3
+
+
+def bench(scale: int, n: int) -> list[tuple[str, float | None, int | None]]:
+    path = synthetic_workbook(scale)
+    data = api.DataApi(WorkbookWatcher(path))          # also writes the snapshot
+    server = api.make_server(data, port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    conn = http.client.HTTPConnection("127.0.0.1", server.server_address[1])
+    temp = data.datasets["temperature"].frame
+    one = str(temp["path"].iloc[0])
+    try:
+        rows = [("naive", statistics.median(_naive(path, "temperature", "path", one)
+                                            for _ in range(3)), None)]
+        ms, _, _ = _timed_requests(conn, "/api/temperature", n)
+        full = data.get("/api/temperature", "")
+        rows.append(("prepared", ms, len(full.body)))
+        filtered = f"/api/temperature?path={one}&from=2030"
+        _timed_requests(conn, filtered, 1)
+        ms, _, headers = _timed_requests(conn, filtered, n)
+        rows.append(("filtered", ms, None))
+        ms, status, _ = _timed_requests(conn, filtered, n, {"If-None-Match": headers["ETag"]})
+        assert status == 304, status
+        rows.append(("304", ms, None))
+        for coding, body in full.encoded.items():
+            rows.append((f"prepared {coding}", None, len(body)))
+    finally:
+        conn.close()
+        server.shutdown()
+        server.server_close()
+    return rows
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--scale", type=int, nargs="+", default=[1, 10, 100])
+    ap.add_argument("--requests", type=int, default=200)
+    args = ap.parse_args(argv)
+
+    print(f"{'scale':>5} {'request':<14} {'median ms':>10} {'KB':>9}")
+    for scale in args.scale:
+        for name, ms, nbytes in bench(scale, args.requests):
+            ms_text = f"{ms:.2f}" if ms is not None else ""
+            kb_text = f"{nbytes / 1024:.1f}" if nbytes is not None else ""
+            print(f"{scale:>5} {name:<14} {ms_text:>10} {kb_text:>9}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+"""Throughput and memory of streaming election‑result ingestion.
+
+Aggregates ``benchmarks.synthetic`` precinct CSVs (NEC wide layout) to
+district level with ``dashboard.elections`` and reports rows/s and the
+resident set size, cold (no cache) and warm (Feather cache)::
+
+    python -m benchmarks.elections --rows 1000000 10000000
+
+Peak RSS should stay flat as ``--rows`` grows: only one batch and the
+district partial sums are in memory at a time. Each run also checks the
+joins the 정책 변화 tab makes on the result (``check``).
+"""
+from __future__ import annotations
+
+import argparse
+import shutil
+import sys
+import time
+
+import numpy as np
+
+from benchmarks.synthetic import synthetic_results, synthetic_workbook
+from dashboard import elections, export
+from dashboard.profiling import rss_bytes
+
+
+def check(df, cycle: str) -> None:
+    """``vote_weighted_mix`` and ``vote_share_by_level`` on ``df`` as app.py calls them."""
+    data = export.load_datasets(synthetic_workbook(1))
+    results = df.assign(cycle=cycle)
+    mix = elections.vote_weighted_mix(results, data["energy"], cycle)
+    assert len(mix) and np.allclose(mix.sum(axis=1).dropna(), 100), "mix shares must sum to 100"
+    store = data["policy"]
+    if cycle in store.cycles:
+        category = store.categories(cycle)[0]
+        elections.vote_share_by_level(results, store, cycle, category)
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--rows", type=int, nargs="+", default=[1_000_000])
+    args = ap.parse_args(argv)
+
+    print(f"{'rows':>11} {'MB':>7} {'cold s':>7} {'rows/s':>11} {'warm ms':>8} "
+          f"{'districts':>9} {'RSS MB':>7}")
+    for rows in args.rows:
+        path = synthetic_results(rows)
+        root = path.parent.parent
+        shutil.rmtree(elections.cache_dir(root), ignore_errors=True)
+        t0 = time.perf_counter()
+        df = elections.district_results(path, root)
+        cold = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        elections.district_results(path, root)
+        warm = time.perf_counter() - t0
+        rss = rss_bytes() or 0
+        check(df, path.parent.name)
+        print(f"{rows:>11,} {path.stat().st_size / 2**20:>7.0f} {cold:>7.2f} "
+              f"{rows / cold:>11,.0f} {warm * 1e3:>8.1f} "
+              f"{df['district'].nunique():>9} {rss / 2**20:>7.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,387 @@
+"""Concurrent‑session load test of the Streamlit app over its websocket.
+
+Starts ``streamlit run app.py`` on a free localhost port (or targets a
+running server with ``--url``) and drives ``--sessions`` simulated browsers
+at once. Each is a websocket client speaking Streamlit's own protocol –
+``BackMsg``/``ForwardMsg`` protobufs on ``/_stcore/stream`` – and walks a
+scripted journey ``--rounds`` times:
+
+* open the app;
+* 에너지믹스 tab: pick a few ``sel_scn`` scenarios;
+* 온도경로 tab: drop one pathway from ``sel_paths``, then add it back;
+* 정책 tab: filter ``policy_scatter`` to a random subset of parties.
+
+Widget changes are sent like the browser sends them: all of the session's
+widget states, and the fragment id when the widget lives in a fragment.
+Each rerun is timed from the request to ``script_finished``; a script
+exception fails the run. The server's CPU use (user + system time over
+wall time) and peak resident set size are read from ``/proc`` during each
+load level, after one warm‑up journey has built the shared caches::
+
+    python -m benchmarks.loadtest --sessions 1 10 50 --rounds 3
+    python -m benchmarks.loadtest --sessions 50 --save load.json
+    python -m benchmarks.loadtest --sessions 50 --compare load.json --max-p95 2000
+
+Everything runs on localhost, so it can gate a release offline:
+``--compare`` exits non‑zero when a step's p95 exceeds the baseline by
+more than ``--budget``, ``--max-p95`` / ``--max-rss`` when the whole
+level's p95 (ms) or the server's peak RSS (MB) exceed a fixed limit.
+The client uses the ``websockets`` package, which current Streamlit
+installs; ``pip install websockets`` on older versions.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+from benchmarks.pipeline import _meta
+from dashboard.profiling import cpu_seconds, rss_bytes
+
+APP = Path(__file__).resolve().parent.parent / "app.py"
+
+# What the journey clicks, by the labels app.py shows
+ENERGY_TAB = "⚡ 전력 에너지믹스 (기준 비교)"
+TEMPERATURE_TAB = "🌡 온도경로"
+POLICY_TAB = "📊 정책-대선"
+SCENARIO_LABEL = "정당/시나리오 선택"       # sel_scn
+PATHS_LABEL = "정당 경로 선택"              # sel_paths
+PARTIES_LABEL = "비교할 정당"               # policy_scatter filter
+
+STEPS = ["open", "tab", "sel_scn", "sel_paths", "parties"]
+FINISHED = {ForwardMsg.FINISHED_SUCCESSFULLY, ForwardMsg.FINISHED_FRAGMENT_RUN_SUCCESSFULLY}
+
+
+@dataclass
+class Widget:
+    id: str
+    kind: str                 # element type: "selectbox", "multiselect", …
+    proto: object             # the element's protobuf message
+    fragment_id: str
+
+    @property
+    def options(self) -> list[str]:
+        return list(self.proto.options)
+
+    @property
+    def default(self) -> list[str]:
+        default = self.proto.default
+        return [self.options[i] for i in (default if self.kind == "multiselect" else [default])]
+
+
+class Session:
+    """One simulated browser tab: its widget states and what it last saw."""
+
+    def __init__(self, ws):
+        self.ws = ws
+        self.widgets: dict[str, Widget] = {}         # label → widget
+        self.states: dict[str, WidgetState] = {}     # widget id → state sent with every rerun
+        self.tabs_id = ""
+        self.timings: list[tuple[str, float]] = []
+
+    async def rerun(self, step: str, fragment_id: str = "") -> None:
+        msg = BackMsg()
+        msg.rerun_script.query_string = ""
+        msg.rerun_script.widget_states.widgets.extend(self.states.values())
+        if fragment_id:
+            msg.rerun_script.fragment_id = fragment_id
+        t0 = time.perf_counter()
+        await self.ws.send(msg.SerializeToString())
+        while True:
+            fwd = ForwardMsg()
+            fwd.ParseFromString(await self.ws.recv())
+            kind = fwd.WhichOneof("type")
+            if kind == "delta":
+                self._collect(fwd.delta)
+            elif kind == "script_finished":
+                if fwd.script_finished not in FINISHED:
+                    raise RuntimeError(f"{step}: script finished with status {fwd.script_finished}")
+                self.timings.append((step, time.perf_counter() - t0))
+                return
+
+    def _collect(self, delta) -> None:
+        if delta.WhichOneof("type") == "add_block":
+            if delta.add_block.WhichOneof("type") == "tab_container":
+                self.tabs_id = delta.add_block.id
+            return
+        if delta.WhichOneof("type") != "new_element":
+            return
+        kind = delta.new_element.WhichOneof("type")
+        if kind == "exception":
+            exc = delta.new_element.exception
+            raise RuntimeError(f"app raised {exc.type}: {exc.message}\n"
+                               + "\n".join(exc.stack_trace))
+        proto = getattr(delta.new_element, kind)
+        if getattr(proto, "id", "") and getattr(proto, "label", ""):
+            self.widgets[proto.label] = Widget(proto.id, kind, proto, delta.fragment_id)
+
+    def widget(self, label: str) -> Widget:
+        try:
+            return self.widgets[label]
+        except KeyError:
+            raise LookupError(f"widget {label!r} not on the page – did app.py relabel it?") from None
+
+    async def open_tab(self, label: str) -> None:
+        self.states[self.tabs_id] = WidgetState(id=self.tabs_id, string_value=label)
+        await self.rerun("tab")
+
+    async def change(self, step: str, label: str, value) -> None:
+        """Set a selectbox (one value) or multiselect (list) and rerun like the browser."""
+        w = self.widget(label)
+        state = WidgetState(id=w.id)
+        fields = w.proto.DESCRIPTOR.fields_by_name
+        by_value = "raw_value" in fields or "raw_values" in fields   # else sent by index
+        if w.kind == "multiselect":
+            if by_value:
+                state.string_array_value.data.extend(value)
+            else:
+                state.int_array_value.data.extend(w.options.index(v) for v in value)
+        elif by_value:
+            state.string_value = value
+        else:
+            state.int_value = w.options.index(value)
+        self.states[w.id] = state
+        await self.rerun(step, w.fragment_id)
+
+
+async def journey(s: Session, rng: np.random.Generator, think: float) -> None:
+    async def pause():
+        if think:
+            await asyncio.sleep(rng.exponential(think))
+
+    s.states.clear()
+    await s.rerun("open")
+    await pause()
+    await s.open_tab(ENERGY_TAB)
+    scenarios = s.widget(SCENARIO_LABEL).options
+    for scn in rng.permutation(scenarios)[:3]:
+        await pause()
+        await s.change("sel_scn", SCENARIO_LABEL, str(scn))
+    await pause()
+    await s.open_tab(TEMPERATURE_TAB)
+    paths = s.widget(PATHS_LABEL).default
+    if paths:
+        drop = paths[rng.integers(len(paths))]
+        await pause()
+        await s.change("sel_paths", PATHS_LABEL, [p for p in paths if p != drop])
+        await pause()
+        await s.change("sel_paths", PATHS_LABEL, paths)
+    await pause()
+    await s.open_tab(POLICY_TAB)
+    parties = s.widget(PARTIES_LABEL).options
+    if parties:
+        subset = rng.permutation(parties)[:max(1, len(parties) // 2)]
+        await pause()
+        await s.change("parties", PARTIES_LABEL, [p for p in parties if p in set(subset)])
+
+
+def connect(url: str):
+    """Websocket to the app's stream endpoint, as the browser opens it."""
+    import websockets
+    return websockets.connect(f"{url.replace('http', 'ws', 1)}/_stcore/stream",
+                              subprotocols=["streamlit"], max_size=None)
+
+
+async def run_session(url: str, rounds: int, think: float, seed: int,
+                      start_delay: float) -> list[tuple[str, float]]:
+    await asyncio.sleep(start_delay)
+    rng = np.random.default_rng(seed)
+    async with connect(url) as ws:
+        s = Session(ws)
+        for _ in range(rounds):
+            await journey(s, rng, think)
+    return s.timings
+
+
+async def _sample_rss(pid: int | None, peak: list[int]) -> None:
+    while pid is not None:
+        peak[0] = max(peak[0], rss_bytes(pid) or 0)
+        await asyncio.sleep(0.2)
+
+
+async def load_level(url: str, pid: int | None, sessions: int, rounds: int,
+                     think: float, ramp: float, seed: int) -> dict:
+    """Run ``sessions`` concurrent journeys; latencies per step, server CPU and RSS."""
+    peak = [rss_bytes(pid) or 0 if pid else 0]
+    sampler = asyncio.create_task(_sample_rss(pid, peak))
+    cpu0, t0 = cpu_seconds(pid) if pid else None, time.perf_counter()
+    try:
+        per_session = await asyncio.gather(*(
+            run_session(url, rounds, think, seed + i, ramp * i / sessions)
+            for i in range(sessions)))
+    finally:
+        sampler.cancel()
+    wall = time.perf_counter() - t0
+    cpu1 = cpu_seconds(pid) if pid else None
+
+    by_step = defaultdict(list)
+    for timings in per_session:
+        for step, seconds in timings:
+            by_step[step].append(seconds * 1e3)
+            by_step["all"].append(seconds * 1e3)
+    return {"wall_s": wall,
+            "reruns_per_s": len(by_step["all"]) / wall,
+            "cpu_pct": (cpu1 - cpu0) / wall * 100 if cpu0 is not None and cpu1 is not None else None,
+            "rss_mb": peak[0] / 2**20 if pid else None,
+            "steps": {step: ms for step, ms in by_step.items()}}
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def local_server(timeout: float = 60) -> Iterator[tuple[str, subprocess.Popen]]:
+    """``streamlit run app.py`` on a free localhost port, stopped on exit."""
+    port = _free_port()
+    log = tempfile.TemporaryFile()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", str(APP), "--server.headless=true",
+         "--server.address=127.0.0.1", f"--server.port={port}",
+         "--server.fileWatcherType=none", "--browser.gatherUsageStats=false"],
+        stdout=log, stderr=subprocess.STDOUT, cwd=APP.parent)
+    url = f"http://127.0.0.1:{port}"
+    try:
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                with urllib.request.urlopen(f"{url}/_stcore/health", timeout=1) as resp:
+                    if resp.status == 200:
+                        break
+            except OSError:
+                pass
+            if proc.poll() is not None or time.monotonic() > deadline:
+                log.seek(0)
+                raise RuntimeError("streamlit did not start:\n"
+                                   + log.read().decode("utf-8", "replace")[-2000:])
+            time.sleep(0.2)
+        yield url, proc
+    finally:
+        proc.terminate()
+        try:
+            proc.wait(10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+        log.close()
+
+
+def percentiles(ms: list[float]) -> dict:
+    p50, p95, p99 = np.percentile(ms, [50, 95, 99])
+    return {"count": len(ms), "p50_ms": round(p50, 1), "p95_ms": round(p95, 1),
+            "p99_ms": round(p99, 1)}
+
+
+def bench(url: str, pid: int | None, levels: list[int], rounds: int, think: float,
+          ramp: float, seed: int) -> dict:
+    warm = asyncio.run(load_level(url, pid, 1, 1, 0, 0, seed))
+    results = []
+    for n in levels:
+        r = asyncio.run(load_level(url, pid, n, rounds, think, ramp, seed))
+        for step in [*STEPS, "all"]:
+            if step in r["steps"]:
+                results.append({"sessions": n, "step": step, **percentiles(r["steps"][step])})
+        results[-1].update(reruns_per_s=round(r["reruns_per_s"], 1),
+                           cpu_pct=None if r["cpu_pct"] is None else round(r["cpu_pct"], 1),
+                           rss_mb=None if r["rss_mb"] is None else round(r["rss_mb"], 1))
+    meta = {**_meta(rounds), "think_s": think, "ramp_s": ramp,
+            "warmup_s": round(warm["wall_s"], 2)}
+    return {"meta": meta, "results": results}
+
+
+def print_results(report: dict) -> None:
+    m = report["meta"]
+    print(f"commit {m['commit']} · Python {m['python']} · {m['cpus']} CPUs · "
+          f"{m['repeat']} journeys/session · warm‑up {m['warmup_s']} s")
+    print(f"{'sessions':>8} {'step':<10} {'reruns':>7} {'p50 ms':>8} {'p95 ms':>8} "
+          f"{'p99 ms':>8} {'rerun/s':>8} {'CPU %':>6} {'RSS MB':>7}")
+    for r in report["results"]:
+        extra = ""
+        if r["step"] == "all":
+            extra = (f" {r['reruns_per_s']:>8.1f} {r['cpu_pct'] or float('nan'):>6.0f} "
+                     f"{r['rss_mb'] or float('nan'):>7.0f}")
+        print(f"{r['sessions']:>8} {r['step']:<10} {r['count']:>7} {r['p50_ms']:>8.0f} "
+              f"{r['p95_ms']:>8.0f} {r['p99_ms']:>8.0f}{extra}")
+
+
+def gate(report: dict, baseline: dict | None, budget: float, floor_ms: float,
+         max_p95: float | None, max_rss: float | None) -> int:
+    """Print any limit that was exceeded; 1 if one was."""
+    failed = 0
+    old = {(r["sessions"], r["step"]): r for r in (baseline or {}).get("results", [])}
+    if baseline:
+        print(f"\nvs {baseline['meta'].get('commit')} (budget {budget:.2f}×, floor {floor_ms} ms)")
+    for r in report["results"]:
+        b = old.get((r["sessions"], r["step"]))
+        if b is not None:
+            ratio = r["p95_ms"] / max(b["p95_ms"], 1e-9)
+            over = ratio > budget and r["p95_ms"] >= floor_ms
+            failed |= over
+            print(f"{r['sessions']:>8} {r['step']:<10} p95 {b['p95_ms']:>8.0f} → "
+                  f"{r['p95_ms']:>8.0f} ms  {ratio:>5.2f}×{'  OVER BUDGET' if over else ''}")
+        if r["step"] != "all":
+            continue
+        if max_p95 is not None and r["p95_ms"] > max_p95:
+            failed = 1
+            print(f"{r['sessions']} sessions: p95 {r['p95_ms']:.0f} ms > {max_p95:.0f} ms")
+        if max_rss is not None and r["rss_mb"] is not None and r["rss_mb"] > max_rss:
+            failed = 1
+            print(f"{r['sessions']} sessions: server RSS {r['rss_mb']:.0f} MB > {max_rss:.0f} MB")
+    return int(failed)
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--sessions", type=int, nargs="+", default=[1, 10, 50])
+    ap.add_argument("--rounds", type=int, default=2, help="journeys per session")
+    ap.add_argument("--think", type=float, default=0.2,
+                    help="mean pause between a session's actions (s, exponential)")
+    ap.add_argument("--ramp", type=float, default=2.0,
+                    help="sessions start spread over this many seconds")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--url", help="drive this running server instead of starting one "
+                                  "(no CPU/RSS unless --pid is given)")
+    ap.add_argument("--pid", type=int, help="server process for CPU/RSS with --url")
+    ap.add_argument("--save", type=Path, help="write results as JSON")
+    ap.add_argument("--compare", type=Path, help="baseline JSON from --save")
+    ap.add_argument("--budget", type=float, default=1.25,
+                    help="max allowed p95 ratio vs the baseline")
+    ap.add_argument("--floor", type=float, default=50.0,
+                    help="ignore steps whose p95 is under this many ms")
+    ap.add_argument("--max-p95", type=float, help="fail if any level's p95 exceeds this (ms)")
+    ap.add_argument("--max-rss", type=float, help="fail if server RSS exceeds this (MB)")
+    args = ap.parse_args(argv)
+
+    params = (args.sessions, args.rounds, args.think, args.ramp, args.seed)
+    if args.url:
+        report = bench(args.url.rstrip("/"), args.pid, *params)
+    else:
+        with local_server() as (url, proc):
+            report = bench(url, proc.pid, *params)
+    print_results(report)
+    if args.save:
+        args.save.write_text(json.dumps(report, indent=1), encoding="utf-8")
+    baseline = (json.loads(args.compare.read_text(encoding="utf-8"))
+                if args.compare else None)
+    return gate(report, baseline, args.budget, args.floor, args.max_p95, args.max_rss)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,45 @@
+"""What‑if throughput of the vectorized pathway engine.
+
+Evaluates N random emission‑factor draws × every 에너지믹스 scenario ×
+yearly grid in one ``pathway_array`` call::
+
+    python -m benchmarks.pathways --draws 1000 10000 100000
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+
+import numpy as np
+
+from dashboard import pathways, wrangle
+from dashboard.workbook import LazyWorkbook
+
+WORKBOOK = Path(__file__).resolve().parent.parent / "data" / "climate_data.xlsx"
+
+
+def main(argv: list[str] | None = None) -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--draws", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    args = ap.parse_args(argv)
+
+    wb = LazyWorkbook(WORKBOOK)
+    energy_df = wrangle.tidy_energy(wb[wb.find(["에너지믹스"])])
+    scenarios, sources, mix = pathways.mix_matrix(energy_df)
+    specs = [pathways.default_spec(s) for s in scenarios]
+    years = np.arange(2018, 2051)
+    f0 = pathways.factor_vector(sources)
+    rng = np.random.default_rng(0)
+
+    print(f"{'draws':>8} {'ms':>8} {'what-if scenarios/s':>20}")
+    for n in args.draws:
+        factors = f0 * rng.lognormal(0.0, 0.1, (n, len(sources)))
+        t0 = time.perf_counter()
+        pathways.pathway_array(mix, factors, specs, years)
+        dt = time.perf_counter() - t0
+        print(f"{n:>8} {dt * 1e3:>8.1f} {n * len(scenarios) / dt:>20,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Figure payload per tab: plain Plotly JSON vs ``dashboard.payload.compact``.
+
+For each ``benchmarks.synthetic`` scale, builds what a visitor sees on
+first opening each tab (``benchmarks.pipeline.default_view``) two ways –
+
+* ``plain`` – the figure as built, policy descriptions inlined in the hover
+  (what the app sent before);
+* ``compact`` – what the app sends now: descriptions left out, figure
+  passed through ``payload.compact``
+
+– and prints the bytes per tab, plus how much each grew relative to the
+first scale::
+
+    python -m benchmarks.payload --scale 1 10 100
+
+Every compact figure is decoded again and checked against the plain one
+(same traces, same labels, values equal to float32 precision) before its
+size is counted.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from collections import defaultdict
+
+import numpy as np
+import plotly.io as pio
+
+from benchmarks.pipeline import default_view
+from benchmarks.synthetic import synthetic_workbook
+from dashboard import export, payload
+from dashboard.workbook import LazyWorkbook
+
+
+def _values(spec: dict, trace: dict, letter: str, n: int):
+    """Coordinates of ``trace`` along ``letter`` as Plotly.js would compute them."""
+    if letter in trace:
+        values = payload.as_array(trace[letter])
+        return list(trace[letter]) if values is None else values
+    start, step = trace.get(f"{letter}0", 0), trace.get(f"d{letter}", 1)
+    if isinstance(start, str):
+        axis = spec["layout"][f"{letter}axis{(trace.get(f'{letter}axis') or letter)[1:]}"]
+        cats = axis["categoryarray"]
+        first = cats.index(start)
+        return [cats[first + i * step] for i in range(n)]
+    return start + step * np.arange(n)
+
+
+def check(plain: dict, compact: dict) -> None:
+    """Assert ``compact`` draws the same data as ``plain``."""
+    assert len(plain["data"]) == len(compact["data"])
+    for a, b in zip(plain["data"], compact["data"]):
+        for letter in "xyz":
+            if letter not in a:
+                continue
+            va = _values(plain, a, letter, 0)
+            vb = _values(compact, b, letter, len(va))
+            if len(va) and isinstance(va[0], str):
+                assert list(va) == list(vb), letter
+            else:
+                assert np.allclose(np.asarray(va, float), np.asarray(vb, float),
+                                   rtol=1e-6, equal_nan=True), letter
+
+
+def tab_bytes(scale: int) -> dict[str, tuple[int, int]]:
+    """tab → (plain bytes, compact bytes) of its default view."""
+    data = export.tidy_datasets(LazyWorkbook(synthetic_workbook(scale)))
+    sizes: dict[str, list[int]] = defaultdict(lambda: [0, 0])
+    for tab, chart, sel in default_view(data):
+        fig = export.build(data, tab, chart, sel)
+        small = payload.compact(export.build(data, tab, chart, sel, descriptions=False))
+        plain_json = pio.to_json(fig, validate=False)
+        compact_json = pio.to_json(small, validate=False)
+        check(json.loads(plain_json), json.loads(compact_json))
+        sizes[tab][0] += len(plain_json.encode("utf-8"))
+        sizes[tab][1] += len(compact_json.encode("utf-8"))
+    return {tab: tuple(v) for tab, v in sizes.items()}
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--scale", type=int, nargs="+", default=[1, 10, 100])
+    args = ap.parse_args(argv)
+
+    first: dict[str, tuple[int, int]] = {}
+    print(f"{'scale':>5} {'tab':<24} {'plain KB':>9} {'compact KB':>11} {'ratio':>6} "
+          f"{'growth plain':>13} {'compact':>8}")
+    for scale in args.scale:
+        for tab, (plain, small) in tab_bytes(scale).items():
+            p0, c0 = first.setdefault(tab, (plain, small))
+            print(f"{scale:>5} {tab:<24} {plain / 1024:>9.1f} {small / 1024:>11.1f} "
+                  f"{plain / small:>5.1f}× {plain / p0:>12.1f}× {small / c0:>7.1f}×")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,162 @@
+"""Per‑stage timing of the dashboard pipeline on synthetic workbooks.
+
+Runs what a first visitor's rerun does – load every sheet, wrangle the tidy
+frames, build the default figure of every tab, serialize them to JSON –
+on the ``benchmarks.synthetic`` workbooks, timing each stage with
+``dashboard.profiling.Profiler`` (the same stages as the in‑app panel)::
+
+    python -m benchmarks.pipeline --scale 1 10 100 --save bench.json
+    python -m benchmarks.pipeline --compare bench.json --budget 1.25
+
+Load is measured twice: ``load_excel`` from a cold start (no snapshot, so
+it includes writing one) and ``load_snapshot`` from the warm snapshot.
+Results carry the git commit and machine so runs can be compared across
+commits; ``--compare`` exits non‑zero when a stage's median exceeds the
+baseline by more than ``--budget`` (stages under ``--floor`` ms are
+ignored as noise).
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+from benchmarks.synthetic import synthetic_workbook
+from dashboard import export, snapshot
+from dashboard.constants import BASE_SCN, TARGET_SCN
+from dashboard.profiling import Profiler, rss_bytes
+from dashboard.workbook import LazyWorkbook
+
+STAGE_ORDER = ["load_excel", "load_snapshot", "wrangle", "figure", "serialize"]
+
+
+def default_view(data: dict) -> list[tuple[str, str, tuple[str, ...]]]:
+    """Export jobs for what the app shows before any widget is touched."""
+    jobs, seen, first_candidate = [], set(), None
+    for tab, chart, sel in export.jobs(data):
+        if chart == "stacked_mix":
+            if sel[0] not in (BASE_SCN, TARGET_SCN):
+                if first_candidate is not None:
+                    continue
+                first_candidate = sel[0]
+            jobs.append((tab, chart, sel))
+        elif tab not in seen:       # the full selection comes first
+            seen.add(tab)
+            jobs.append((tab, chart, sel))
+    return jobs
+
+
+def run_once(path: Path) -> tuple[Profiler, int]:
+    """One cold + warm pass; returns the stage timings and payload bytes."""
+    prof = Profiler()
+    shutil.rmtree(snapshot.snapshot_dir(path), ignore_errors=True)
+    with prof.stage("load_excel"):
+        wb = LazyWorkbook(path)
+        for name in wb:
+            wb[name]
+    with prof.stage("load_snapshot"):
+        wb = LazyWorkbook(path)
+        for name in wb:
+            wb[name]
+    with prof.stage("wrangle"):
+        data = export.tidy_datasets(wb)
+    with prof.stage("figure"):
+        figs = [export.build(data, *job) for job in default_view(data)]
+    with prof.stage("serialize"):
+        payload = sum(len(fig.to_json()) for fig in figs)
+    return prof, payload
+
+
+def bench(scales: list[int], repeat: int) -> dict:
+    results = []
+    run_once(synthetic_workbook(scales[0]))   # warm‑up: imports, plotly templates
+    for scale in scales:
+        path = synthetic_workbook(scale)
+        runs = [run_once(path) for _ in range(repeat)]
+        for stage in STAGE_ORDER:
+            ms = [p.stages[stage].seconds * 1e3 for p, _ in runs]
+            results.append({
+                "scale": scale, "stage": stage,
+                "median_ms": round(statistics.median(ms), 2),
+                "min_ms": round(min(ms), 2),
+                "rss_mb": round(statistics.median(
+                    p.stages[stage].rss_delta for p, _ in runs) / 2**20, 2),
+            })
+        results.append({"scale": scale, "stage": "payload_kb",
+                        "median_ms": None, "min_ms": None, "rss_mb": None,
+                        "value": round(runs[0][1] / 1024, 1)})
+    return {"meta": _meta(repeat), "results": results}
+
+
+def _meta(repeat: int) -> dict:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"],
+                                capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    rss = rss_bytes()
+    return {"commit": commit, "python": platform.python_version(),
+            "platform": platform.platform(), "cpus": os.cpu_count(),
+            "repeat": repeat, "peak_rss_mb": round(rss / 2**20, 1) if rss else None}
+
+
+def print_results(report: dict) -> None:
+    m = report["meta"]
+    print(f"commit {m['commit']} · Python {m['python']} · {m['cpus']} CPUs · "
+          f"median of {m['repeat']}")
+    print(f"{'scale':>6} {'stage':<14} {'median ms':>10} {'min ms':>9} {'ΔRSS MB':>8}")
+    for r in report["results"]:
+        if r["stage"] == "payload_kb":
+            print(f"{r['scale']:>6} {'payload':<14} {r['value']:>10.1f} KB")
+        else:
+            print(f"{r['scale']:>6} {r['stage']:<14} {r['median_ms']:>10.1f} "
+                  f"{r['min_ms']:>9.1f} {r['rss_mb']:>8.2f}")
+
+
+def compare(report: dict, baseline: dict, budget: float, floor_ms: float) -> int:
+    """Print new/old ratios per (scale, stage); 1 if any is over budget."""
+    old = {(r["scale"], r["stage"]): r for r in baseline["results"]}
+    print(f"\nvs {baseline['meta'].get('commit')} (budget {budget:.2f}×, floor {floor_ms} ms)")
+    failed = 0
+    for r in report["results"]:
+        b = old.get((r["scale"], r["stage"]))
+        if b is None or r["stage"] == "payload_kb":
+            continue
+        ratio = r["median_ms"] / max(b["median_ms"], 1e-9)
+        over = ratio > budget and r["median_ms"] >= floor_ms
+        failed |= over
+        print(f"{r['scale']:>6} {r['stage']:<14} {b['median_ms']:>10.1f} → "
+              f"{r['median_ms']:>10.1f} ms  {ratio:>5.2f}×{'  OVER BUDGET' if over else ''}")
+    return int(failed)
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--scale", type=int, nargs="+", default=[1, 10, 100])
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--save", type=Path, help="write results as JSON")
+    ap.add_argument("--compare", type=Path, help="baseline JSON from --save")
+    ap.add_argument("--budget", type=float, default=1.25,
+                    help="max allowed median ratio vs the baseline")
+    ap.add_argument("--floor", type=float, default=5.0,
+                    help="ignore stages faster than this many ms")
+    args = ap.parse_args(argv)
+
+    report = bench(args.scale, args.repeat)
+    print_results(report)
+    if args.save:
+        args.save.write_text(json.dumps(report, indent=1), encoding="utf-8")
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        return compare(report, baseline, args.budget, args.floor)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+"""Policy scatter wrangling: row‑wise baseline vs the vectorized code path.
+
+Builds a synthetic candidate × category × cycle policy matrix and times
+jitter/symbol assignment and nested‑form normalisation at growing sizes::
+
+    python -m benchmarks.policy            # 1k … 100k rows
+    python -m benchmarks.policy --rows 100000
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from dashboard import wrangle
+from dashboard.charts import jitter_levels
+
+
+def synthetic_policy(n_rows: int, n_parties: int = 40, seed: int = 0) -> pd.DataFrame:
+    """Long‑form policy rows with ~5 % missing levels (the 'x' symbol case)."""
+    rng = np.random.default_rng(seed)
+    n_cats = max(1, n_rows // n_parties)
+    level = rng.integers(1, 4, n_rows).astype(float)
+    level[rng.random(n_rows) < 0.05] = np.nan
+    return pd.DataFrame({
+        "category": [f"cat{i:04d}" for i in np.arange(n_rows) % n_cats],
+        "party": [f"party{i:03d}" for i in rng.integers(0, n_parties, n_rows)],
+        "level": level,
+        "description": "제시된 공약 없음",
+    })
+
+
+def nested_form(long_df: pd.DataFrame) -> pd.DataFrame:
+    """The same rows as one {party: {level, description}} dict per category."""
+    return pd.DataFrame(
+        [{"category": cat,
+          "parties": {p: {"level": lv, "description": d}
+                      for p, lv, d in zip(g["party"], g["level"], g["description"])}}
+         for cat, g in long_df.groupby("category", sort=False)]
+    )
+
+
+# -- row‑wise reference (the previous implementation) -----------------
+def rowwise_jitter(policy_df: pd.DataFrame) -> pd.DataFrame:
+    parties_local = list(policy_df["party"].unique())
+    offsets = np.linspace(-0.15, 0.15, len(parties_local))
+    offset_map = dict(zip(parties_local, offsets))
+    policy_df = policy_df.assign(level_offset=policy_df.apply(
+        lambda r: r["level"] + offset_map[r["party"]], axis=1))
+    policy_df["symbol"] = policy_df["level"].apply(
+        lambda v: 'x' if pd.isna(v) else 'circle')
+    return policy_df
+
+
+def rowwise_normalize(df_raw: pd.DataFrame) -> pd.DataFrame:
+    records = []
+    for _, row in df_raw.iterrows():
+        for p, d in row["parties"].items():
+            records.append({"category": row["category"], "party": p,
+                            "level": d.get("level"), "description": d.get("description")})
+    return pd.DataFrame(records)
+
+
+def _best_of(fn, *args, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main(argv: list[str] | None = None) -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--rows", type=int, nargs="+",
+                    default=[1_000, 10_000, 100_000])
+    args = ap.parse_args(argv)
+
+    print(f"{'rows':>8} {'stage':<10} {'row-wise ms':>12} {'vector ms':>10} {'speed-up':>9}")
+    for n in args.rows:
+        long_df = synthetic_policy(n)
+        nested = nested_form(long_df)
+
+        # sanity: both paths must agree before we compare their speed
+        pd.testing.assert_frame_equal(rowwise_jitter(long_df), jitter_levels(long_df),
+                                      check_like=True)
+        pd.testing.assert_frame_equal(rowwise_normalize(nested),
+                                      wrangle.normalize_policy(nested), check_dtype=False)
+
+        for stage, slow, fast, arg in [
+            ("jitter", rowwise_jitter, jitter_levels, long_df),
+            ("normalize", rowwise_normalize, wrangle.normalize_policy, nested),
+        ]:
+            t_slow, t_fast = _best_of(slow, arg), _best_of(fast, arg)
+            print(f"{n:>8} {stage:<10} {t_slow * 1e3:>12.1f} {t_fast * 1e3:>10.1f} "
+                  f"{t_slow / t_fast:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""Per‑session memory of the tidy frames: ``cache_data`` copies vs ``SharedStore``.
+
+Simulates ``--sessions`` concurrent sessions, each in the middle of a rerun
+and holding the frames ``app.py`` wrangles from the workbook, two ways:
+
+* ``copies`` – the previous code path: ``st.cache_data`` functions whose
+  hits unpickle a fresh copy, over ``find_sheet``'s ``.copy()`` of the
+  sheet;
+* ``shared`` – ``dashboard.store.SharedStore`` views, the same read‑only
+  objects for every session.
+
+These two modes measure the frame copies alone – no Streamlit runtime,
+session state or websocket. Each runs in a fresh interpreter. After one
+warm‑up rerun (parsing and the first wrangle, paid once per process either
+way) the resident set size is read, the sessions' reruns are made and
+held, and RSS is read again; the difference divided by the session count
+is the per‑session cost.
+
+* ``app`` – the real session path: ``streamlit run app.py`` (on its own
+  workbook, whatever ``--rows``) with ``--sessions`` websocket clients of
+  ``benchmarks.loadtest``, each walking one journey and then staying
+  connected. The server's RSS is read after a warm‑up journey and again
+  with every session held, so this includes everything a session costs
+  the server (session state, widget state, message cache), and only
+  exists for the current, shared, code path::
+
+    python -m benchmarks.sessions --rows 10000 --sessions 200
+    python -m benchmarks.sessions --modes app --sessions 50
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmarks import loadtest
+from benchmarks.synthetic import synthetic_rows_workbook
+from dashboard import ensemble, wrangle
+from dashboard.profiling import rss_bytes
+from dashboard.store import SharedStore
+from dashboard.workbook import LazyWorkbook
+
+# view name → (sheet keywords as app.py finds them, wrangling step)
+VIEWS = {
+    "emissions": (["배출", "emission", "총배출"], wrangle.tidy_emissions),
+    "energy": (["에너지믹스"], wrangle.tidy_energy),
+    "descriptions": (["에너지설명", "energy_desc"], wrangle.tidy_descriptions),
+    "temperature": (["온도경로"], wrangle.tidy_temperature),
+    "temperature_bands": (ensemble.ENSEMBLE_KEYWORDS, ensemble.percentile_bands),
+}
+
+
+def _sheet(wb: LazyWorkbook, keywords: list[str], copy: bool) -> pd.DataFrame:
+    name = wb.find(keywords)
+    if name is None:
+        return pd.DataFrame()
+    return wb[name].copy() if copy else wb[name]
+
+
+def copies_rerun(wb: LazyWorkbook):
+    """One rerun's frames through per‑view ``st.cache_data`` functions."""
+    import streamlit as st
+    from streamlit.logger import set_log_level
+    set_log_level("error")      # "no runtime found" on every decorator
+
+    cached = {}
+    for view, (keywords, step) in VIEWS.items():
+        def build(version: str, keywords=keywords, step=step) -> pd.DataFrame:
+            return step(_sheet(wb, keywords, copy=True))
+        build.__qualname__ = f"copies_{view}"    # one cache per view
+        cached[view] = (st.cache_data(show_spinner=False)(build), wb.sheet_version(keywords))
+    return lambda: {view: fn(version) for view, (fn, version) in cached.items()}
+
+
+def shared_rerun(wb: LazyWorkbook):
+    """One rerun's frames as views of a process‑wide ``SharedStore``."""
+    store = SharedStore()
+    versions = {view: wb.sheet_version(kw) for view, (kw, _) in VIEWS.items()}
+    return lambda: {view: store.view(view, versions[view],
+                                     lambda kw=kw, step=step: step(_sheet(wb, kw, copy=False)))
+                    for view, (kw, step) in VIEWS.items()}
+
+
+MODES = {"copies": copies_rerun, "shared": shared_rerun}
+
+
+def measure(rows: int, mode: str, sessions: int) -> dict:
+    """Run in a child: RSS before/after ``sessions`` held reruns, rerun times."""
+    wb = LazyWorkbook(synthetic_rows_workbook(rows))
+    rerun = MODES[mode](wb)
+    first = rerun()
+    tidy_mb = sum(df.memory_usage(deep=True).sum() for df in first.values()) / 2**20
+    del first
+    base = rss_bytes() or 0
+    held, times = [], []
+    for _ in range(sessions):
+        t0 = time.perf_counter()
+        held.append(rerun())
+        times.append(time.perf_counter() - t0)
+    rss = rss_bytes() or 0
+    return {"tidy_mb": tidy_mb,
+            "per_session_mb": (rss - base) / sessions / 2**20,
+            "total_mb": (rss - base) / 2**20,
+            "rerun_ms": statistics.median(times) * 1e3}
+
+
+async def _held_sessions(url: str, pid: int, sessions: int, seed: int) -> dict:
+    """Server RSS before and with ``sessions`` connected after one journey each."""
+    base = rss_bytes(pid) or 0
+    release = asyncio.Event()
+    journeyed = [asyncio.Event() for _ in range(sessions)]
+
+    async def one(i: int) -> list[tuple[str, float]]:
+        async with loadtest.connect(url) as ws:
+            s = loadtest.Session(ws)
+            try:
+                await loadtest.journey(s, np.random.default_rng(seed + i), think=0)
+            finally:
+                journeyed[i].set()
+            await release.wait()
+        return s.timings
+
+    tasks = asyncio.gather(*(one(i) for i in range(sessions)))
+    await asyncio.gather(*(e.wait() for e in journeyed))
+    await asyncio.sleep(1.0)                  # let the last reruns' buffers settle
+    rss = rss_bytes(pid) or 0
+    release.set()
+    per_session = await tasks
+    times = [t for timings in per_session for _, t in timings]
+    return {"tidy_mb": None,
+            "per_session_mb": (rss - base) / sessions / 2**20,
+            "total_mb": (rss - base) / 2**20,
+            "rerun_ms": statistics.median(times) * 1e3}
+
+
+def measure_app(sessions: int, seed: int = 0) -> dict:
+    """The ``app`` mode: real sessions held against a local server."""
+    with loadtest.local_server() as (url, proc):
+        asyncio.run(loadtest.load_level(url, proc.pid, 1, 1, 0, 0, seed))   # warm‑up
+        return asyncio.run(_held_sessions(url, proc.pid, sessions, seed))
+
+
+def run_child(rows: int, mode: str, sessions: int) -> dict:
+    out = subprocess.run([sys.executable, "-m", "benchmarks.sessions", "--rows", str(rows),
+                          "--sessions", str(sessions), "--child", mode],
+                         capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--rows", type=int, default=10_000)
+    ap.add_argument("--sessions", type=int, default=200)
+    ap.add_argument("--modes", nargs="+", choices=[*MODES, "app"],
+                    default=[*MODES, "app"])
+    ap.add_argument("--child", choices=MODES, help=argparse.SUPPRESS)
+    args = ap.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(measure(args.rows, args.child, args.sessions)))
+        return 0
+
+    path = synthetic_rows_workbook(args.rows)
+    print(f"{path.name}, {args.sessions} sessions")
+    print(f"{'mode':<8} {'tidy MB':>8} {'MB/session':>11} {'total MB':>9} {'rerun ms':>9}")
+    for mode in args.modes:
+        r = (measure_app(args.sessions) if mode == "app"
+             else run_child(args.rows, mode, args.sessions))
+        tidy = "" if r["tidy_mb"] is None else f"{r['tidy_mb']:.1f}"
+        print(f"{mode:<8} {tidy:>8} {r['per_session_mb']:>11.2f} "
+              f"{r['total_mb']:>9.0f} {r['rerun_ms']:>9.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+"""Party similarity: nested pairwise loops vs the blocked matrix‑product path.
+
+Builds a synthetic ``PolicyStore`` of parties × categories × cycles (about
+10 % missing levels – the 'x' symbol case – and some parties absent from a
+whole cycle) and times each stage of ``dashboard.similarity``::
+
+    python -m benchmarks.similarity                    # 100 … 3000 parties
+    python -m benchmarks.similarity --parties 5000 --categories 300
+
+The nested‑loop reference (one NumPy comparison per pair, as a first
+implementation would write it) only runs up to ``--loop-max`` parties; at
+those sizes both distance matrices are checked to agree before timing.
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from dashboard import similarity
+from dashboard.policy import CYCLES, PolicyStore
+
+
+def synthetic_store(n_parties: int, n_categories: int, seed: int = 0) -> PolicyStore:
+    """Every party × category in every cycle, with gaps."""
+    rng = np.random.default_rng(seed)
+    frames = {}
+    for c in CYCLES:
+        party = np.repeat(np.arange(n_parties), n_categories)
+        category = np.tile(np.arange(n_categories), n_parties)
+        level = rng.integers(1, 4, len(party)).astype(float)
+        level[rng.random(len(party)) < 0.10] = np.nan
+        keep = rng.random(n_parties)[party] < 0.8          # ran in this cycle
+        frames[c.label] = pd.DataFrame({
+            "category": pd.Index([f"cat{i:04d}" for i in range(n_categories)])[category[keep]],
+            "party": pd.Index([f"party{i:05d}" for i in range(n_parties)])[party[keep]],
+            "level": level[keep],
+            "description": "",
+        })
+    return PolicyStore(frames)
+
+
+def loop_distance(levels: np.ndarray, min_overlap: int = similarity.MIN_OVERLAP) -> np.ndarray:
+    """The same RMS distance, one pair at a time."""
+    n = len(levels)
+    dist = np.full((n, n), np.nan)
+    for a in range(n):
+        for b in range(n):
+            shared = ~np.isnan(levels[a]) & ~np.isnan(levels[b])
+            if shared.sum() >= min_overlap:
+                diff = levels[a, shared] - levels[b, shared]
+                dist[a, b] = np.sqrt(np.mean(diff * diff))
+    return dist
+
+
+def _timed(fn, *args):
+    t0 = time.perf_counter()
+    out = fn(*args)
+    return out, time.perf_counter() - t0
+
+
+def main(argv: list[str] | None = None) -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--parties", type=int, nargs="+", default=[100, 1_000, 3_000])
+    ap.add_argument("--categories", type=int, default=200)
+    ap.add_argument("--loop-max", type=int, default=300)
+    args = ap.parse_args(argv)
+
+    print(f"{'parties':>8} {'features':>9} {'loop ms':>9} {'matrix ms':>10} "
+          f"{'distance ms':>12} {'linkage ms':>11} {'closest ms':>11} {'MB':>6}")
+    for n in args.parties:
+        store = synthetic_store(n, args.categories)
+        (_, features, levels), t_matrix = _timed(similarity.level_matrix, store)
+        (dist, overlap), t_dist = _timed(similarity.distance_matrix, levels)
+        z, t_link = _timed(similarity.average_linkage, dist)
+        sim = similarity.PartySimilarity(list(range(len(levels))), dist, overlap, z)
+        _, t_close = _timed(sim.closest, 10)
+        assert len(z) == len(levels) - 1 and z[-1, 3] == len(levels)
+
+        t_loop = ""
+        if n <= args.loop_max:
+            ref, t = _timed(loop_distance, levels)
+            # sanity: both paths must agree before we compare their speed
+            np.testing.assert_allclose(dist, ref, rtol=1e-5, atol=1e-6)
+            t_loop = f"{t * 1e3:.0f}"
+        print(f"{n:>8} {len(features):>9} {t_loop:>9} {t_matrix * 1e3:>10.0f} "
+              f"{t_dist * 1e3:>12.0f} {t_link * 1e3:>11.0f} {t_close * 1e3:>11.0f} "
+              f"{dist.nbytes * 2 / 2**20:>6.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+"""Synthetic workbooks with the real sheet schemas, scaled up.
+
+``make_workbook(path, scale)`` reads ``data/climate_data.xlsx`` and writes a
+workbook with the same sheets and columns, grown ``scale``×:
+
+* policy sheets – ``scale`` copies of every party (``국민의힘#2`` …) with
+  random levels, so rows and parties grow together;
+* 에너지믹스 – ``scale`` noisy copies of every candidate scenario (the
+  2018/2038 reference scenarios stay single);
+* 온도경로 – ``scale`` noisy copies of every party pathway and a ``scale``×
+  finer year grid;
+* every other sheet is copied as is.
+
+Generated files are cached per scale::
+
+    python -m benchmarks.synthetic --scale 1 10 100
+
+``synthetic_rows_workbook(rows)`` instead stretches every data sheet to
+``rows`` rows with the columns unchanged – the shape analysts grow the
+workbook in (more years, more policy rows), used by ``benchmarks.xlsx``.
+
+``synthetic_results(rows)`` writes a precinct result CSV in the NEC wide
+layout (one vote column per candidate) for ``dashboard.elections``.
+"""
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from dashboard.constants import BASE_SCN, TARGET_SCN
+from dashboard.workbook import LazyWorkbook
+
+ROOT = Path(__file__).resolve().parent.parent
+WORKBOOK = ROOT / "data" / "climate_data.xlsx"
+CACHE_DIR = Path(__file__).resolve().parent / ".cache"
+
+POLICY_PREFIX = "policy"
+
+
+def _copy_name(name: str, i: int) -> str:
+    return name if i == 0 else f"{name}#{i + 1}"
+
+
+def scale_policy(df: pd.DataFrame, scale: int, rng: np.random.Generator) -> pd.DataFrame:
+    if scale == 1 or df.empty:
+        return df
+    copies = [df.assign(party=df["party"].map(lambda p, i=i: _copy_name(p, i)),
+                        level=df["level"] if i == 0 else rng.integers(1, 4, len(df)))
+              for i in range(scale)]
+    return pd.concat(copies, ignore_index=True)
+
+
+def scale_energy(df: pd.DataFrame, scale: int, rng: np.random.Generator) -> pd.DataFrame:
+    if scale == 1 or df.empty:
+        return df
+    value = df.columns[2]
+    ref = df["시나리오"].isin([BASE_SCN, TARGET_SCN])
+    copies = [df[ref]]
+    for i in range(scale):
+        cand = df[~ref]
+        noise = 1.0 if i == 0 else rng.lognormal(0.0, 0.1, len(cand))
+        copies.append(cand.assign(**{"시나리오": cand["시나리오"].map(lambda s, i=i: _copy_name(s, i)),
+                                     value: cand[value] * noise}))
+    return pd.concat(copies, ignore_index=True)
+
+
+def scale_temperature(df: pd.DataFrame, scale: int, rng: np.random.Generator) -> pd.DataFrame:
+    if scale == 1 or df.empty:
+        return df
+    years = df["연도"].to_numpy(dtype=float)
+    grid = np.linspace(years[0], years[-1], len(years) * scale)
+    out = {"연도": grid}
+    for col in df.columns[1:]:
+        curve = np.interp(grid, years, df[col].to_numpy(dtype=float))
+        copies = 1 if "°C" in col or "ºC" in col else scale   # reference paths stay single
+        for i in range(copies):
+            out[_copy_name(col, i)] = curve * (1.0 if i == 0 else rng.lognormal(0.0, 0.05))
+    return pd.DataFrame(out)
+
+
+def make_workbook(path: Path, scale: int, source: Path = WORKBOOK, seed: int = 0) -> Path:
+    """Write the ``scale``× synthetic workbook to ``path``."""
+    rng = np.random.default_rng(seed)
+    wb = LazyWorkbook(source)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with pd.ExcelWriter(path, engine="openpyxl") as xw:
+        for name in wb:
+            df = wb[name]
+            if name.startswith(POLICY_PREFIX):
+                df = scale_policy(df, scale, rng)
+            elif "에너지믹스" in name:
+                df = scale_energy(df, scale, rng)
+            elif "온도경로" in name:
+                df = scale_temperature(df, scale, rng)
+            df.to_excel(xw, sheet_name=name, index=False)
+    return path
+
+
+def stretch(df: pd.DataFrame, rows: int, rng: np.random.Generator) -> pd.DataFrame:
+    """``df`` grown to ``rows`` rows, same columns: a finer year grid for
+    the pathways, noisy repeats of every other table."""
+    if df.empty or len(df) >= rows:
+        return df
+    if "연도" in df.columns:
+        years = df["연도"].to_numpy(dtype=float)
+        grid = np.linspace(years[0], years[-1], rows)
+        return pd.DataFrame({"연도": grid, **{c: np.interp(grid, years, df[c].to_numpy(dtype=float))
+                                             for c in df.columns[1:]}})
+    out = df.iloc[np.arange(rows) % len(df)].reset_index(drop=True)
+    for c in out.select_dtypes("number").columns:
+        if c == "level":
+            out[c] = rng.integers(1, 4, rows)
+        else:
+            out[c] = out[c] * rng.lognormal(0.0, 0.1, rows)
+    return out
+
+
+def make_rows_workbook(path: Path, rows: int, source: Path = WORKBOOK, seed: int = 0) -> Path:
+    """Write a workbook whose data sheets have ``rows`` rows each."""
+    rng = np.random.default_rng(seed)
+    wb = LazyWorkbook(source)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with pd.ExcelWriter(path, engine="openpyxl") as xw:
+        for name in wb:
+            df = wb[name]
+            if name.startswith(POLICY_PREFIX) or "에너지믹스" in name or "온도경로" in name:
+                df = stretch(df, rows, rng)
+            df.to_excel(xw, sheet_name=name, index=False)
+    return path
+
+
+def synthetic_rows_workbook(rows: int) -> Path:
+    """Cached path of the ``rows``‑row workbook, generated on first use."""
+    path = CACHE_DIR / f"climate_data_r{rows}.xlsx"
+    if not path.exists() or path.stat().st_mtime < WORKBOOK.stat().st_mtime:
+        make_rows_workbook(path, rows)
+    return path
+
+
+def synthetic_workbook(scale: int) -> Path:
+    """Cached path of the ``scale``× workbook, generated on first use."""
+    path = CACHE_DIR / f"climate_data_x{scale}.xlsx"
+    if not path.exists() or path.stat().st_mtime < WORKBOOK.stat().st_mtime:
+        make_workbook(path, scale)
+    return path
+
+
+RESULT_CANDIDATES = ["더불어민주당 이재명", "국민의힘 김문수", "개혁신당 이준석",
+                     "민주노동당 권영국", "무소속 송진호"]
+
+
+def make_results(path: Path, rows: int, seed: int = 0, chunk: int = 500_000) -> Path:
+    """Write ``rows`` precinct rows (plus one 합계 row per district) in chunks."""
+    rng = np.random.default_rng(seed)
+    regions = [f"시도{i:02d}" for i in range(17)]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    header = True
+    for start in range(0, rows, chunk):
+        n = min(chunk, rows - start)
+        idx = np.arange(start, start + n)
+        district = idx // 5_000                      # ~5k precincts per district
+        df = pd.DataFrame({
+            "시도명": np.array(regions)[district % len(regions)],
+            "구시군명": [f"선거구{d:04d}" for d in district],
+            "투표구명": [f"투표구{i}" for i in idx],
+            "선거인수": rng.integers(1_000, 3_000, n),
+        })
+        for cand in RESULT_CANDIDATES:
+            df[cand] = rng.integers(0, 800, n)
+        last = np.flatnonzero(np.diff(district, append=district[-1] + 1))
+        total = df.iloc[last].assign(투표구명="합계")   # subtotal rows must be ignored
+        df = pd.concat([df, total]).sort_index(kind="stable")
+        df.to_csv(path, mode="w" if header else "a", header=header, index=False)
+        header = False
+    return path
+
+
+def synthetic_results(rows: int) -> Path:
+    """Cached path of a ``rows``‑row result CSV, generated on first use."""
+    path = CACHE_DIR / "elections" / "2025 대선" / f"results_{rows}.csv"
+    if not path.exists():
+        make_results(path, rows)
+    return path
+
+
+def main(argv: list[str] | None = None) -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--scale", type=int, nargs="+", default=[1, 10, 100])
+    args = ap.parse_args(argv)
+    for k in args.scale:
+        path = synthetic_workbook(k)
+        wb = LazyWorkbook(path)
+        rows = {n: len(wb[n]) for n in wb}
+        print(f"x{k:<4} {path}  " + "  ".join(f"{n}={r}" for n, r in rows.items()))
+
+
+if __name__ == "__main__":
+    main()
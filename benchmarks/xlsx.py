@@ -0,0 +1,154 @@
+"""``xlsx.SheetReader`` against the old ``load_sheets`` path.
+
+Reads the ``benchmarks.synthetic`` workbook whose data sheets have
+``--rows`` rows each, three ways:
+
+* ``load_sheets`` – ``pd.ExcelFile`` → ``pd.read_excel`` for every sheet
+  (``snapshot.read_excel_sheets``, what the app did before the snapshot);
+* ``reader_all`` – ``xlsx.read_sheets`` for every sheet;
+* ``reader_used`` – only the sheets the dashboard reads.
+
+Wall time is the median of ``--repeat`` runs. Peak memory is the peak RSS
+of a fresh interpreter running the case once, minus that of one that only
+imports, so allocations outside Python – Arrow‑backed strings, openpyxl's
+XML buffers – count too. The reader's frames are checked against
+``pd.read_excel``'s before anything is timed, on that workbook and on a
+small one of the cell types it lacks (booleans with blanks or numbers,
+error cells, ISO‑date cells – which the reader leaves to ``read_excel``).
+The reader's gain is wall time; its peak memory is not always lower – on
+small workbooks its chunk buffers outweigh what openpyxl holds::
+
+    python -m benchmarks.xlsx --rows 100000
+"""
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from benchmarks.synthetic import synthetic_rows_workbook
+from dashboard import snapshot, xlsx
+from dashboard.workbook import LazyWorkbook
+
+# Sheets app.py reads (by keyword, as the app finds them)
+USED = ["policy", "에너지믹스", "온도경로", "에너지설명"]
+
+
+def used_sheets(names: list[str]) -> list[str]:
+    return [n for n in names if any(k in n for k in USED)]
+
+
+def cases(path: Path) -> dict:
+    with xlsx.SheetReader(path) as reader:
+        used = used_sheets(reader.sheet_names)
+    return {
+        "load_sheets": lambda: snapshot.read_excel_sheets(path),
+        "reader_all": lambda: xlsx.read_sheets(path),
+        "reader_used": lambda: xlsx.read_sheets(path, used),
+    }
+
+
+def check_cell_types() -> None:
+    """
+    Cells the synthetic workbook has none of: each sheet must read as
+    ``pd.read_excel`` reads it, through ``LazyWorkbook``'s fallback where
+    the reader refuses the markup.
+    """
+    columns = {
+        "bool": [True, False, True],
+        "bool_blank": [True, None, False],
+        "bool_number": [True, 2.5, None],
+        "bool_int": [True, 2, 3],
+        "bool_text": [True, "x", None],
+        "error": ["#DIV/0!", 3, "#N/A"],
+        "error_bool": [True, "#REF!", False],
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        plain, dates = Path(tmp) / "cells.xlsx", Path(tmp) / "dates.xlsx"
+        # openpyxl writes bools as t="b" and error codes as t="e"
+        pd.DataFrame(columns).to_excel(plain, sheet_name="cells", index=False)
+        with pd.ExcelWriter(dates, engine="openpyxl") as xw:
+            xw.book.iso_dates = True                      # t="d" cells
+            pd.DataFrame({"when": [dt.datetime(2024, 1, 5), None, dt.datetime(2024, 2, 1, 12)],
+                          "day": [dt.date(2024, 1, 5), dt.date(2024, 1, 6), None]}
+                         ).to_excel(xw, sheet_name="dates", index=False)
+
+        pd.testing.assert_frame_equal(xlsx.read_sheets(plain)["cells"],
+                                      pd.read_excel(plain, sheet_name="cells"))
+        try:
+            xlsx.read_sheets(dates)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("t=\"d\" cells must be left to pd.read_excel")
+        pd.testing.assert_frame_equal(LazyWorkbook(dates)["dates"],
+                                      pd.read_excel(dates, sheet_name="dates"))
+
+
+def _own_peak_mb() -> float:
+    # ru_maxrss survives fork+exec on Linux (the child starts at the
+    # parent's peak); VmHWM belongs to this process image only
+    try:
+        with open("/proc/self/status") as fh:
+            return next(int(line.split()[1]) for line in fh if line.startswith("VmHWM")) / 1024
+    except (OSError, StopIteration):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def peak_rss_mb(rows: int, case: str) -> float:
+    """Peak RSS (MB) of a fresh interpreter running ``case`` once."""
+    out = subprocess.run([sys.executable, "-m", "benchmarks.xlsx", "--rows", str(rows),
+                          "--peak", case], capture_output=True, text=True, check=True)
+    return float(out.stdout.strip())
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--rows", type=int, default=100_000)
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--peak", help=argparse.SUPPRESS)   # child run of peak_rss_mb
+    args = ap.parse_args(argv)
+
+    path = synthetic_rows_workbook(args.rows)
+    runs = cases(path)
+    if args.peak:
+        if args.peak in runs:
+            runs[args.peak]()
+        print(_own_peak_mb())
+        return 0
+
+    expected = runs["load_sheets"]()
+    for name, df in runs["reader_all"]().items():
+        pd.testing.assert_frame_equal(df, expected[name])
+    print(f"{path.name}: {path.stat().st_size / 2**20:.1f} MB, {len(expected)} sheets "
+          f"({len(used_sheets(list(expected)))} used); frames identical to pd.read_excel")
+    del expected
+    check_cell_types()
+    print("boolean, error and ISO-date cells read as pd.read_excel reads them")
+
+    base_rss = peak_rss_mb(args.rows, "imports")
+    print(f"{'case':<12} {'median s':>9} {'min s':>7} {'peak MB':>8} {'speed‑up':>9}")
+    base = None
+    for case, fn in runs.items():
+        times = []
+        for _ in range(args.repeat):
+            t0 = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - t0)
+        peak = peak_rss_mb(args.rows, case) - base_rss
+        med = statistics.median(times)
+        base = base or med
+        print(f"{case:<12} {med:>9.2f} {min(times):>7.2f} {peak:>8.1f} {base / med:>8.1f}×")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
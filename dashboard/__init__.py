@@ -0,0 +1,5 @@
+"""Streamlit‑free helpers behind ``app.py`` (data loading, wrangling, charts).
+
+Everything in this package can be imported from plain Python — build
+scripts, benchmarks and CLIs — without starting a Streamlit session.
+"""
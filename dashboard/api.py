@@ -0,0 +1,378 @@
+"""Read‑only JSON API over the tidy datasets, for partner embeds.
+
+Serves the same wrangled frames the dashboard draws – the energy mix
+(``energy_df``), the emission pathways (``temp_df``) and every cycle of
+the policy store – from a small threaded HTTP server that runs next to
+``streamlit run app.py``, so an embed polling for data costs a dictionary
+lookup instead of a Streamlit session::
+
+    python -m dashboard.api --port 8600
+
+    GET /api                                   datasets, filters, versions
+    GET /api/energy?scenario=…&source=…        에너지원 × 시나리오
+    GET /api/temperature?path=…&year=…&from=2030&to=2050
+    GET /api/policy?cycle=…&party=…&category=…
+
+Filters take repeated or comma‑separated values. Each dataset has its own
+version – the hash of the sheets it is built from – and is re‑wrangled only
+when those change: a ``WorkbookWatcher`` listener rebuilds it on the
+watcher thread and swaps it in, so requests never wait on a parse.
+
+Responses are bytes prepared ahead of time: the unfiltered dataset and
+each value of its main filter when the dataset is built, any other filter
+combination on first request (LRU per version). Each is stored with its
+gzip – and brotli, when the ``brotli`` package is installed – encoding
+and a strong ``ETag`` derived from the body, so a poll with
+``If-None-Match`` gets ``304 Not Modified`` and no body.
+"""
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import json
+import logging
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+import pandas as pd
+
+from dashboard import wrangle
+from dashboard.policy import CYCLES, PolicyStore
+from dashboard.watcher import WorkbookWatcher
+from dashboard.workbook import LazyWorkbook
+
+try:  # brotli is optional; gzip alone is fine for most embeds
+    import brotli
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None
+
+log = logging.getLogger(__name__)
+
+EXCEL_PATH = Path(__file__).resolve().parent.parent / "data" / "climate_data.xlsx"
+
+# Seconds an embed or CDN may reuse a response before revalidating
+MAX_AGE = 60
+# Bodies smaller than this are not worth compressing
+MIN_COMPRESS = 512
+
+
+@dataclass(frozen=True)
+class Filter:
+    column: str
+    numeric: bool = False
+
+
+@dataclass(frozen=True)
+class Dataset:
+    """How one endpoint is built from the workbook and filtered."""
+    sheets: Callable[[LazyWorkbook], list[str]]     # sheet names it depends on
+    build: Callable[[LazyWorkbook], pd.DataFrame]   # tidy frame, API column names
+    filters: dict[str, Filter]
+    main: str                                      # filter precomputed per value
+    bounds: dict[str, str] = field(default_factory=dict)   # "from"/"to" → numeric column
+
+    @property
+    def params(self) -> list[str]:
+        return [*self.filters, *self.bounds]
+
+
+def _sheet(wb: LazyWorkbook, keywords: list[str]) -> pd.DataFrame:
+    name = wb.find(keywords)
+    return wb[name] if name is not None else pd.DataFrame()
+
+
+def _energy(wb: LazyWorkbook) -> pd.DataFrame:
+    energy_df = wrangle.tidy_energy(_sheet(wb, ["에너지믹스"]))
+    if energy_df.empty:
+        return pd.DataFrame(columns=["scenario", "source", "value"])
+    return energy_df.rename(columns={"시나리오": "scenario", "에너지원": "source",
+                                     wrangle.value_column(energy_df): "value"})
+
+
+def _temperature(wb: LazyWorkbook) -> pd.DataFrame:
+    temp_df = wrangle.tidy_temperature(_sheet(wb, ["온도경로"]))
+    if temp_df.empty:
+        return pd.DataFrame(columns=["path", "year", "emissions"])
+    return temp_df.rename(columns={"경로": "path", "연도": "year", "배출량": "emissions"})
+
+
+def _policy(wb: LazyWorkbook) -> pd.DataFrame:
+    return PolicyStore.from_sheets(wb).frame.reset_index()
+
+
+DATASETS = {
+    "energy": Dataset(
+        sheets=lambda wb: [n for n in [wb.find(["에너지믹스"])] if n],
+        build=_energy,
+        filters={"scenario": Filter("scenario"), "source": Filter("source")},
+        main="scenario"),
+    "temperature": Dataset(
+        sheets=lambda wb: [n for n in [wb.find(["온도경로"])] if n],
+        build=_temperature,
+        filters={"path": Filter("path"), "year": Filter("year", numeric=True)},
+        main="path",
+        bounds={"from": "year", "to": "year"}),
+    "policy": Dataset(
+        sheets=lambda wb: [c.sheet for c in CYCLES if c.sheet in set(wb)],
+        build=_policy,
+        filters={"cycle": Filter("cycle"), "party": Filter("party"),
+                 "category": Filter("category")},
+        main="party"),
+}
+
+
+@dataclass(frozen=True)
+class Response:
+    """A prepared body with its encodings and validators."""
+    status: int
+    body: bytes
+    etag: str
+    encoded: dict[str, bytes] = field(default_factory=dict)   # coding → body
+
+    @classmethod
+    def json(cls, payload: bytes, status: int = HTTPStatus.OK) -> Response:
+        tag = hashlib.sha256(payload).hexdigest()[:32]
+        encoded = {}
+        if len(payload) >= MIN_COMPRESS:
+            encoded["gzip"] = gzip.compress(payload, compresslevel=9, mtime=0)
+            if brotli is not None:
+                encoded["br"] = brotli.compress(payload, quality=11)
+        return cls(status, payload, tag, encoded)
+
+    def etags(self) -> set[str]:
+        """Every representation's ETag – all of them validate the same content."""
+        return {self.etag_for(coding) for coding in [None, *self.encoded]}
+
+    def etag_for(self, coding: str | None) -> str:
+        return f'"{self.etag}-{coding}"' if coding else f'"{self.etag}"'
+
+
+def _error(status: int, message: str) -> Response:
+    return Response.json(json.dumps({"error": message}, ensure_ascii=False).encode(), status)
+
+
+class _Prepared:
+    """One dataset at one version: its frame and prepared responses."""
+
+    def __init__(self, name: str, version: str, frame: pd.DataFrame):
+        self.name, self.version, self.frame = name, version, frame
+        self._responses: OrderedDict[Hashable, Response] = OrderedDict()
+        self._lock = threading.Lock()
+        self.maxsize = 256
+
+    def response(self, key: tuple, build: Callable[[], Response]) -> Response:
+        with self._lock:
+            hit = self._responses.get(key)
+            if hit is not None:
+                self._responses.move_to_end(key)
+                return hit
+        resp = build()      # outside the lock; a racing duplicate is harmless
+        with self._lock:
+            self._responses[key] = resp
+            while len(self._responses) > self.maxsize:
+                self._responses.popitem(last=False)
+        return resp
+
+    def body(self, frame: pd.DataFrame) -> Response:
+        rows = frame.to_json(orient="records", force_ascii=False, date_format="iso")
+        head = json.dumps({"dataset": self.name, "version": self.version,
+                           "count": len(frame)}, ensure_ascii=False)[:-1]
+        return Response.json(f'{head}, "rows": {rows}}}'.encode("utf-8"))
+
+
+def _dataset_version(wb: LazyWorkbook, sheets: list[str]) -> str:
+    parts = "|".join(f"{s}:{wb.part_hashes.get(s) or wb.version}" for s in sheets)
+    return hashlib.sha256(parts.encode("utf-8")).hexdigest()[:16]
+
+
+class DataApi:
+    """The prepared responses for the workbook ``watcher`` is tracking."""
+
+    def __init__(self, watcher: WorkbookWatcher):
+        self.watcher = watcher
+        self.datasets: dict[str, _Prepared] = {}
+        self.builds = 0
+        self.refresh(watcher.current)
+        watcher.subscribe("api", lambda old, new, changed: self.refresh(new))
+
+    def refresh(self, wb: LazyWorkbook) -> None:
+        """Rebuild the datasets whose sheets changed, then swap them in."""
+        current = dict(self.datasets)
+        for name, spec in DATASETS.items():
+            version = _dataset_version(wb, spec.sheets(wb))
+            if name in current and current[name].version == version:
+                continue
+            ds = _Prepared(name, version, spec.build(wb))
+            ds.response((), lambda ds=ds: ds.body(ds.frame))
+            column = spec.filters[spec.main].column
+            for value in pd.unique(ds.frame[column]):
+                key = ((spec.main, (str(value),)),)
+                ds.response(key, lambda ds=ds, m=ds.frame[column] == value:
+                            ds.body(ds.frame[m.to_numpy()]))
+            current[name] = ds
+            self.builds += 1
+            log.info("api: %s rebuilt at %s", name, version)
+        index = {"datasets": {name: {"version": ds.version, "rows": len(ds.frame),
+                                     "filters": DATASETS[name].params}
+                              for name, ds in current.items()},
+                 "workbook": wb.version}
+        self.index = Response.json(json.dumps(index, ensure_ascii=False).encode("utf-8"))
+        self.datasets = current        # one assignment: requests see old or new
+
+    def get(self, path: str, query: str) -> Response:
+        parts = [p for p in path.split("/") if p]
+        if parts == ["api"]:
+            return self.index
+        if len(parts) != 2 or parts[0] != "api" or parts[1] not in self.datasets:
+            return _error(HTTPStatus.NOT_FOUND, f"no such endpoint: {path}")
+        name = parts[1]
+        spec, ds = DATASETS[name], self.datasets[name]
+
+        params = {k: tuple(sorted({v.strip() for raw in vs for v in raw.split(",") if v.strip()}))
+                  for k, vs in parse_qs(query).items()}
+        unknown = set(params) - set(spec.params)
+        if unknown:
+            return _error(HTTPStatus.BAD_REQUEST,
+                          f"unknown filter {', '.join(sorted(unknown))}; "
+                          f"use {', '.join(spec.params)}")
+        try:
+            key = tuple(sorted((k, v) for k, v in params.items() if v))
+            return ds.response(key, lambda: ds.body(ds.frame[self._mask(spec, ds.frame, key)]))
+        except ValueError as exc:
+            return _error(HTTPStatus.BAD_REQUEST, str(exc))
+
+    @staticmethod
+    def _mask(spec: Dataset, frame: pd.DataFrame, key: tuple) -> np.ndarray:
+        mask = np.ones(len(frame), dtype=bool)
+        for param, values in key:
+            if param in spec.bounds:
+                bound = _numbers(param, values)
+                column = frame[spec.bounds[param]].to_numpy()
+                mask &= column >= min(bound) if param == "from" else column <= max(bound)
+                continue
+            flt = spec.filters[param]
+            wanted = _numbers(param, values) if flt.numeric else list(values)
+            mask &= frame[flt.column].isin(wanted).to_numpy()
+        return mask
+
+
+def _numbers(param: str, values: tuple[str, ...]) -> list[int]:
+    """``values`` as years; ``2030`` and ``2030.0`` both mean 2030."""
+    try:
+        years = [float(v) for v in values]
+    except ValueError:
+        years = []
+    if len(years) != len(values) or not all(y.is_integer() for y in years):
+        raise ValueError(f"{param}: expected an integer year, got {', '.join(values)}")
+    return [int(y) for y in years]
+
+
+def _accepted(header: str | None) -> set[str]:
+    """Content codings the client accepts (q > 0)."""
+    out = set()
+    for item in (header or "").split(","):
+        coding, _, params = item.strip().partition(";")
+        q = params.strip().removeprefix("q=")
+        try:
+            if coding and (not params or float(q) > 0):
+                out.add(coding.strip().lower())
+        except ValueError:
+            continue
+    return out
+
+
+def _not_modified(header: str | None, resp: Response) -> bool:
+    if not header:
+        return False
+    tags = {t.strip().removeprefix("W/") for t in header.split(",")}
+    return "*" in tags or bool(tags & resp.etags())
+
+
+class ApiHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True   # headers and body go out as separate writes
+    api: DataApi            # set by ``make_server``
+
+    def do_GET(self) -> None:
+        self._send(head=False)
+
+    def do_HEAD(self) -> None:
+        self._send(head=True)
+
+    def _send(self, head: bool) -> None:
+        url = urlsplit(self.path)
+        resp = self.api.get(url.path, url.query)
+        ok = resp.status == HTTPStatus.OK
+        accepted = _accepted(self.headers.get("Accept-Encoding"))
+        coding = next((c for c in ("br", "gzip") if c in accepted and c in resp.encoded), None)
+
+        if ok and _not_modified(self.headers.get("If-None-Match"), resp):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self._common_headers(resp, coding)
+            self.end_headers()
+            return
+        body = resp.encoded[coding] if coding else resp.body
+        self.send_response(resp.status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        if coding:
+            self.send_header("Content-Encoding", coding)
+        if ok:
+            self._common_headers(resp, coding)
+        else:
+            self.send_header("Cache-Control", "no-store")
+            self.send_header("Access-Control-Allow-Origin", "*")
+        self.end_headers()
+        if not head:
+            self.wfile.write(body)
+
+    def _common_headers(self, resp: Response, coding: str | None) -> None:
+        self.send_header("ETag", resp.etag_for(coding))
+        self.send_header("Cache-Control", f"public, max-age={MAX_AGE}")
+        self.send_header("Vary", "Accept-Encoding")
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Access-Control-Expose-Headers", "ETag")
+
+    def log_message(self, format: str, *args) -> None:
+        log.debug("api: " + format, *args)
+
+
+def make_server(api: DataApi, host: str = "127.0.0.1", port: int = 8600) -> ThreadingHTTPServer:
+    handler = type("BoundApiHandler", (ApiHandler,), {"api": api})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--workbook", type=Path, default=EXCEL_PATH)
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8600)
+    args = ap.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    watcher = WorkbookWatcher(args.workbook).start()
+    server = make_server(DataApi(watcher), args.host, args.port)
+    log.info("api: serving %s on http://%s:%d/api", args.workbook.name, args.host, args.port)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        watcher.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,327 @@
+"""Plotly figure builders and a small LRU figure cache.
+
+The builders are pure: tidy DataFrames and the current selection in, a
+``go.Figure`` out. ``app.py`` places them with ``st.plotly_chart`` and
+keeps finished figures in a ``FigureCache`` keyed on
+``(chart, data version, selection…)`` so toggling a widget back to a
+previous state does not rebuild the figure.
+"""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+from dashboard.constants import ENERGY_COLORS, ENERGY_ORDER, PARTY_COLORS
+from dashboard.ensemble import lttb
+from dashboard.wrangle import value_column
+
+
+TEMPERATURE_Y_LABEL = "배출량 (백만톤 CO₂eq)"
+
+
+# Above this many points the SVG line chart stops being interactive;
+# temperature_lines_gl takes over.
+HIGH_VOLUME_POINTS = 5_000
+
+
+def cmap(parties: list[str]) -> dict[str, str]:
+    return {p: PARTY_COLORS.get(p, "#808080") for p in parties}
+
+
+# ---------------------------------------------------------------------#
+# Figure cache
+# ---------------------------------------------------------------------#
+def _mentions(key: Hashable, versions: set[str]) -> bool:
+    if isinstance(key, tuple):
+        return any(_mentions(k, versions) for k in key)
+    return isinstance(key, str) and key in versions
+
+
+class FigureCache:
+    """Thread‑safe LRU of built figures; figures must not be mutated after."""
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._figs: OrderedDict[Hashable, go.Figure] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, build: Callable[[], go.Figure]) -> go.Figure:
+        """Return the cached figure for ``key``, building it on a miss."""
+        with self._lock:
+            fig = self._figs.get(key)
+            if fig is not None:
+                self._figs.move_to_end(key)
+                self.hits += 1
+                return fig
+        fig = build()  # build outside the lock; a racing duplicate is harmless
+        with self._lock:
+            self.misses += 1
+            self._figs[key] = fig
+            self._figs.move_to_end(key)
+            while len(self._figs) > self.maxsize:
+                self._figs.popitem(last=False)
+        return fig
+
+    def clear(self) -> None:
+        with self._lock:
+            self._figs.clear()
+
+    def evict(self, versions: set[str]) -> int:
+        """
+        Drop figures whose key contains any of ``versions``, at any depth
+        (``("party_similarity", (v1, v2, v3))``); returns the count.
+        """
+        with self._lock:
+            stale = [k for k in self._figs if _mentions(k, versions)]
+            for k in stale:
+                del self._figs[k]
+        return len(stale)
+
+    def __len__(self) -> int:
+        return len(self._figs)
+
+
+# ---------------------------------------------------------------------#
+# Energy mix
+# ---------------------------------------------------------------------#
+def energy_all_bar(energy_df: pd.DataFrame, candidate_scn: list[str]) -> go.Figure:
+    """Horizontal stacked bar of every candidate scenario side by side."""
+    value_col = value_column(energy_df)
+    fig_all = px.bar(
+        energy_df.query("시나리오 in @candidate_scn"),
+        y="시나리오",
+        x=value_col,
+        color="에너지원",
+        orientation="h",
+        color_discrete_map=ENERGY_COLORS,
+        category_orders={
+            "에너지원": ENERGY_ORDER,
+            "시나리오": candidate_scn  # keep order as in data
+        },
+        barmode="stack",
+        height=500
+    )
+    if value_col == "비중":
+        fig_all.update_xaxes(range=[0, 100], title="비중 (%)")
+    else:
+        fig_all.update_xaxes(title=value_col)
+    fig_all.update_layout(legend_title="에너지원")
+    return fig_all
+
+
+def stacked_mix(energy_df: pd.DataFrame, scn: str) -> go.Figure:
+    """Single stacked bar with the energy mix of one scenario."""
+    df_plot = energy_df.query("시나리오 == @scn")
+
+    value_col = value_column(df_plot)
+    y_label = "비중 (%)" if value_col == "비중" else value_col
+
+    # create a single‑column label so the scenario shows as one bar
+    df_plot = df_plot.assign(scn_label=scn)
+
+    fig = px.bar(
+        df_plot,
+        x="scn_label",           # one bar per scenario
+        y=value_col,
+        color="에너지원",
+        color_discrete_map=ENERGY_COLORS,
+        category_orders={"에너지원": ENERGY_ORDER},
+        barmode="stack",
+        height=450
+    )
+    if value_col == "비중":
+        fig.update_yaxes(range=[0, 100])
+    fig.update_xaxes(title="")
+    fig.update_yaxes(title=y_label)
+    fig.update_layout(showlegend=True, legend_title="에너지원", title=scn)
+    return fig
+
+
+# ---------------------------------------------------------------------#
+# Temperature pathways
+# ---------------------------------------------------------------------#
+def temperature_lines(temp_df: pd.DataFrame, ref_paths: list[str],
+                      sel_paths: list[str]) -> go.Figure:
+    """Reference (°C) pathways plus the selected party pathways."""
+    plot_df = temp_df.query("경로 in @ref_paths or 경로 in @sel_paths")
+
+    line_dash = plot_df["경로"].apply(
+        lambda x: "dash" if x in ref_paths else "solid")
+
+    fig = px.line(
+        plot_df, x="연도", y="배출량", color="경로",
+        line_dash=line_dash,
+        color_discrete_map={**cmap(sel_paths),
+                            **{p: "#000000" for p in ref_paths}},   # reference paths in black
+        labels={"배출량": TEMPERATURE_Y_LABEL}, height=600
+    )
+
+    # Make reference (°C) paths thick black, and increase others by one step
+    for t in fig.data:
+        if "°C" in t.name:
+            t.update(line=dict(width=7, color="#000000"))  # reference paths
+        else:
+            current = t.line.width or 2
+            t.update(line=dict(width=current + 1))         # party paths +1 px
+    return fig
+
+
+def _rgba(hex_color: str, alpha: float) -> str:
+    h = hex_color.lstrip("#")
+    r, g, b = (int(h[i:i + 2], 16) for i in (0, 2, 4))
+    return f"rgba({r},{g},{b},{alpha})"
+
+
+def temperature_lines_gl(temp_df: pd.DataFrame, ref_paths: list[str],
+                         sel_paths: list[str], bands: pd.DataFrame | None = None,
+                         max_points: int = 1000) -> go.Figure:
+    """
+    High‑volume variant of ``temperature_lines`` rendered with WebGL.
+    Every trace is LTTB‑downsampled to ``max_points`` (≈ the chart width in
+    px) on the server. ``bands`` (see ``ensemble.percentile_bands``) adds a
+    shaded p5–p95 / p25–p75 envelope and a median line per selected pathway,
+    so payload size depends on ``max_points``, not on the ensemble size.
+    """
+    fig = go.Figure()
+    colors = {**cmap(sel_paths), **{p: "#000000" for p in ref_paths}}
+
+    if bands is not None and not bands.empty:
+        for path, g in bands.query("경로 in @sel_paths").groupby("경로", sort=False):
+            g = g.sort_values("연도")
+            keep = lttb(g["연도"].to_numpy(), g["p50"].to_numpy(), max_points)
+            x = g["연도"].to_numpy()[keep]
+            for lo, hi, alpha in [("p5", "p95", 0.15), ("p25", "p75", 0.30)]:
+                if lo not in g or hi not in g:
+                    continue
+                fig.add_trace(go.Scattergl(
+                    x=x, y=g[lo].to_numpy()[keep], mode="lines", line_width=0,
+                    legendgroup=path, showlegend=False, hoverinfo="skip"))
+                fig.add_trace(go.Scattergl(
+                    x=x, y=g[hi].to_numpy()[keep], mode="lines", line_width=0,
+                    fill="tonexty", fillcolor=_rgba(colors[path], alpha),
+                    legendgroup=path, showlegend=False,
+                    name=f"{path} {lo}–{hi}", hoverinfo="skip"))
+            fig.add_trace(go.Scattergl(
+                x=x, y=g["p50"].to_numpy()[keep], mode="lines",
+                name=f"{path} (중앙값)", legendgroup=path,
+                line=dict(color=colors[path], width=3, dash="dot")))
+
+    plot_df = temp_df.query("경로 in @ref_paths or 경로 in @sel_paths")
+    for path, g in plot_df.groupby("경로", sort=False):
+        g = g.sort_values("연도")
+        keep = lttb(g["연도"].to_numpy(), g["배출량"].to_numpy(), max_points)
+        is_ref = path in ref_paths
+        fig.add_trace(go.Scattergl(
+            x=g["연도"].to_numpy()[keep], y=g["배출량"].to_numpy()[keep],
+            mode="lines", name=path, legendgroup=path,
+            line=dict(color=colors[path], width=7 if is_ref else 3,
+                      dash="dash" if is_ref else "solid")))
+
+    fig.update_layout(height=600, legend_title="경로",
+                      xaxis_title="연도", yaxis_title=TEMPERATURE_Y_LABEL)
+    return fig
+
+
+# ---------------------------------------------------------------------#
+# Policy scatter
+# ---------------------------------------------------------------------#
+def jitter_levels(policy_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add ``level_offset`` (level + per‑party jitter) and ``symbol`` columns.
+    Jitter duplicates horizontally so all circles are visible: one offset per
+    party (in order of appearance), looked up by party code; a missing level
+    is drawn as an 'x'.
+    """
+    codes, parties_local = pd.factorize(policy_df["party"])
+    offsets = np.linspace(-0.15, 0.15, len(parties_local))
+    level = policy_df["level"].to_numpy(dtype=float, na_value=np.nan)
+    return policy_df.assign(
+        level_offset=level + offsets[codes],
+        symbol=np.where(np.isnan(level), 'x', 'circle'),
+    )
+
+
+def policy_scatter(policy_df: pd.DataFrame, title: str,
+                   descriptions: bool = True) -> go.Figure:
+    """
+    Category × policy‑level dot plot, one colour per party. With
+    ``descriptions=False`` the policy text is left out of the hover data
+    (the app shows it for a selected point instead, see ``policy_points``).
+    """
+    policy_df = jitter_levels(policy_df)
+
+    fig = px.scatter(
+        policy_df,
+        x="level_offset",
+        y="category",
+        color="party",
+        symbol="symbol",
+        symbol_map={'circle':'circle','x':'x'},
+        hover_data=["description"] if descriptions else None,
+        color_discrete_map=PARTY_COLORS,
+        height=700,
+    )
+    fig.update_traces(marker_size=16)
+    # Make 'X' markers bigger & grey
+    fig.update_traces(selector=dict(symbol='x'),
+                      marker_size=18,
+                      marker_color="#BBBBBB")
+    fig.update_xaxes(
+        range=[0.5, 3.5],
+        tickvals=[1, 2, 3],
+        ticktext=["공약없음", "정책명시", "정책강화"]
+    )
+    fig.update_layout(title=title, yaxis_title="", xaxis_title="정책 강도")
+    return fig
+
+
+def policy_points(policy_df: pd.DataFrame, points: list[dict]) -> pd.DataFrame:
+    """Rows of ``policy_df`` under points selected in its ``policy_scatter``."""
+    jittered = jitter_levels(policy_df)
+    hit = np.zeros(len(jittered), dtype=bool)
+    for p in points:
+        hit |= ((jittered["category"] == p.get("y"))
+                & np.isclose(jittered["level_offset"], p.get("x", np.nan), atol=1e-3)).to_numpy()
+    return policy_df[hit]
+
+
+def policy_change_heatmap(change_df: pd.DataFrame, title: str) -> go.Figure:
+    """Party × category grid of level changes between two cycles (red = weaker)."""
+    grid = change_df.pivot_table(index="party", columns="category", values="change",
+                                 aggfunc="first", observed=True, sort=False)
+    fig = px.imshow(grid, color_continuous_scale="RdBu", zmin=-2, zmax=2,
+                    text_auto="+.0f", aspect="auto",
+                    labels=dict(x="", y="", color="강도 변화"))
+    fig.update_layout(title=title, height=140 + 40 * len(grid))
+    return fig
+
+
+def party_similarity_heatmap(dist_df: pd.DataFrame, title: str) -> go.Figure:
+    """Symmetric party × party policy distance (0 = same levels, 2 = opposite ends)."""
+    fig = px.imshow(dist_df, color_continuous_scale="Viridis_r", zmin=0, zmax=2,
+                    text_auto=".2f" if len(dist_df) <= 20 else False, aspect="auto",
+                    labels=dict(x="", y="", color="정책 거리"))
+    fig.update_layout(title=title, height=min(200 + 40 * len(dist_df), 900))
+    return fig
+
+
+def vote_share_by_level(share_df: pd.DataFrame, title: str) -> go.Figure:
+    """Per region, the vote share of parties at each policy level (stacked)."""
+    labels = {1: "공약없음", 2: "정책명시", 3: "정책강화"}
+    df = share_df.assign(강도=share_df["level"].map(labels).fillna("입장 없음"),
+                         share=share_df["share"] * 100)
+    fig = px.bar(df, x="share", y="region", color="강도", orientation="h",
+                 category_orders={"강도": [*labels.values(), "입장 없음"]},
+                 color_discrete_sequence=["#BBBBBB", "#7FB3D5", "#1F618D", "#E5E7E9"],
+                 labels={"share": "득표율 (%)", "region": ""},
+                 height=200 + 24 * df["region"].nunique())
+    fig.update_layout(title=title, barmode="stack", legend_title="정책 강도")
+    return fig
@@ -0,0 +1,37 @@
+"""Shared labels and colour palettes used by the app and the chart builders."""
+
+BASELINE_PARTY = "2018년 기준"
+NDC_PARTY      = "2030 NDC"
+CUSTOM_SCENARIO = "사용자 시나리오"   # scenario builder tab
+
+# 정당별 대표색 (필요에 따라 추가)
+PARTY_COLORS = {
+    "국민의힘":   "#E61E2B",  # 빨강
+    "더불어민주당": "#0066FF",  # 파랑
+    "개혁신당":     "#FF8800",  # 주황
+    "민주노동당":   "#FFD700",  # 노랑
+    "녹색정의당":  "#FFD700",  # 노랑
+    BASELINE_PARTY: "#999999",
+    NDC_PARTY:      "#000000",
+    CUSTOM_SCENARIO: "#A855F7",  # 보라
+}
+
+# Color palette for energy sources (stacked bar)
+ENERGY_COLORS = {
+    "석탄":    "#000000",  # 검정
+    "LNG":     "#808080",  # 회색
+    "원자력":  "#0066FF",  # 파랑
+    "재생에너지": "#22C55E",  # 초록
+    "기타":    "#60A5FA",  # 하늘
+    "청정수소/암모니아": "#06B6D4",
+    "바이오":  "#A855F7",
+    "연료전지": "#10B981",
+}
+ENERGY_ORDER = ["석탄", "LNG", "원자력", "재생에너지", "기타"]
+
+# Sources offered as sliders in the scenario builder
+BUILDER_SOURCES = ["석탄", "LNG", "원자력", "재생에너지", "청정수소/암모니아", "기타"]
+
+# Reference scenarios in the 에너지믹스 sheet
+BASE_SCN   = "정부(실적)-2018"
+TARGET_SCN = "정부(계획)-2038"
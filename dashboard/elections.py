@@ -0,0 +1,383 @@
+"""Streaming ingestion of precinct‑level election results.
+
+Result files from the National Election Commission (one CSV per cycle,
+often tens of millions of precinct × candidate rows once several cycles
+are loaded) live under ``data/elections/<cycle>/*.csv``. The cycle
+directory names match the ``policy.CYCLES`` labels (``2025 대선`` …), so
+results and policy positions line up without a mapping table.
+
+Files are never loaded whole. Each one is read in column‑projected record
+batches (``pyarrow.csv.open_csv``; pandas chunks without pyarrow),
+subtotal rows (합계/소계/계) are dropped and every batch is reduced to
+(region, district, party) vote sums straight away, so memory is bounded by
+the number of districts, not by the file. The district frame of each file
+is cached as Feather under ``data/elections/.cache`` keyed on the file's
+size and mtime; a warm start reads a few hundred rows per file.
+
+Both the long layout (one row per candidate with a party column) and the
+wide NEC layout (one vote column per candidate, headed ``정당 후보자``)
+are accepted. Party names are folded onto ``PARTY_DTYPE`` – the
+``PARTY_COLORS`` keys plus ``기타`` – so joins against the policy store
+and the energy‑mix scenarios are merges on shared categorical codes::
+
+    python -m dashboard.elections data/elections
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import re
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from dashboard.constants import BASE_SCN, PARTY_COLORS, TARGET_SCN
+from dashboard.policy import PolicyStore
+from dashboard.wrangle import value_column
+
+try:  # pyarrow gives columnar streaming and the cache; pandas chunks otherwise
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.feather as feather
+except ImportError:  # pragma: no cover - depends on the environment
+    pa = None
+    pacsv = None
+    feather = None
+
+log = logging.getLogger(__name__)
+
+ELECTIONS_DIR = Path(__file__).resolve().parent.parent / "data" / "elections"
+CACHE_VERSION = 1
+
+OTHER_PARTY = "기타"
+# Canonical party dimension shared by results, policy levels and scenarios
+PARTY_DTYPE = pd.CategoricalDtype(list(PARTY_COLORS) + [OTHER_PARTY])
+
+# Short or former names → PARTY_COLORS key
+PARTY_ALIASES = {
+    "민주당": "더불어민주당",
+    "더민주": "더불어민주당",
+    "국힘": "국민의힘",
+    "정의당": "녹색정의당",
+    "녹색당": "녹색정의당",
+}
+
+# Header aliases per field; the first present column wins
+COLUMNS = {
+    "region": ["시도명", "시도", "region"],
+    "district": ["선거구명", "구시군명", "시군구명", "district"],
+    "precinct": ["투표구명", "읍면동명", "precinct"],
+    "party": ["정당명", "정당", "party"],
+    "votes": ["득표수", "votes"],
+}
+# Tally columns of the wide layout that are not candidates
+NON_CANDIDATE = {"선거인수", "투표수", "무효투표수", "기권수", "계", "합계",
+                 "후보자별 득표수 계", "유효투표수"}
+SUBTOTAL = {"합계", "소계", "계"}
+
+AGG_KEY = ["region", "district", "party"]
+
+
+# ---------------------------------------------------------------------#
+# Parties
+# ---------------------------------------------------------------------#
+def canonical_party(name: str) -> str:
+    """
+    Fold a party label from any source onto a ``PARTY_DTYPE`` category:
+    ``"더불어민주당\\n이재명"`` (wide header), ``"민주당-이재명"`` (energy
+    scenario) and ``"민주당"`` all give ``"더불어민주당"``.
+    """
+    head = re.split(r"[\s\-(]", str(name).strip(), maxsplit=1)[0]
+    head = PARTY_ALIASES.get(head, head)
+    return head if head in PARTY_DTYPE.categories else OTHER_PARTY
+
+
+def party_codes(names: pd.Series) -> pd.Series:
+    """``names`` as ``PARTY_DTYPE``; each distinct label is folded once."""
+    cat = names.astype("category").cat
+    lookup = PARTY_DTYPE.categories.get_indexer(
+        [canonical_party(c) for c in cat.categories])
+    codes = np.where(cat.codes >= 0, lookup[cat.codes.to_numpy()], -1)
+    return pd.Series(pd.Categorical.from_codes(codes, dtype=PARTY_DTYPE),
+                     index=names.index, name=names.name)
+
+
+# ---------------------------------------------------------------------#
+# Reading
+# ---------------------------------------------------------------------#
+def _encoding(path: Path) -> str:
+    """NEC exports are CP949 more often than not; sniff the first block."""
+    with open(path, "rb") as fh:
+        head = fh.read(1 << 16)
+    try:
+        head.decode("utf-8")
+    except UnicodeDecodeError as exc:
+        if exc.start < len(head) - 4:   # not just a character cut at the block end
+            return "cp949"
+    return "utf-8-sig" if head.startswith(b"\xef\xbb\xbf") else "utf-8"
+
+
+def resolve_columns(header: list[str]) -> dict[str, str]:
+    """Field → column name for the fields present in ``header``."""
+    cols = {str(c).strip(): c for c in header}
+    return {field: next(cols[a] for a in aliases if a in cols)
+            for field, aliases in COLUMNS.items() if any(a in cols for a in aliases)}
+
+
+def _batches(path: Path, usecols: list[str], text_cols: list[str], encoding: str,
+             chunk_rows: int) -> Iterator[pd.DataFrame]:
+    """Record batches of ``usecols``; ``text_cols`` as strings, the rest inferred."""
+    if pacsv is not None:
+        # A file object, not the path: given a path, pyarrow buffers the whole file
+        with open(path, "rb") as fh:
+            reader = pacsv.open_csv(
+                fh,
+                read_options=pacsv.ReadOptions(encoding=encoding,
+                                               block_size=max(chunk_rows * 64, 1 << 20)),
+                convert_options=pacsv.ConvertOptions(
+                    include_columns=usecols,
+                    column_types={c: pa.string() for c in text_cols}),
+            )
+            for batch in reader:
+                yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, usecols=usecols, dtype=dict.fromkeys(text_cols, str),
+                               encoding=encoding, chunksize=chunk_rows)
+
+
+def _votes(col: pd.Series) -> pd.Series:
+    """Vote counts as int64; thousands separators and blanks are tolerated."""
+    if not pd.api.types.is_numeric_dtype(col):
+        col = pd.to_numeric(col.astype(str).str.replace(",", "", regex=False),
+                            errors="coerce")
+    return col.fillna(0).astype("int64")
+
+
+def _reduce(df: pd.DataFrame) -> pd.DataFrame:
+    return (df.groupby(AGG_KEY, observed=True, sort=False)["votes"].sum()
+            .reset_index())
+
+
+def aggregate_file(path: Path, chunk_rows: int = 100_000,
+                   compact_rows: int = 200_000) -> pd.DataFrame:
+    """
+    District‑level vote sums of one result file: ``region``, ``district``,
+    ``party`` (``PARTY_DTYPE``), ``votes``. Reads ``chunk_rows`` rows at a
+    time; partial sums are merged whenever they exceed ``compact_rows``.
+    """
+    encoding = _encoding(path)
+    header = pd.read_csv(path, nrows=0, encoding=encoding).columns.tolist()
+    fields = resolve_columns(header)
+    if "district" not in fields:
+        raise ValueError(f"{path.name}: no district column ({COLUMNS['district']})")
+    ids = [fields[f] for f in ("region", "district", "precinct") if f in fields]
+    keys = [fields[f] for f in ("region", "district") if f in fields]
+    long = "party" in fields and "votes" in fields
+    if long:
+        usecols, text_cols = ids + [fields["party"], fields["votes"]], ids + [fields["party"]]
+    else:
+        usecols = ids + [c for c in header if c not in ids and str(c).strip() not in NON_CANDIDATE
+                         and not str(c).startswith("Unnamed")]
+        text_cols = ids
+
+    partial, rows = [], 0
+    for chunk in _batches(path, usecols, text_cols, encoding, chunk_rows):
+        # Subtotal rows repeat the precinct sums; keep only leaf rows
+        leaf = ~np.logical_or.reduce([chunk[c].str.strip().isin(SUBTOTAL).to_numpy()
+                                      for c in ids])
+        chunk = chunk[leaf]
+        if long:
+            chunk = chunk.assign(**{fields["party"]: party_codes(chunk[fields["party"]]),
+                                    fields["votes"]: _votes(chunk[fields["votes"]])})
+            sums = (chunk.groupby(keys + [fields["party"]], observed=True, sort=False)
+                    [fields["votes"]].sum().reset_index()
+                    .set_axis(keys + ["party", "votes"], axis=1))
+        else:
+            # Sum the candidate columns per district first, melt the few rows left
+            votes = chunk.columns.difference(ids, sort=False)
+            sums = (chunk[votes].apply(_votes)
+                    .groupby([chunk[k] for k in keys], sort=False).sum()
+                    .reset_index()
+                    .melt(id_vars=keys, var_name="party", value_name="votes"))
+        out = pd.DataFrame({
+            "region": sums[fields["region"]].str.strip() if "region" in fields else "",
+            "district": sums[fields["district"]].str.strip(),
+            "party": party_codes(sums["party"]),
+            "votes": sums["votes"].astype("int64"),
+        })
+        partial.append(_reduce(out))
+        rows += len(partial[-1])
+        if rows > compact_rows and len(partial) > 1:
+            partial = [_reduce(pd.concat(partial, ignore_index=True))]
+            rows = len(partial[0])
+    if not partial:
+        return pd.DataFrame({"region": [], "district": [],
+                             "party": pd.Categorical([], dtype=PARTY_DTYPE),
+                             "votes": np.array([], dtype="int64")})
+    return _reduce(pd.concat(partial, ignore_index=True))
+
+
+# ---------------------------------------------------------------------#
+# Cache
+# ---------------------------------------------------------------------#
+def cache_dir(root: Path) -> Path:
+    return root / ".cache"
+
+
+def _cache_file(root: Path, path: Path) -> Path:
+    st = path.stat()
+    who = hashlib.sha1(str(path.resolve()).encode("utf-8")).hexdigest()[:12]
+    what = hashlib.sha1(f"{st.st_size}:{st.st_mtime_ns}:{CACHE_VERSION}".encode()).hexdigest()[:12]
+    return cache_dir(root) / f"{who}-{what}.arrow"
+
+
+def district_results(path: Path, root: Path = ELECTIONS_DIR) -> pd.DataFrame:
+    """``aggregate_file`` through the on‑disk cache (if pyarrow is available)."""
+    if feather is None:
+        return aggregate_file(path)
+    target = _cache_file(root, path)
+    if target.exists():
+        try:
+            df = feather.read_table(target, memory_map=True).to_pandas()
+            return df.assign(party=df["party"].astype(str).astype(PARTY_DTYPE))
+        except (OSError, pa.ArrowException) as exc:
+            log.warning("elections: cache unreadable for %s (%s)", path.name, exc)
+
+    df = aggregate_file(path)
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        for stale in target.parent.glob(target.name.split("-")[0] + "-*.arrow"):
+            stale.unlink(missing_ok=True)
+        tmp = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+        feather.write_feather(pa.Table.from_pandas(df, preserve_index=False), tmp,
+                              compression="uncompressed")
+        os.replace(tmp, target)
+    except (OSError, pa.ArrowException) as exc:
+        log.warning("elections: cache not written for %s (%s)", path.name, exc)
+    return df
+
+
+def discover(root: Path = ELECTIONS_DIR) -> dict[str, list[Path]]:
+    """Cycle label (sub‑directory name) → its CSV files, in name order."""
+    if not root.is_dir():
+        return {}
+    return {d.name: sorted(d.glob("*.csv"))
+            for d in sorted(root.iterdir())
+            if d.is_dir() and not d.name.startswith(".") and any(d.glob("*.csv"))}
+
+
+def results_version(root: Path = ELECTIONS_DIR) -> str:
+    """Cheap fingerprint of every result file (names, sizes, mtimes)."""
+    h = hashlib.sha1()
+    for cycle, paths in discover(root).items():
+        for p in paths:
+            st = p.stat()
+            h.update(f"{cycle}/{p.name}:{st.st_size}:{st.st_mtime_ns}\n".encode("utf-8"))
+    return h.hexdigest()[:16]
+
+
+def load_results(root: Path = ELECTIONS_DIR) -> pd.DataFrame:
+    """
+    District results of every cycle under ``root``: ``cycle``, ``region``,
+    ``district``, ``party``, ``votes`` and ``share`` (of the district's
+    votes). Empty if there are no result files.
+    """
+    frames = [district_results(p, root).assign(cycle=cycle)
+              for cycle, paths in discover(root).items() for p in paths]
+    if not frames:
+        return pd.DataFrame(columns=["cycle", *AGG_KEY, "votes", "share"])
+    df = pd.concat(frames, ignore_index=True)
+    df = (df.groupby(["cycle", *AGG_KEY], observed=True, sort=False)["votes"].sum()
+          .reset_index())
+    total = df.groupby(["cycle", "region", "district"], sort=False)["votes"].transform("sum")
+    return df.assign(cycle=df["cycle"].astype("category"),
+                     share=df["votes"] / total.where(total > 0))
+
+
+# ---------------------------------------------------------------------#
+# Joins
+# ---------------------------------------------------------------------#
+def vote_share_by_level(results: pd.DataFrame, store: PolicyStore, cycle: str,
+                        category: str) -> pd.DataFrame:
+    """
+    Per region and policy level of ``category`` in ``cycle``: ``votes`` and
+    ``share`` of the region's votes cast for parties at that level. Parties
+    without a position (or with no policy row) count as level ``NaN``.
+    """
+    res = results[results["cycle"] == cycle]
+    levels = store.query(cycle=cycle, category=category)["level"].droplevel(["cycle", "category"])
+    levels = (levels.reset_index()
+              .assign(party=lambda d: party_codes(d["party"].astype(str)))
+              .groupby("party", observed=True)["level"].max())
+    df = res.merge(levels, left_on="party", right_index=True, how="left")
+    out = (df.groupby(["region", "level"], dropna=False, sort=True)["votes"].sum()
+           .reset_index())
+    total = out.groupby("region")["votes"].transform("sum")
+    return out.assign(share=out["votes"] / total.where(total > 0))
+
+
+def scenario_shares(energy_df: pd.DataFrame) -> pd.DataFrame:
+    """Energy mix share (%) per party scenario: ``party`` × ``에너지원``."""
+    value_col = value_column(energy_df)
+    df = energy_df[~energy_df["시나리오"].isin([BASE_SCN, TARGET_SCN])]
+    df = df.assign(party=party_codes(df["시나리오"]))
+    df = df[df["party"] != OTHER_PARTY]
+    share = df[value_col] / df.groupby("시나리오")[value_col].transform("sum") * 100
+    return (df.assign(share=share)
+            .pivot_table(index="party", columns="에너지원", values="share",
+                         aggfunc="mean", observed=True))
+
+
+def vote_weighted_mix(results: pd.DataFrame, energy_df: pd.DataFrame,
+                      cycle: str) -> pd.DataFrame:
+    """
+    Per region, the energy mix implied by its vote: every party's scenario
+    shares weighted by its votes, over the parties that have a scenario.
+    """
+    mix = scenario_shares(energy_df)
+    res = results[(results["cycle"] == cycle) & results["party"].isin(mix.index)]
+    votes = (res.groupby(["region", "party"], observed=True)["votes"].sum()
+             .unstack("party", fill_value=0)
+             .reindex(columns=mix.index, fill_value=0))
+    weights = votes.to_numpy(dtype=float)       # may be a read‑only view: divide out of place
+    total = weights.sum(axis=1, keepdims=True)
+    weights = weights / np.where(total > 0, total, np.nan)
+    return pd.DataFrame(weights @ mix.fillna(0).to_numpy(),
+                        index=votes.index, columns=mix.columns)
+
+
+# ---------------------------------------------------------------------#
+# CLI
+# ---------------------------------------------------------------------#
+def main(argv: list[str] | None = None) -> int:
+    import argparse
+    import time
+
+    from dashboard.profiling import rss_bytes
+
+    ap = argparse.ArgumentParser(description="Aggregate election result CSVs to districts.")
+    ap.add_argument("root", nargs="?", type=Path, default=ELECTIONS_DIR)
+    ap.add_argument("--no-cache", action="store_true", help="re-read every file")
+    args = ap.parse_args(argv)
+
+    found = discover(args.root)
+    if not found:
+        print(f"no <cycle>/*.csv under {args.root}", file=sys.stderr)
+        return 1
+    for cycle, paths in found.items():
+        for p in paths:
+            t0 = time.perf_counter()
+            df = aggregate_file(p) if args.no_cache else district_results(p, args.root)
+            rss = rss_bytes()
+            print(f"{cycle:<10} {p.name:<30} {p.stat().st_size / 2**20:8.1f} MB → "
+                  f"{len(df):6d} rows  {time.perf_counter() - t0:6.2f} s"
+                  + (f"  RSS {rss / 2**20:.0f} MB" if rss else ""))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""Server‑side reduction of dense pathway data before it reaches the browser.
+
+Two tools keep the temperature chart's payload bounded no matter how much
+data sits behind it:
+
+* ``percentile_bands`` collapses an ensemble of trajectories per pathway
+  (thousands of Monte Carlo members) into a handful of percentile curves.
+* ``lttb`` picks at most ``n_out`` visually representative points of a
+  curve (Largest‑Triangle‑Three‑Buckets, Steinarsson 2013).
+"""
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+# Percentiles drawn as an outer band, inner band and median line
+BAND_PERCENTILES = (5, 25, 50, 75, 95)
+
+# Long‑form ensemble sheet: one row per (year, pathway, member)
+ENSEMBLE_COLUMNS = ["연도", "경로", "표본", "배출량"]
+
+# Sheet name keywords of the optional ensemble sheet
+ENSEMBLE_KEYWORDS = ["앙상블", "ensemble"]
+
+
+def percentile_bands(ens_df: pd.DataFrame,
+                     percentiles: tuple[int, ...] = BAND_PERCENTILES) -> pd.DataFrame:
+    """
+    Reduce ``ens_df`` (columns ``ENSEMBLE_COLUMNS``) to one row per
+    (경로, 연도) with a ``p<q>`` column per percentile.
+    Each pathway is pivoted to a members × years array and reduced with a
+    single ``nanpercentile`` call, so cost is linear in the ensemble size.
+    """
+    cols = ["경로", "연도"] + [f"p{q}" for q in percentiles]
+    if ens_df.empty:
+        return pd.DataFrame(columns=cols)
+
+    out = []
+    for path, g in ens_df.groupby("경로", sort=False):
+        wide = g.pivot_table(index="표본", columns="연도", values="배출량",
+                             aggfunc="first")
+        q = np.nanpercentile(wide.to_numpy(dtype=float), percentiles, axis=0)
+        frame = pd.DataFrame(q.T, columns=cols[2:])
+        frame.insert(0, "연도", wide.columns.to_numpy())
+        frame.insert(0, "경로", path)
+        out.append(frame)
+    return pd.concat(out, ignore_index=True)
+
+
+def lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Indices of at most ``n_out`` points of (x, y) chosen by LTTB.
+    ``x`` must be sorted. The first and last points are always kept; every
+    bucket in between contributes the point forming the largest triangle
+    with the previous pick and the mean of the next bucket.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    # bucket i covers [edges[i], edges[i+1]) for the n_out-2 middle buckets
+    edges = (np.arange(n_out - 1) * ((n - 2) / (n_out - 2))).astype(np.intp) + 1
+    edges[-1] = n - 1
+
+    idx = np.empty(n_out, dtype=np.intp)
+    idx[0], idx[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            nlo, nhi = hi, edges[i + 2]
+            cx, cy = x[nlo:nhi].mean(), y[nlo:nhi].mean()
+        else:
+            cx, cy = x[-1], y[-1]
+        area = np.abs((x[a] - cx) * (y[lo:hi] - y[a])
+                      - (x[a] - x[lo:hi]) * (cy - y[a]))
+        a = lo + int(np.nanargmax(area)) if np.isfinite(area).any() else lo
+        idx[i + 1] = a
+    return idx
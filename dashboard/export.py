@@ -0,0 +1,224 @@
+"""Headless static export of the read‑only tabs for CDN serving.
+
+Pre‑renders every chart the Streamlit app shows for every reasonable filter
+combination, with the same wrangling and chart builders as ``app.py``:
+
+* tab 0 – the all‑candidates bar;
+* tab 1 – ``stacked_mix`` for every 에너지믹스 scenario;
+* tab 2 – the temperature chart for every subset of party pathways
+  (WebGL + bands when the app would default to it);
+* policy tabs – ``policy_scatter`` of every cycle in the policy store for
+  every subset of parties, the level‑change heatmap for every pair of
+  cycles, and the party‑similarity heatmap.
+
+Subsets are exhaustive up to ``MAX_SUBSET_ITEMS`` items; beyond that only
+the full set and single items are exported. Each figure is written as
+compact Plotly JSON (``dashboard/payload.py``) and standalone HTML
+named ``<chart>.<sha256[:12]>.<ext>``, so identical figures share a file
+and anything already on the CDN can be cached forever. ``manifest.json``
+(tab, selection → files) and ``index.html`` are the only unhashed entry
+points. Figures are built in a process pool, one workbook load per worker::
+
+    python -m dashboard.export out/ --workers 8
+"""
+from __future__ import annotations
+
+import hashlib
+import html
+import itertools
+import json
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+from dashboard import charts, ensemble, payload, policy, similarity, wrangle
+from dashboard.constants import BASE_SCN, TARGET_SCN
+from dashboard.policy import PolicyStore
+from dashboard.workbook import LazyWorkbook
+
+# Largest filter list exported exhaustively (2**n − 1 subsets)
+MAX_SUBSET_ITEMS = 6
+
+
+_data: dict | None = None   # per‑worker datasets, see _init
+
+
+def load_datasets(path: Path) -> dict:
+    """The tidy frames behind the exported tabs (empty frames if missing)."""
+    return tidy_datasets(LazyWorkbook(path))
+
+
+def tidy_datasets(wb: LazyWorkbook) -> dict:
+    """``load_datasets`` for an open workbook (the wrangling stage only)."""
+    def sheet(keywords):
+        name = wb.find(keywords)
+        return wb[name] if name is not None else pd.DataFrame()
+
+    data = {
+        "version": wb.version,
+        "energy": wrangle.tidy_energy(sheet(["에너지믹스"])),
+        "temperature": wrangle.tidy_temperature(sheet(["온도경로"])),
+        "bands": ensemble.percentile_bands(sheet(ensemble.ENSEMBLE_KEYWORDS)),
+    }
+    data["policy"] = PolicyStore.from_sheets(wb)
+    return data
+
+
+def subsets(items: list[str]) -> list[tuple[str, ...]]:
+    """Non‑empty subsets in ``items`` order, largest first."""
+    if len(items) > MAX_SUBSET_ITEMS:
+        return [tuple(items)] + [(i,) for i in items]
+    return [c for r in range(len(items), 0, -1)
+            for c in itertools.combinations(items, r)]
+
+
+def jobs(data: dict) -> list[tuple[str, str, tuple[str, ...]]]:
+    """(tab, chart, selection) for every figure to export."""
+    out = []
+    energy_df = data["energy"]
+    if not energy_df.empty:
+        scenarios = energy_df["시나리오"].unique().tolist()
+        candidates = tuple(s for s in scenarios if s not in [BASE_SCN, TARGET_SCN])
+        if candidates:
+            out.append(("energy_all", "energy_all", candidates))
+        out += [("energy_mix", "stacked_mix", (s,)) for s in scenarios]
+
+    temp_df = data["temperature"]
+    if not temp_df.empty:
+        _, party_paths = wrangle.split_paths(temp_df)
+        out += [("temperature", "temperature", sel) for sel in subsets(party_paths)]
+
+    store = data["policy"]
+    for label in store.cycles:
+        policy_df = store.cycle_frame(label)
+        parties = sorted(policy_df.query("level >= 1")["party"].unique())
+        out += [(policy.cycle(label).sheet, "policy", sel) for sel in subsets(parties)]
+    out += [("policy_change", "policy_change", pair)
+            for pair in itertools.combinations(store.cycles, 2)]
+    if len(store.parties()) > 1:
+        out.append(("party_similarity", "party_similarity", ()))
+    return out
+
+
+def build(data: dict, tab: str, chart: str, sel: tuple[str, ...],
+          descriptions: bool = True):
+    """
+    The figure the app shows for ``tab`` with ``sel`` selected. Policy
+    descriptions are inlined in the hover by default – a static page has no
+    server to ask for them.
+    """
+    if chart == "energy_all":
+        return charts.energy_all_bar(data["energy"], list(sel))
+    if chart == "stacked_mix":
+        return charts.stacked_mix(data["energy"], sel[0])
+    if chart == "temperature":
+        temp_df, bands = data["temperature"], data["bands"]
+        ref_paths, _ = wrangle.split_paths(temp_df)
+        if len(temp_df) > charts.HIGH_VOLUME_POINTS or not bands.empty:
+            return charts.temperature_lines_gl(temp_df, ref_paths, list(sel), bands=bands)
+        return charts.temperature_lines(temp_df, ref_paths, list(sel))
+    if chart == "policy":
+        c = next(c for c in policy.CYCLES if c.sheet == tab)
+        policy_df = data["policy"].cycle_frame(c.label).query("level >= 1")
+        return charts.policy_scatter(policy_df[policy_df["party"].isin(sel)], c.title,
+                                     descriptions=descriptions)
+    if chart == "policy_change":
+        old, new = sel
+        return charts.policy_change_heatmap(data["policy"].level_change(old, new),
+                                            f"{old} → {new} 정책 강도 변화")
+    if chart == "party_similarity":
+        sim = similarity.PartySimilarity.from_store(data["policy"])
+        return charts.party_similarity_heatmap(sim.frame(), "정당 간 정책 거리")
+    raise ValueError(f"unknown chart {chart!r}")
+
+
+def _atomic_write(target: Path, body: bytes) -> None:
+    fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.")
+    with os.fdopen(fd, "wb") as f:
+        f.write(body)
+    os.chmod(tmp, 0o644)  # mkstemp is 0600; the web server must read it
+    os.replace(tmp, target)
+
+
+def _write(out_dir: Path, stem: str, ext: str, text: str) -> str:
+    """Write ``text`` under a content‑hashed name (skipped if present)."""
+    body = text.encode("utf-8")
+    name = f"{stem}.{hashlib.sha256(body).hexdigest()[:12]}.{ext}"
+    if not (out_dir / name).exists():
+        _atomic_write(out_dir / name, body)
+    return name
+
+
+def _init(path: Path) -> None:
+    global _data
+    _data = load_datasets(path)
+
+
+def _export(args: tuple[Path, str, str, tuple[str, ...]]) -> dict:
+    out_dir, tab, chart, sel = args
+    fig = payload.compact(build(_data, tab, chart, sel))
+    fig_json = fig.to_json()
+    json_name = _write(out_dir, chart, "json", fig_json)
+    # fixed div id: to_html otherwise picks a random one and breaks the hash
+    page = fig.to_html(include_plotlyjs="cdn", full_html=True,
+                       div_id=f"fig-{json_name.split('.')[1]}")
+    html_name = _write(out_dir, chart, "html", page)
+    return {"tab": tab, "chart": chart, "selection": list(sel),
+            "json": json_name, "html": html_name}
+
+
+def _index_html(manifest: dict) -> str:
+    rows = "\n".join(
+        f'<li>{e["tab"]} – {html.escape(", ".join(e["selection"]))}: '
+        f'<a href="{e["html"]}">HTML</a> · <a href="{e["json"]}">JSON</a></li>'
+        for e in manifest["figures"])
+    return ("<!doctype html>\n<meta charset=\"utf-8\">\n"
+            "<title>2025 대선 기후 정책 종합 분석</title>\n"
+            f"<ul>\n{rows}\n</ul>\n")
+
+
+def export(path: Path, out_dir: Path, workers: int | None = None) -> dict:
+    """Render every figure into ``out_dir``; returns the manifest."""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    _init(path)
+    todo = [(out_dir, *job) for job in jobs(_data)]
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(todo) > 1:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init,
+                                 initargs=(path,)) as pool:
+            figures = list(pool.map(_export, todo, chunksize=4))
+    else:
+        figures = [_export(job) for job in todo]
+
+    manifest = {"version": _data["version"], "figures": figures}
+    for name, text in [("manifest.json", json.dumps(manifest, ensure_ascii=False, indent=1)),
+                       ("index.html", _index_html(manifest))]:
+        _atomic_write(out_dir / name, text.encode("utf-8"))
+    return manifest
+
+
+def main(argv: list[str] | None = None) -> int:
+    import argparse
+    import time
+
+    default = Path(__file__).resolve().parent.parent / "data" / "climate_data.xlsx"
+    ap = argparse.ArgumentParser(description="Static export of the dashboard tabs.")
+    ap.add_argument("out_dir", type=Path)
+    ap.add_argument("--workbook", type=Path, default=default)
+    ap.add_argument("--workers", type=int, default=None)
+    args = ap.parse_args(argv)
+
+    t0 = time.perf_counter()
+    manifest = export(args.workbook, args.out_dir, args.workers)
+    files = {f[k] for f in manifest["figures"] for k in ("json", "html")}
+    print(f"{len(manifest['figures'])} figures, {len(files)} files → {args.out_dir} "
+          f"in {time.perf_counter() - t0:.1f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,218 @@
+"""Monte Carlo batch mode: uncertainty bands for every 에너지믹스 scenario.
+
+Each draw perturbs the three assumptions behind the 설명 tab's pathways:
+
+* emission factors – lognormal around ``DEFAULT_FACTORS`` per source;
+* demand – the 700 TWh target‑year mix follows 연 1 % growth from the base
+  year, so a drawn growth rate ``g`` scales the mix by
+  ``((1 + g) / 1.01) ** (target_year − base_year)``;
+* non‑power sectors – lognormal level around 281.1 Mt, still held flat
+  after the NDC year.
+
+Draws are evaluated ``chunk`` at a time through ``pathways.pathway_array``
+and folded into fixed‑grid histograms per (scenario, year), so memory is
+bounded by the chunk size regardless of N and chunk results merge by
+addition – across processes too, for large N. Percentiles are read off the
+merged histograms (resolution ``hist_max / bins``, ≈0.06 Mt by default),
+clamped to the exact minimum and maximum drawn, and returned in the ``ensemble.percentile_bands`` layout the temperature chart
+draws as bands::
+
+    python -m dashboard.montecarlo --draws 1000000 --workers 4
+"""
+from __future__ import annotations
+
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from dashboard.ensemble import BAND_PERCENTILES
+from dashboard.pathways import (PARTY_SPECS, Assumptions, default_spec,
+                                factor_vector, mix_matrix, pathway_array,
+                                scenario_party)
+
+# Below this many draws a process pool costs more than it saves
+POOL_MIN_DRAWS = 200_000
+
+
+@dataclass(frozen=True)
+class Uncertainty:
+    """Spread of the sampled inputs (lognormal σ are relative)."""
+    factor_sigma: float = 0.10     # per emitting source, independent
+    growth: float = 0.01           # mean demand growth per year
+    growth_sd: float = 0.005
+    non_power_sigma: float = 0.05
+
+
+@dataclass(frozen=True)
+class _Job:
+    """Everything a worker needs for one chunk; small enough to pickle."""
+    mix: np.ndarray
+    factors: np.ndarray
+    specs: tuple
+    years: np.ndarray
+    assumptions: Assumptions
+    uncertainty: Uncertainty
+    n: int
+    seed: np.random.SeedSequence
+    hist_max: float
+    bins: int
+
+
+def sample(rng: np.random.Generator, n: int, factors: np.ndarray,
+           target_years: np.ndarray, a: Assumptions = Assumptions(),
+           u: Uncertainty = Uncertainty()) -> dict[str, np.ndarray]:
+    """
+    ``n`` draws of the ``pathway_array`` inputs: ``factors`` (n, F),
+    ``power_scale`` (n, S) from the demand growth and ``non_power`` (n,).
+    """
+    f = factors * rng.lognormal(0.0, u.factor_sigma, (n, len(factors)))
+    g = rng.normal(u.growth, u.growth_sd, n)
+    horizon = np.asarray(target_years, dtype=float) - a.base_year
+    scale = ((1 + g[:, None]) / (1 + u.growth)) ** horizon        # (n, S)
+    non_power = a.non_power * rng.lognormal(0.0, u.non_power_sigma, n)
+    return {"factors": f, "power_scale": scale, "non_power": non_power}
+
+
+def _run_chunk(job: _Job) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Histogram counts (S, G, bins) of one chunk of draws, and its min/max (S, G)."""
+    rng = np.random.default_rng(job.seed)
+    target_years = np.array([s.target_year for s in job.specs])
+    draws = sample(rng, job.n, job.factors, target_years, job.assumptions,
+                   job.uncertainty)
+    em = pathway_array(job.mix, draws["factors"], list(job.specs), job.years,
+                       job.assumptions, non_power=draws["non_power"],
+                       power_scale=draws["power_scale"])           # (n, S, G)
+
+    s, g = em.shape[1:]
+    b = np.clip((em * (job.bins / job.hist_max)).astype(np.intp), 0, job.bins - 1)
+    cell = np.arange(s * g, dtype=np.intp).reshape(s, g) * job.bins
+    hist = np.bincount((b + cell).ravel(),
+                       minlength=s * g * job.bins).reshape(s, g, job.bins)
+    return hist, em.min(axis=0), em.max(axis=0)
+
+
+def hist_percentiles(hist: np.ndarray, percentiles, hist_max: float,
+                     lo: np.ndarray | None = None,
+                     hi: np.ndarray | None = None) -> np.ndarray:
+    """
+    Percentiles from counts (..., bins) on ``[0, hist_max)``, interpolated
+    linearly inside the bin and clipped to the observed ``lo``/``hi`` (...)
+    when given – so a point mass, e.g. a pathway at 0 in every draw, comes
+    out exact rather than mid‑bin. Returns (len(percentiles), ...).
+    """
+    bins = hist.shape[-1]
+    cdf = np.cumsum(hist, axis=-1, dtype=float)
+    total = cdf[..., -1:]
+    out = []
+    for q in percentiles:
+        target = total * (q / 100)
+        i = np.minimum((cdf < target).sum(-1, keepdims=True), bins - 1)
+        below = np.take_along_axis(cdf, np.maximum(i - 1, 0), -1) * (i > 0)
+        count = np.take_along_axis(hist, i, -1)
+        frac = np.where(count > 0, (target - below) / np.maximum(count, 1), 0.5)
+        out.append(((i + np.clip(frac, 0, 1)) * (hist_max / bins))[..., 0])
+    out = np.stack(out)
+    if lo is not None or hi is not None:
+        out = np.clip(out, lo, hi)
+    return out
+
+
+def run(energy_df: pd.DataFrame, draws: int, *,
+        uncertainty: Uncertainty = Uncertainty(),
+        assumptions: Assumptions = Assumptions(),
+        years: np.ndarray | None = None,
+        scenarios: list[str] | None = None,
+        percentiles: tuple[int, ...] = BAND_PERCENTILES,
+        chunk: int = 50_000, workers: int | None = None, seed: int = 0,
+        bins: int = 16_384) -> pd.DataFrame:
+    """
+    Percentile bands over ``draws`` Monte Carlo draws, one row per
+    (경로, 연도) with a ``p<q>`` column per percentile – the same layout as
+    ``ensemble.percentile_bands``. Scenarios default to those mapped to a
+    ``PARTY_SPECS`` party, as in ``pathways.compute_pathways``.
+
+    ``workers`` > 1 spreads chunks over a process pool; ``None`` picks
+    ``os.cpu_count()`` from ``POOL_MIN_DRAWS`` draws on and 1 below.
+    Results are reproducible for a given ``seed`` and ``chunk``, whatever
+    the number of workers.
+    """
+    scn_all, sources, mix = mix_matrix(energy_df)
+    if scenarios is None:
+        scenarios = [s for s in scn_all if scenario_party(s) in PARTY_SPECS]
+    rows = [scn_all.index(s) for s in scenarios]
+    if years is None:
+        years = np.arange(assumptions.base_year, assumptions.end_year + 1)
+    years = np.asarray(years)
+    if workers is None:
+        workers = (os.cpu_count() or 1) if draws >= POOL_MIN_DRAWS else 1
+
+    sizes = [chunk] * (draws // chunk) + ([draws % chunk] if draws % chunk else [])
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    jobs = [_Job(mix[rows], factor_vector(sources), tuple(default_spec(s) for s in scenarios),
+                 years, assumptions, uncertainty, n, ss,
+                 hist_max=1.25 * assumptions.base, bins=bins)
+            for n, ss in zip(sizes, seeds)]
+
+    hist = np.zeros((len(scenarios), len(years), bins), dtype=np.int64)
+    lo = np.full(hist.shape[:2], np.inf)
+    hi = np.full(hist.shape[:2], -np.inf)
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 and len(jobs) > 1 else None
+    try:
+        for h, mn, mx in (pool.map if pool else map)(_run_chunk, jobs):
+            hist += h
+            np.minimum(lo, mn, out=lo)
+            np.maximum(hi, mx, out=hi)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    q = hist_percentiles(hist, percentiles, 1.25 * assumptions.base, lo, hi)  # (P, S, G)
+    out = pd.DataFrame({
+        "경로": np.repeat([scenario_party(s) for s in scenarios], len(years)),
+        "연도": np.tile(years, len(scenarios)),
+    })
+    for p, values in zip(percentiles, q):
+        out[f"p{p}"] = values.ravel()
+    return out
+
+
+def main(argv: list[str] | None = None) -> int:
+    import argparse
+    import time
+    from pathlib import Path
+
+    from dashboard import wrangle
+    from dashboard.workbook import LazyWorkbook
+
+    default = Path(__file__).resolve().parent.parent / "data" / "climate_data.xlsx"
+    ap = argparse.ArgumentParser(description="Monte Carlo pathway bands.")
+    ap.add_argument("workbook", nargs="?", type=Path, default=default)
+    ap.add_argument("--draws", type=int, default=100_000)
+    ap.add_argument("--chunk", type=int, default=50_000)
+    ap.add_argument("--workers", type=int, default=None)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--out", type=Path, help="write the bands as CSV")
+    args = ap.parse_args(argv)
+
+    wb = LazyWorkbook(args.workbook)
+    energy_df = wrangle.tidy_energy(wb[wb.find(["에너지믹스"])])
+    t0 = time.perf_counter()
+    bands = run(energy_df, args.draws, chunk=args.chunk, workers=args.workers,
+                seed=args.seed)
+    dt = time.perf_counter() - t0
+
+    if args.out:
+        bands.to_csv(args.out, index=False)
+    else:
+        print(bands[bands["연도"] % 5 == 0].round(1).to_string(index=False))
+    print(f"\n{args.draws:,} draws in {dt:.2f} s ({args.draws / dt:,.0f} draws/s)",
+          file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
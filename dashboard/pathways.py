@@ -0,0 +1,282 @@
+"""Vectorized emissions‑pathway engine (energy mix × emission factors → Mt).
+
+Implements the model described in the 설명 tab:
+
+* every pathway starts at the 2018 total (727.6 MtCO₂eq) and meets the
+  2030 NDC (436.6 MtCO₂eq);
+* in the target year the total is the non‑power sectors, held flat after
+  2030 (281.1 Mt), plus power emissions = Σ TWh × kgCO₂/kWh of the mix;
+* pathways with a ``reduction`` target (권영국: −70 % by 2035) ignore the mix
+  and use ``base × (1 − reduction)`` instead;
+* by 2050 the total is either the non‑power remainder or 0 (``net_zero``);
+* years in between are linear.
+
+All scenarios — and optionally a leading batch axis of factor/assumption
+draws — are evaluated as one array operation (``pathway_array``), which is
+what the what‑if and sensitivity code paths call. 1 kgCO₂/kWh × 1 TWh = 1 Mt,
+so factors apply to TWh directly.
+
+Check the engine against the pre‑baked 온도경로 sheet (every year, to the
+tolerances of ``sheet_tolerance``; ``tests/test_pathways.py`` runs the same
+comparison) with::
+
+    python -m dashboard.pathways --check
+"""
+from __future__ import annotations
+
+import sys
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from dashboard.constants import PARTY_COLORS
+from dashboard.wrangle import value_column
+
+# kgCO₂/kWh (= Mt per TWh). 석탄·LNG: 환경부 고시 계수. 기타 has no
+# published factor: in the 11th plan mix it is mostly 수소·암모니아 co‑fired
+# with LNG, so it is taken as LNG‑equivalent. That is an assumption, not a
+# fit – the value that would best reproduce the sheet's 개혁신당 pathway (the
+# one with a sizeable 기타 share) is 0.374, about 3 % higher.
+DEFAULT_FACTORS = {
+    "석탄": 0.8230,
+    "LNG": 0.3625,
+    "원자력": 0.0,
+    "재생에너지": 0.0,
+    "청정수소/암모니아": 0.0,
+    "기타": 0.3625,
+}
+
+
+@dataclass(frozen=True)
+class Assumptions:
+    """Economy‑wide anchors shared by every pathway (MtCO₂eq)."""
+    base_year: int = 2018
+    base: float = 727.6
+    ndc_year: int = 2030
+    ndc: float = 436.6
+    non_power: float = 281.1   # non‑power sectors, flat after the NDC year
+    end_year: int = 2050
+
+
+@dataclass(frozen=True)
+class PathwaySpec:
+    """How one scenario's pathway is anchored between the NDC and end year."""
+    target_year: int = 2040
+    reduction: float | None = None   # vs. base, replaces mix‑based target
+    net_zero: bool = False           # 0 instead of non_power in end_year
+
+
+# Per‑party pathway definitions behind the 온도경로 sheet
+PARTY_SPECS: dict[str, PathwaySpec] = {
+    "더불어민주당": PathwaySpec(target_year=2040, net_zero=True),
+    "국민의힘":    PathwaySpec(target_year=2040),
+    "개혁신당":    PathwaySpec(target_year=2040),
+    "민주노동당":  PathwaySpec(target_year=2035, reduction=0.70, net_zero=True),
+}
+
+
+def scenario_party(scn: str) -> str:
+    """
+    Party of an 에너지믹스 scenario ('민주당-이재명' → '더불어민주당').
+    Falls back to the scenario name when no ``PARTY_COLORS`` key matches.
+    """
+    prefix = scn.split("-")[0]
+    if prefix in PARTY_COLORS:
+        return prefix
+    return next((p for p in PARTY_COLORS if p.endswith(prefix)), scn)
+
+
+def default_spec(scn: str) -> PathwaySpec:
+    """Spec for a scenario: the party's, else target year from a '-YYYY' suffix."""
+    party = scenario_party(scn)
+    if party in PARTY_SPECS:
+        return PARTY_SPECS[party]
+    suffix = scn.rsplit("-", 1)[-1]
+    if suffix.isdigit() and int(suffix) > Assumptions.ndc_year:
+        return PathwaySpec(target_year=int(suffix))
+    return PathwaySpec()
+
+
+# ---------------------------------------------------------------------#
+# Inputs → arrays
+# ---------------------------------------------------------------------#
+def mix_matrix(energy_df: pd.DataFrame) -> tuple[list[str], list[str], np.ndarray]:
+    """(scenarios, sources, S×F TWh array) from the tidy 에너지믹스 frame."""
+    wide = energy_df.pivot_table(index="시나리오", columns="에너지원",
+                                 values=value_column(energy_df), aggfunc="sum",
+                                 sort=False).fillna(0.0)
+    return list(wide.index), list(wide.columns), wide.to_numpy(dtype=float)
+
+
+def factor_vector(sources: list[str], factors: Mapping[str, float] | None = None) -> np.ndarray:
+    """Emission factor per source, in ``sources`` order (unknown sources → 0)."""
+    factors = DEFAULT_FACTORS if factors is None else factors
+    return np.array([factors.get(s, 0.0) for s in sources], dtype=float)
+
+
+# ---------------------------------------------------------------------#
+# Core
+# ---------------------------------------------------------------------#
+def _expand(x, ndim: int) -> np.ndarray:
+    """Append trailing axes so a (...,) batch parameter broadcasts against (..., S)."""
+    x = np.asarray(x, dtype=float)
+    return x.reshape(x.shape + (1,) * ndim) if x.ndim else x
+
+
+def interpolate(anchor_years: np.ndarray, anchor_values: np.ndarray,
+                years: np.ndarray) -> np.ndarray:
+    """
+    Piecewise‑linear interpolation of many curves at once.
+    ``anchor_years`` is (S, K) sorted along K, ``anchor_values`` (..., S, K);
+    returns (..., S, len(years)). Years outside the anchors are held flat.
+    """
+    years = np.asarray(years, dtype=float)
+    k = anchor_years.shape[-1]
+    # segment index per (scenario, year): number of inner anchors ≤ year
+    j = (anchor_years[:, None, 1:-1] <= years[None, :, None]).sum(-1)
+    j = np.minimum(j, k - 2)
+    x0 = np.take_along_axis(anchor_years, j, axis=1)
+    x1 = np.take_along_axis(anchor_years, j + 1, axis=1)
+    w = np.clip((years - x0) / np.where(x1 > x0, x1 - x0, 1), 0.0, 1.0)
+
+    shape = anchor_values.shape[:-1] + (len(years),)
+    v0 = np.take_along_axis(anchor_values, np.broadcast_to(j, shape), axis=-1)
+    v1 = np.take_along_axis(anchor_values, np.broadcast_to(j + 1, shape), axis=-1)
+    return v0 + w * (v1 - v0)
+
+
+def pathway_array(mix: np.ndarray, factors: np.ndarray, specs: list[PathwaySpec],
+                  years: np.ndarray, a: Assumptions = Assumptions(),
+                  base=None, ndc=None, non_power=None,
+                  power_scale=None) -> np.ndarray:
+    """
+    Emissions (MtCO₂eq) for every scenario and year in one pass.
+
+    ``mix`` is S×F TWh, ``factors`` is (..., F) – a leading batch axis
+    evaluates many factor draws at once. ``base``/``ndc``/``non_power``
+    override the ``Assumptions`` and may carry the same batch shape (...,).
+    ``power_scale`` (..., S) multiplies power emissions, e.g. a demand
+    multiplier per draw and scenario. Returns (..., S, len(years)).
+    """
+    base = _expand(a.base if base is None else base, 1)
+    ndc = _expand(a.ndc if ndc is None else ndc, 1)
+    non_power = _expand(a.non_power if non_power is None else non_power, 1)
+
+    power = factors @ mix.T                                        # (..., S)
+    if power_scale is not None:
+        power = power * power_scale
+    target_year = np.array([s.target_year for s in specs], dtype=float)
+    reduction = np.array([np.nan if s.reduction is None else s.reduction
+                          for s in specs])
+    net_zero = np.array([s.net_zero for s in specs])
+
+    target = np.where(np.isnan(reduction), non_power + power,
+                      base * (1 - np.nan_to_num(reduction)))
+    end = np.where(net_zero, 0.0, non_power + 0 * power)
+    values = np.stack(np.broadcast_arrays(base + 0 * power, ndc + 0 * power,
+                                          target, end), axis=-1)  # (..., S, 4)
+
+    anchor_years = np.column_stack([
+        np.full(len(specs), a.base_year, dtype=float),
+        np.full(len(specs), a.ndc_year, dtype=float),
+        target_year,
+        np.full(len(specs), a.end_year, dtype=float),
+    ])
+    return interpolate(anchor_years, values, years)
+
+
+def compute_pathways(energy_df: pd.DataFrame,
+                     factors: Mapping[str, float] | None = None,
+                     assumptions: Assumptions = Assumptions(),
+                     years: np.ndarray | None = None,
+                     scenarios: list[str] | None = None) -> pd.DataFrame:
+    """
+    Yearly pathways for the 에너지믹스 scenarios, long form
+    (연도, 경로, 배출량) with 경로 = party name as in the 온도경로 sheet.
+    By default every scenario mapped to a ``PARTY_SPECS`` party is included.
+    """
+    scn_all, sources, mix = mix_matrix(energy_df)
+    if scenarios is None:
+        scenarios = [s for s in scn_all if scenario_party(s) in PARTY_SPECS]
+    rows = [scn_all.index(s) for s in scenarios]
+    if years is None:
+        years = np.arange(assumptions.base_year, assumptions.end_year + 1)
+
+    em = pathway_array(mix[rows], factor_vector(sources, factors),
+                       [default_spec(s) for s in scenarios], years, assumptions)
+    return pd.DataFrame({
+        "연도": np.tile(np.asarray(years), len(scenarios)),
+        "경로": np.repeat([scenario_party(s) for s in scenarios], len(years)),
+        "배출량": em.ravel(),
+    })
+
+
+# ---------------------------------------------------------------------#
+# Regression check against the pre‑baked sheet
+# ---------------------------------------------------------------------#
+def sheet_tolerance(path: str, year: int, assumptions: Assumptions = Assumptions()) -> float:
+    """
+    Relative error allowed between the engine and the 온도경로 sheet.
+
+    * Before the NDC year the sheet holds per‑party transition estimates
+      (2020: 697.8 / 679.7 / 667.7 Mt) where the engine draws a straight
+      line from the base year: within 5 %.
+    * 국민의힘 2035: the sheet's 404.0 is 0.85 % below the midpoint of its
+      own 2030 and 2040 values (407.5), while every other pathway is linear
+      there, so no factor choice can close it: within 1.2 %.
+    * Everything else (the anchors and the mix‑driven years, which also
+      carry the sheet's one‑decimal rounding): within 0.5 %.
+    """
+    if year < assumptions.ndc_year:
+        return 0.05
+    if (path, year) == ("국민의힘", 2035):
+        return 0.012
+    return 0.005
+
+
+def compare_to_sheet(temp_df: pd.DataFrame, computed: pd.DataFrame) -> pd.DataFrame:
+    """
+    Sheet vs engine for every (경로, 연도) both have, with the relative
+    error and its ``sheet_tolerance``.
+    """
+    merged = temp_df.merge(computed, on=["연도", "경로"], suffixes=("_sheet", "_model"))
+    denom = merged["배출량_sheet"].abs().clip(lower=1.0)
+    return merged.assign(
+        rel_err=(merged["배출량_model"] - merged["배출량_sheet"]).abs() / denom,
+        tol=[sheet_tolerance(p, y) for p, y in zip(merged["경로"], merged["연도"])])
+
+
+def main(argv: list[str] | None = None) -> int:
+    import argparse
+    from pathlib import Path
+
+    from dashboard import wrangle
+    from dashboard.workbook import LazyWorkbook
+
+    default = Path(__file__).resolve().parent.parent / "data" / "climate_data.xlsx"
+    ap = argparse.ArgumentParser(description="Emissions pathway engine.")
+    ap.add_argument("workbook", nargs="?", type=Path, default=default)
+    ap.add_argument("--check", action="store_true",
+                    help="compare against the 온도경로 sheet; fail outside sheet_tolerance")
+    args = ap.parse_args(argv)
+
+    wb = LazyWorkbook(args.workbook)
+    energy_df = wrangle.tidy_energy(wb[wb.find(["에너지믹스"])])
+    computed = compute_pathways(energy_df)
+    if not args.check:
+        print(computed.pivot(index="연도", columns="경로", values="배출량").round(1))
+        return 0
+
+    temp_df = wrangle.tidy_temperature(wb[wb.find(["온도경로"])])
+    cmp = compare_to_sheet(temp_df, computed)
+    print(cmp.round(3).to_string(index=False))
+    over = cmp[cmp["rel_err"] > cmp["tol"]]
+    print(f"\nmax relative error {cmp['rel_err'].max():.2%}; "
+          f"{len(over)} of {len(cmp)} points outside their tolerance")
+    return 0 if over.empty else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
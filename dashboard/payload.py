@@ -0,0 +1,164 @@
+"""Compact Plotly payloads for the browser.
+
+``st.plotly_chart`` ships a figure as Plotly JSON. Plotly already sends
+NumPy arrays as base64 typed arrays, but at the dtype it was given (float64)
+and every trace repeats its category labels in full; the chart template
+carries defaults for some forty trace types the figure doesn't use.
+``compact`` rewrites a built figure so that
+
+* float arrays are sent as float32 – or as the narrowest integer type when
+  every value is whole – which is more precision than any chart here
+  displays; evenly spaced coordinates (years on a regular grid) are sent
+  as a start and a step, not an array per trace;
+* a trace whose labels on a categorical axis are a consecutive run of that
+  axis's categories (in either direction) is sent as ``x0``/``dx`` (or ``y0``/``dy``) and the
+  labels go once into the axis's ``categoryarray``, so adding scenarios or
+  pathways adds numbers, not another copy of every label;
+* ``layout.template.data`` keeps only the trace types the figure draws.
+
+The figure looks the same: category order is pinned to the order Plotly
+would have used, and template entries only ever apply to their own trace
+type. Long per‑point text (policy descriptions) is not inlined at all;
+``app.py`` looks it up when a point is selected.
+"""
+from __future__ import annotations
+
+import base64
+
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
+
+# Trace types that accept x0/dx, y0/dy in place of x, y
+COORDINATE_TRACES = {"bar", "scatter", "scattergl"}
+
+_INT_TYPES = [(np.int8, "i1"), (np.int16, "i2"), (np.int32, "i4")]
+_DTYPES = {"i1": np.int8, "u1": np.uint8, "i2": np.int16, "u2": np.uint16,
+           "i4": np.int32, "u4": np.uint32, "f4": np.float32, "f8": np.float64}
+
+
+def _typed(values: np.ndarray) -> dict:
+    """Plotly.js typed‑array spec of a 1‑ or 2‑D float array, narrowed."""
+    finite = values[np.isfinite(values)]
+    if len(finite) == len(values.ravel()) and np.array_equal(finite, np.round(finite)):
+        lo, hi = (finite.min(), finite.max()) if len(finite) else (0, 0)
+        for int_type, code in _INT_TYPES:
+            info = np.iinfo(int_type)
+            if info.min <= lo and hi <= info.max:
+                out, dtype = values.astype(int_type), code
+                break
+        else:
+            out, dtype = values.astype(np.float32), "f4"
+    else:
+        out, dtype = values.astype(np.float32), "f4"
+    spec = {"dtype": dtype, "bdata": base64.b64encode(np.ascontiguousarray(out)).decode("ascii")}
+    if out.ndim > 1:
+        spec["shape"] = ", ".join(map(str, out.shape))
+    return spec
+
+
+def _step(values: np.ndarray) -> float | None:
+    """The common difference of an evenly spaced array, else ``None``."""
+    if values.ndim != 1 or len(values) < 3:
+        return None
+    diff = np.diff(values.astype(float))
+    step = diff[0]
+    if step == 0 or not np.isfinite(step) or not np.allclose(diff, step, rtol=1e-9, atol=0):
+        return None
+    return float(step)
+
+
+def as_array(value) -> np.ndarray | None:
+    """``value`` as an array if it is one or a typed‑array spec, else ``None``."""
+    if isinstance(value, np.ndarray):
+        return value
+    if isinstance(value, dict) and "bdata" in value:
+        values = np.frombuffer(base64.b64decode(value["bdata"]), dtype=_DTYPES[value["dtype"]])
+        if "shape" in value:
+            values = values.reshape([int(n) for n in str(value["shape"]).split(",")])
+        return values
+    return None
+
+
+def _encode_numbers(trace: dict) -> None:
+    for name in ("x", "y", "z", "customdata"):
+        values = as_array(trace.get(name))
+        if values is None or not values.size or values.dtype.kind not in "iuf":
+            continue
+        step = _step(values) if name in "xy" and trace["type"] in COORDINATE_TRACES else None
+        if step is not None:
+            trace[f"{name}0"] = values[0].item()
+            trace[f"d{name}"] = int(step) if step.is_integer() else step
+            del trace[name]
+        elif values.dtype == np.float64:
+            trace[name] = _typed(values)
+
+
+def _axis_name(trace: dict, letter: str) -> str:
+    ref = trace.get(f"{letter}axis") or letter
+    return f"{letter}axis{ref[1:]}"
+
+
+def _labels(trace: dict, letter: str) -> list[str] | None:
+    values = trace.get(letter)
+    if values is None or isinstance(values, dict) or len(values) == 0:
+        return None
+    values = list(values)
+    return values if all(isinstance(v, str) for v in values) else None
+
+
+def _dedupe_categories(spec: dict) -> None:
+    layout = spec["layout"]
+    for letter in ("x", "y"):
+        axes: dict[str, list] = {}       # axis name → [(trace, labels)]
+        mixed = set()                    # axes that also carry numbers or dates
+        for trace in spec["data"]:
+            if trace["type"] not in COORDINATE_TRACES:
+                continue
+            labels = _labels(trace, letter)
+            if labels is not None:
+                axes.setdefault(_axis_name(trace, letter), []).append((trace, labels))
+            elif trace.get(letter) is not None:
+                mixed.add(_axis_name(trace, letter))
+        for axis_name, traces in axes.items():
+            axis = layout.setdefault(axis_name, {})
+            if axis_name in mixed or axis.get("categoryorder") not in (None, "trace", "array"):
+                continue                  # sorted by value: leave it to Plotly
+            order = list(axis.get("categoryarray", [])) if axis.get("categoryorder") else []
+            seen = set(order)
+            for _, labels in traces:      # Plotly's "trace" order: first appearance
+                for label in labels:
+                    if label not in seen:
+                        seen.add(label)
+                        order.append(label)
+            position = {label: i for i, label in enumerate(order)}
+            axis.update(type="category", categoryorder="array", categoryarray=order)
+            for trace, labels in traces:
+                start, end = position[labels[0]], position[labels[-1]]
+                step = 1 if end >= start else -1   # px lists horizontal bars top‑down
+                if labels == order[start:end + step if end + step >= 0 else None:step]:
+                    del trace[letter]
+                    trace[f"{letter}0"], trace[f"d{letter}"] = labels[0], step
+
+
+def _prune_template(spec: dict) -> None:
+    template = spec["layout"].get("template", {})
+    if "data" in template:
+        used = {trace["type"] for trace in spec["data"]}
+        template["data"] = {kind: specs for kind, specs in template["data"].items()
+                            if kind in used}
+
+
+def compact(fig: go.Figure) -> go.Figure:
+    """A copy of ``fig`` with the smaller encoding described above."""
+    spec = fig.to_dict()
+    _dedupe_categories(spec)
+    for trace in spec["data"]:
+        _encode_numbers(trace)
+    _prune_template(spec)
+    return go.Figure(spec)
+
+
+def nbytes(fig: go.Figure) -> int:
+    """Size of ``fig`` as Streamlit sends it (Plotly JSON, UTF‑8)."""
+    return len(pio.to_json(fig, validate=False).encode("utf-8"))
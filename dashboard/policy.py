@@ -0,0 +1,117 @@
+"""One indexed store for the policy sheets of every election cycle.
+
+Each ``policy_*`` sheet is normalised once (``wrangle.normalize_policy``)
+and stacked into a single long frame with categorical ``cycle`` / ``party``
+/ ``category`` columns, indexed and sorted on (cycle, party, category).
+Lookups by any prefix of that key are binary searches on the sorted index,
+so cross‑cycle questions – "how did each party's 재생에너지 level change
+2022→2025" – cost O(log n + result) however many cycles, regions or local
+elections end up in the store.
+
+The per‑cycle frames in sheet order (what ``charts.policy_scatter``
+draws) are kept alongside, so the scatter tabs read them without a filter.
+"""
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+import pandas as pd
+
+from dashboard.constants import PARTY_COLORS
+from dashboard.wrangle import POLICY_COLUMNS, normalize_policy
+
+
+@dataclass(frozen=True)
+class Cycle:
+    label: str   # shown in the UI and used as the ``cycle`` value
+    sheet: str   # workbook sheet
+    title: str   # policy scatter title
+
+
+# Oldest first; this is also the order of the ``cycle`` categorical
+CYCLES = [
+    Cycle("2022 대선", "policy_2022_prev", "2022 대선 정책 강도 분포"),
+    Cycle("2024 총선", "policy_2024_총선", "지난 총선 정책 강도 분포"),
+    Cycle("2025 대선", "policy_2025", "2025 대선 정책 강도 분포"),
+]
+
+KEY = ["cycle", "party", "category"]
+
+
+def cycle(label: str) -> Cycle:
+    return next(c for c in CYCLES if c.label == label)
+
+
+class PolicyStore:
+    """Read‑only long frame of every cycle's policies, indexed on ``KEY``."""
+
+    def __init__(self, frames: Mapping[str, pd.DataFrame]):
+        """``frames``: cycle label → normalised policy frame, oldest first."""
+        self._by_cycle = {label: df for label, df in frames.items() if not df.empty}
+        self.cycles = list(self._by_cycle)
+
+        if self._by_cycle:
+            long = pd.concat([df.assign(cycle=label) for label, df in self._by_cycle.items()],
+                             ignore_index=True)
+        else:
+            long = pd.DataFrame(columns=POLICY_COLUMNS + ["cycle"])
+        parties = pd.unique(long["party"])
+        known = [p for p in PARTY_COLORS if p in set(parties)]
+        long = long.assign(
+            cycle=pd.Categorical(long["cycle"], categories=self.cycles, ordered=True),
+            party=pd.Categorical(long["party"],
+                                 categories=known + [p for p in parties if p not in known]),
+            category=pd.Categorical(long["category"], categories=pd.unique(long["category"])),
+            level=pd.to_numeric(long["level"], errors="coerce"),
+        )
+        self.frame = long.set_index(KEY).sort_index()
+
+    @classmethod
+    def from_sheets(cls, sheets: Mapping[str, pd.DataFrame],
+                    cycles: list[Cycle] = CYCLES) -> PolicyStore:
+        """Build from a sheet mapping (e.g. ``LazyWorkbook``); absent sheets are skipped."""
+        names = set(sheets)
+        return cls({c.label: normalize_policy(sheets[c.sheet])
+                    for c in cycles if c.sheet in names})
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    # -- lookups -----------------------------------------------------------
+    def cycle_frame(self, label: str) -> pd.DataFrame:
+        """One cycle in sheet order with ``POLICY_COLUMNS`` (empty if absent)."""
+        return self._by_cycle.get(label, pd.DataFrame(columns=POLICY_COLUMNS))
+
+    def query(self, cycle=None, party=None, category=None) -> pd.DataFrame:
+        """
+        Rows matching the given keys; each may be a value, a list or ``None``
+        (any). Unknown keys give an empty frame rather than ``KeyError``.
+        """
+        key = tuple(slice(None) if k is None else k for k in (cycle, party, category))
+        try:
+            return self.frame.loc[key, :]
+        except KeyError:
+            return self.frame.iloc[:0]
+
+    def parties(self, cycle: str | None = None) -> list[str]:
+        idx = self.query(cycle=cycle).index
+        return list(idx.get_level_values("party").unique())
+
+    def categories(self, cycle: str | None = None) -> list[str]:
+        idx = self.query(cycle=cycle).index
+        return list(idx.get_level_values("category").unique())
+
+    def level_change(self, old: str, new: str, category=None) -> pd.DataFrame:
+        """
+        Per (party, category): ``level_old``, ``level_new`` and ``change``
+        between two cycles. Pairs present in only one cycle keep NaN on the
+        other side; a pair listed more than once in a cycle (one party,
+        several rows for a category) counts with its mean level.
+        """
+        a, b = (self.query(cycle=c, category=category)["level"]
+                .groupby(level=["party", "category"], observed=True, sort=False).mean()
+                for c in (old, new))
+        out = pd.concat({"level_old": a, "level_new": b}, axis=1)
+        out["change"] = out["level_new"] - out["level_old"]
+        return out.reset_index()
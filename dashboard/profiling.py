@@ -0,0 +1,119 @@
+"""Per‑stage wall time and memory of one pass through the pipeline.
+
+The dashboard's work splits into four stages – **load** (sheets from the
+snapshot or Excel), **wrangle** (tidy frames), **figure** (Plotly builders)
+and **serialize** (figure → JSON for the browser). ``Profiler`` records
+each separately; ``app.py`` keeps one per rerun for the opt‑in profiling
+panel and ``benchmarks/pipeline.py`` uses the same class, so numbers from
+the panel and from the benchmark suite mean the same thing.
+
+Stage times are *exclusive*: a stage nested in another is subtracted from
+the outer one, so the stages of a run sum to its total. Memory is the change in resident set size, which is cheap
+to read but includes allocator noise; treat small deltas as zero.
+"""
+from __future__ import annotations
+
+import os
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+import pandas as pd
+
+STAGES = ["load", "wrangle", "figure", "serialize"]
+
+
+def rss_bytes(pid: int | str = "self") -> int | None:
+    """
+    Current resident set size of this process (or of ``pid``), or ``None``
+    where it can't be read cheaply.
+    """
+    try:
+        with open(f"/proc/{pid}/statm") as fh:
+            return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        if pid != "self":
+            return None
+    try:  # peak, not current, outside Linux – still useful for trends
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if os.uname().sysname == "Darwin" else peak * 1024
+    except (ImportError, AttributeError):
+        return None
+
+
+def cpu_seconds(pid: int | str = "self") -> float | None:
+    """User + system CPU time of this process (or of ``pid``) so far."""
+    try:
+        with open(f"/proc/{pid}/stat") as fh:
+            fields = fh.read().rsplit(")", 1)[1].split()
+        return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return time.process_time() if pid == "self" else None
+
+
+@dataclass
+class StageStats:
+    seconds: float = 0.0
+    rss_delta: int = 0
+    calls: int = 0
+
+
+class Profiler:
+    """Accumulates ``StageStats`` per stage name; a no‑op when disabled."""
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.stages: dict[str, StageStats] = {}
+        self.payload_bytes = 0      # figure JSON sent to the browser, see app.show
+        self._open: list[tuple[str, list[float]]] = []   # (name, [nested seconds])
+        self._t0 = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time the block as ``name`` (exclusive of nested stages)."""
+        if not self.enabled:
+            yield
+            return
+        nested = [0.0]
+        self._open.append((name, nested))
+        t0, m0 = time.perf_counter(), rss_bytes()
+        try:
+            yield
+        finally:
+            dt = time.perf_counter() - t0
+            m1 = rss_bytes()
+            self._open.pop()
+            self._record(name, dt - nested[0],
+                         m1 - m0 if m0 is not None and m1 is not None else 0)
+            if self._open:
+                self._open[-1][1][0] += dt
+
+    def add(self, name: str, seconds: float) -> None:
+        """Record time measured elsewhere (e.g. ``LazyWorkbook.timings``)."""
+        if not self.enabled or seconds <= 0:
+            return
+        self._record(name, seconds, 0)
+
+    def _record(self, name: str, seconds: float, rss_delta: int) -> None:
+        s = self.stages.setdefault(name, StageStats())
+        s.seconds += seconds
+        s.rss_delta += rss_delta
+        s.calls += 1
+
+    @property
+    def total(self) -> float:
+        """Wall time since the profiler was created."""
+        return time.perf_counter() - self._t0
+
+    def frame(self) -> pd.DataFrame:
+        """One row per stage (known stages first): ms, calls, ΔRSS MB."""
+        names = [s for s in STAGES if s in self.stages]
+        names += [s for s in self.stages if s not in names]
+        return pd.DataFrame({
+            "stage": names,
+            "ms": [round(self.stages[s].seconds * 1e3, 1) for s in names],
+            "calls": [self.stages[s].calls for s in names],
+            "rss_mb": [round(self.stages[s].rss_delta / 2**20, 2) for s in names],
+        })
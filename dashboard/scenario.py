@@ -0,0 +1,70 @@
+"""Incremental state for the interactive scenario builder.
+
+A custom scenario is a TWh value per energy source. Its power emissions are
+a sum of per‑source contributions, and the engine's pathway is affine in
+power (``pathways.pathway_array`` interpolates linearly between anchors),
+so the whole pathway is ``p0 + power × dp`` for two vectors computed once.
+Moving one slider therefore costs one multiply for that source plus one
+vector update – nothing else in the data pipeline is touched.
+"""
+from __future__ import annotations
+
+from collections.abc import Mapping
+
+import numpy as np
+import pandas as pd
+
+from dashboard.pathways import (Assumptions, PathwaySpec, factor_vector,
+                                pathway_array)
+
+
+class IncrementalScenario:
+    """Per‑source TWh with O(1) updates of power emissions and the pathway."""
+
+    def __init__(self, sources: list[str], factors: Mapping[str, float] | None = None,
+                 spec: PathwaySpec = PathwaySpec(), years: np.ndarray | None = None,
+                 assumptions: Assumptions = Assumptions()):
+        self.sources = list(sources)
+        self.spec = spec
+        self.years = (np.arange(assumptions.base_year, assumptions.end_year + 1)
+                      if years is None else np.asarray(years))
+        self._factor = dict(zip(self.sources, factor_vector(self.sources, factors)))
+        self.twh = dict.fromkeys(self.sources, 0.0)
+        self._contrib = dict.fromkeys(self.sources, 0.0)
+        self.power = 0.0
+        self.recomputed: list[str] = []   # sources touched by the last update
+
+        # pathway(power) = p0 + power * dp; evaluated at power 0 and 1 Mt
+        unit = np.ones(1)
+        p = pathway_array(np.array([[0.0], [1.0]]), unit, [spec, spec],
+                          self.years, assumptions)
+        self._p0, self._dp = p[0], p[1] - p[0]
+
+    def set(self, source: str, twh: float) -> bool:
+        """Set one source; returns ``False`` (and does nothing) if unchanged."""
+        if self.twh[source] == twh:
+            return False
+        contrib = twh * self._factor[source]
+        self.power += contrib - self._contrib[source]
+        self._contrib[source] = contrib
+        self.twh[source] = twh
+        return True
+
+    def update(self, values: Mapping[str, float]) -> list[str]:
+        """Apply many slider values; only the changed ones are recomputed."""
+        self.recomputed = [s for s, v in values.items() if self.set(s, float(v))]
+        return self.recomputed
+
+    @property
+    def pathway(self) -> np.ndarray:
+        """Total emissions (MtCO₂eq) per year in ``years``."""
+        return self._p0 + self.power * self._dp
+
+    def mix_frame(self, name: str, value_col: str = "발전량") -> pd.DataFrame:
+        """The mix in the tidy 에너지믹스 layout, for ``charts.stacked_mix``."""
+        return pd.DataFrame({"에너지원": self.sources, "시나리오": name,
+                             value_col: [self.twh[s] for s in self.sources]})
+
+    def pathway_frame(self, name: str) -> pd.DataFrame:
+        """The pathway in the tidy 온도경로 layout (연도, 경로, 배출량)."""
+        return pd.DataFrame({"연도": self.years, "경로": name, "배출량": self.pathway})
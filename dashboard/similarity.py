@@ -0,0 +1,248 @@
+"""How close parties are to each other on climate policy.
+
+Every party becomes a vector of its policy ``level`` per (cycle, category)
+from the ``PolicyStore``; a pledge that is missing (the 'x' in the policy
+scatter) is NaN and simply left out. The distance between two parties is
+the root‑mean‑square level difference over the (cycle, category) pairs
+*both* have a level for, so parties that ran in different cycles are
+compared on what they share.
+
+With masks ``W`` (1 where a level exists) and levels ``X`` (0 where not),
+the squared differences and the counts over shared entries are
+
+    X²Wᵀ + W(X²)ᵀ − 2XXᵀ        and        WWᵀ
+
+– four matrix products, computed in row blocks so memory stays at
+``block × parties`` per temporary however many regional candidates are
+added. Levels are small integers, so the float32 sums are exact.
+
+Parties are then grouped by average‑linkage (UPGMA) hierarchical
+clustering in NumPy – one vectorised row update per merge, with each row's
+nearest neighbour cached – giving a SciPy‑style linkage matrix, the leaf
+order used for the heatmap, and flat clusters for any cluster count.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from dashboard.policy import PolicyStore
+
+DEFAULT_CLUSTERS = 3
+
+# A pair needs this many shared (cycle, category) levels to get a distance
+MIN_OVERLAP = 3
+
+# Beyond this many parties the heatmap shows clusters instead of parties
+HEATMAP_MAX = 200
+
+
+def level_matrix(store: PolicyStore) -> tuple[list[str], pd.MultiIndex, np.ndarray]:
+    """(parties, (cycle, category) features, party × feature levels with NaN)."""
+    frame = store.frame
+    if frame.empty:
+        return [], pd.MultiIndex.from_tuples([], names=["cycle", "category"]), \
+            np.empty((0, 0), np.float32)
+    idx = frame.index
+    party_codes, party_of = np.unique(idx.codes[1], return_inverse=True)
+    n_cat = len(idx.levels[2])
+    feature_codes, feature_of = np.unique(idx.codes[0].astype(np.int64) * n_cat + idx.codes[2],
+                                          return_inverse=True)
+    levels = np.full((len(party_codes), len(feature_codes)), np.nan, np.float32)
+    levels[party_of, feature_of] = frame["level"].to_numpy(dtype=np.float32, na_value=np.nan)
+    features = pd.MultiIndex.from_arrays(
+        [idx.levels[0][feature_codes // n_cat], idx.levels[2][feature_codes % n_cat]],
+        names=["cycle", "category"])
+    return list(idx.levels[1][party_codes]), features, levels
+
+
+def distance_matrix(levels: np.ndarray, min_overlap: int = MIN_OVERLAP,
+                    block: int = 1024) -> tuple[np.ndarray, np.ndarray]:
+    """
+    NaN‑aware RMS level difference between every pair of rows, and the
+    number of columns each pair shares. Pairs sharing fewer than
+    ``min_overlap`` columns get NaN.
+    """
+    observed = ~np.isnan(levels)
+    w = observed.astype(np.float32)
+    x = np.where(observed, levels, 0).astype(np.float32)
+    x2 = x * x
+    n = len(levels)
+    dist = np.empty((n, n), np.float32)
+    overlap = np.empty((n, n), np.float32)
+    for start in range(0, n, block):
+        rows = slice(start, start + block)
+        shared = w[rows] @ w.T
+        sq = x2[rows] @ w.T
+        sq += w[rows] @ x2.T
+        sq -= 2 * (x[rows] @ x.T)
+        np.maximum(sq, 0, out=sq)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            d = np.sqrt(sq / shared)
+        d[shared < max(min_overlap, 1)] = np.nan
+        dist[rows], overlap[rows] = d, shared
+    return dist, overlap
+
+
+def average_linkage(dist: np.ndarray) -> np.ndarray:
+    """
+    UPGMA over a symmetric distance matrix (NaN = farther than any pair).
+    Returns the (n − 1) × 4 linkage matrix in SciPy's layout: merged ids,
+    distance, size of the new cluster (ids ≥ n are earlier merges).
+    """
+    n = len(dist)
+    if n < 2:
+        return np.empty((0, 4))
+    d = np.array(dist, dtype=np.float64)
+    finite = d[np.isfinite(d)]
+    d[~np.isfinite(d)] = finite.max() if finite.size else 0.0
+    np.fill_diagonal(d, np.inf)
+    size = np.ones(n)
+    cluster_id = np.arange(n)
+    nearest = d.argmin(axis=1)
+    nearest_d = d[np.arange(n), nearest]
+    z = np.empty((n - 1, 4))
+    for step in range(n - 1):
+        i = int(nearest_d.argmin())
+        j = int(nearest[i])
+        if cluster_id[i] > cluster_id[j]:
+            i, j = j, i
+        z[step] = (cluster_id[i], cluster_id[j], d[i, j], size[i] + size[j])
+
+        # Lance–Williams for average linkage; slot i becomes the new cluster
+        merged = (size[i] * d[i] + size[j] * d[j]) / (size[i] + size[j])
+        d[i], d[:, i] = merged, merged
+        d[j], d[:, j] = np.inf, np.inf
+        d[i, i] = np.inf
+        size[i] += size[j]
+        cluster_id[i] = n + step
+        nearest_d[j] = np.inf
+
+        # rows whose nearest neighbour was i or j may now be farther away
+        stale = np.flatnonzero((nearest == i) | (nearest == j))
+        stale = stale[np.isfinite(nearest_d[stale])]
+        nearest[stale] = d[stale].argmin(axis=1)
+        nearest_d[stale] = d[stale, nearest[stale]]
+        closer = merged < nearest_d
+        nearest[closer], nearest_d[closer] = i, merged[closer]
+        nearest[i] = d[i].argmin()
+        nearest_d[i] = d[i, nearest[i]]
+    return z
+
+
+def leaf_order(z: np.ndarray) -> np.ndarray:
+    """Leaves of the linkage tree left to right (the dendrogram order)."""
+    n = len(z) + 1
+    if n == 1:
+        return np.zeros(1, dtype=np.int64)
+    out, stack = [], [2 * n - 2]
+    while stack:
+        node = stack.pop()
+        if node < n:
+            out.append(node)
+        else:
+            a, b = z[node - n, :2].astype(np.int64)
+            stack += [b, a]
+    return np.array(out)
+
+
+def flat_clusters(z: np.ndarray, k: int) -> np.ndarray:
+    """Cluster number (1‥k, in leaf order) of each leaf when the tree is cut into ``k``."""
+    n = len(z) + 1
+    k = min(max(k, 1), n)
+    root = np.arange(2 * n - 1)          # union–find over leaves and merges
+
+    def find(a: int) -> int:
+        while root[a] != a:
+            root[a] = root[root[a]]
+            a = root[a]
+        return a
+
+    for step in range(n - k):
+        a, b = z[step, :2].astype(np.int64)
+        root[find(a)] = n + step
+        root[find(b)] = n + step
+    heads = np.array([find(i) for i in range(n)])
+    labels = np.empty(n, dtype=np.int64)
+    numbering: dict[int, int] = {}
+    for leaf in leaf_order(z):
+        labels[leaf] = numbering.setdefault(int(heads[leaf]), len(numbering) + 1)
+    return labels
+
+
+@dataclass(frozen=True)
+class PartySimilarity:
+    """Distances, shared‑pledge counts and the clustering of every party."""
+    parties: list[str]
+    distance: np.ndarray       # RMS level difference, NaN = too little overlap
+    overlap: np.ndarray        # shared (cycle, category) levels per pair
+    linkage: np.ndarray
+
+    @classmethod
+    def from_store(cls, store: PolicyStore, min_overlap: int = MIN_OVERLAP) -> PartySimilarity:
+        parties, _, levels = level_matrix(store)
+        dist, overlap = distance_matrix(levels, min_overlap)
+        for a in (dist, overlap):
+            a.flags.writeable = False
+        return cls(parties, dist, overlap, average_linkage(dist))
+
+    def __len__(self) -> int:
+        return len(self.parties)
+
+    @property
+    def order(self) -> np.ndarray:
+        return leaf_order(self.linkage) if len(self) > 1 else np.arange(len(self))
+
+    def frame(self) -> pd.DataFrame:
+        """Distance matrix as a party × party frame, in clustering order."""
+        order = self.order
+        names = [self.parties[i] for i in order]
+        return pd.DataFrame(self.distance[np.ix_(order, order)], index=names, columns=names)
+
+    def clusters(self, k: int = DEFAULT_CLUSTERS) -> pd.Series:
+        """Cluster number per party (in clustering order) for ``k`` clusters."""
+        if len(self) < 2:
+            return pd.Series(1, index=self.parties, name="cluster", dtype=np.int64)
+        labels = flat_clusters(self.linkage, k)
+        order = self.order
+        return pd.Series(labels[order], index=[self.parties[i] for i in order], name="cluster")
+
+    def cluster_distance(self, k: int = DEFAULT_CLUSTERS) -> pd.DataFrame:
+        """Mean distance between the members of every two clusters (k × k)."""
+        labels = self.clusters(k).reindex(self.parties).to_numpy() - 1
+        onehot = np.eye(labels.max() + 1 if len(labels) else 0, dtype=np.float64)[labels]
+        known = np.isfinite(self.distance)
+        sums = onehot.T @ np.where(known, self.distance, 0) @ onehot
+        counts = onehot.T @ known.astype(np.float64) @ onehot
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = sums / counts
+        names = [f"클러스터 {c}" for c in range(1, len(mean) + 1)]
+        return pd.DataFrame(mean, index=names, columns=names)
+
+    def closest(self, n: int = 10, block: int = 1024) -> pd.DataFrame:
+        """The ``n`` closest pairs: party_a, party_b, distance, shared."""
+        m = len(self)
+        cand_i, cand_j, cand_d = [], [], []
+        for start in range(0, m, block):
+            rows = np.arange(start, min(start + block, m))
+            d = np.where(np.isnan(self.distance[rows]), np.inf, self.distance[rows])
+            d[np.arange(m)[None, :] <= rows[:, None]] = np.inf     # upper triangle only
+            flat = d.ravel()
+            take = min(n, flat.size)
+            if take == 0:
+                continue
+            best = np.argpartition(flat, take - 1)[:take]
+            best = best[np.isfinite(flat[best])]
+            cand_i.append(rows[best // m])
+            cand_j.append(best % m)
+            cand_d.append(flat[best])
+        if not cand_d:
+            return pd.DataFrame(columns=["party_a", "party_b", "distance", "shared"])
+        i, j, d = (np.concatenate(c) for c in (cand_i, cand_j, cand_d))
+        top = np.lexsort((j, i, d))[:n]
+        i, j = i[top], j[top]
+        names = np.array(self.parties, dtype=object)
+        return pd.DataFrame({"party_a": names[i], "party_b": names[j],
+                             "distance": d[top], "shared": self.overlap[i, j].astype(np.int64)})
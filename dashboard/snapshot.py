@@ -0,0 +1,325 @@
+"""Persistent columnar snapshot of the Excel workbook.
+
+``@st.cache_data`` only lives as long as the Streamlit process, so every new
+worker pays the full openpyxl parse of ``climate_data.xlsx``. This module
+keeps an Arrow IPC (Feather v2) copy of every sheet next to the workbook,
+keyed on the workbook's size/mtime and SHA‑256. Later cold starts
+memory‑map those files instead of re‑parsing XML; a stale or missing
+snapshot silently falls back to the Excel path.
+
+Build the snapshot ahead of time (e.g. during the image build)::
+
+    python -m dashboard.snapshot data/climate_data.xlsx
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+try:  # pyarrow is only needed for the snapshot; Excel still works without it
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:  # pragma: no cover - depends on the environment
+    pa = None
+    feather = None
+
+log = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 2
+MANIFEST_NAME = "manifest.json"
+
+
+# ---------------------------------------------------------------------#
+# Fingerprint
+# ---------------------------------------------------------------------#
+def file_sha256(path: Path, chunk_size: int = 1 << 20) -> str:
+    """Return the hex SHA‑256 of a file, read in chunks."""
+    h = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def snapshot_dir(path: Path) -> Path:
+    """Directory holding the snapshot of ``path`` (``data/.<stem>.snapshot``)."""
+    return path.parent / f".{path.stem}.snapshot"
+
+
+def _stat_key(path: Path) -> dict:
+    st = path.stat()
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+# ---------------------------------------------------------------------#
+# Excel path
+# ---------------------------------------------------------------------#
+def read_excel_sheets(path: Path) -> dict[str, pd.DataFrame]:
+    """Read every sheet in an Excel file into a dict of DataFrames."""
+    xls = pd.ExcelFile(path)
+    return {name: pd.read_excel(xls, sheet_name=name) for name in xls.sheet_names}
+
+
+# ---------------------------------------------------------------------#
+# Snapshot read / write
+# ---------------------------------------------------------------------#
+def _read_manifest(path: Path) -> dict | None:
+    try:
+        with open(snapshot_dir(path) / MANIFEST_NAME, encoding="utf-8") as fh:
+            manifest = json.load(fh)
+    except (OSError, ValueError):
+        return None
+    if manifest.get("version") != SNAPSHOT_VERSION:
+        return None
+    return manifest
+
+
+def is_fresh(path: Path, manifest: dict | None = None) -> bool:
+    """
+    True if the snapshot matches the workbook on disk.
+    Size + mtime is checked first; on mismatch the content hash decides, so a
+    ``touch`` or a fresh git checkout does not invalidate an identical file.
+    A hash match records the new size + mtime in the manifest, so the file
+    is only hashed once after such a change, not on every later check.
+    """
+    manifest = manifest if manifest is not None else _read_manifest(path)
+    if manifest is None or not path.exists():
+        return False
+    stat = _stat_key(path)
+    if manifest.get("stat") == stat:
+        return True
+    if manifest.get("sha256") != file_sha256(path):
+        return False
+    manifest["stat"] = stat
+    try:
+        _write_manifest(snapshot_dir(path), manifest)
+    except OSError as exc:   # read‑only data dir: still fresh, hashed again next time
+        log.warning("snapshot: manifest stat not updated for %s (%s)", path.name, exc)
+    return True
+
+
+def _sheet_file(name: str, sha256: str) -> str:
+    # Sheet names are free‑form (Korean, spaces, slashes); hash them for a
+    # filename. The workbook version is part of it, so a file never changes
+    # once written: a worker still on an older manifest reads that version.
+    return f"{hashlib.sha1(name.encode('utf-8')).hexdigest()[:12]}.{sha256[:16]}.arrow"
+
+
+def _write_sheet(directory: Path, name: str, df: pd.DataFrame, sha256: str) -> dict:
+    """
+    Write one sheet of workbook version ``sha256`` as an uncompressed
+    Feather file; return its manifest entry.
+    """
+    fname = _sheet_file(name, sha256)
+    # Arrow needs string column names; keep the originals in the manifest
+    table = pa.Table.from_pandas(
+        df.set_axis([str(c) for c in df.columns], axis=1),
+        preserve_index=False,
+    )
+    tmp = directory / f".{fname}.{os.getpid()}.tmp"
+    feather.write_feather(table, tmp, compression="uncompressed")
+    os.replace(tmp, directory / fname)
+    return {"name": name, "file": fname,
+            "columns": [c if isinstance(c, (int, float)) else str(c)
+                        for c in df.columns]}
+
+
+def _write_manifest(directory: Path, manifest: dict) -> None:
+    tmp = directory / f".{MANIFEST_NAME}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump(manifest, fh, ensure_ascii=False, indent=1)
+    os.replace(tmp, directory / MANIFEST_NAME)
+
+
+def _new_manifest(path: Path, sheet_names: list[str], sha256: str | None) -> dict:
+    return {
+        "version": SNAPSHOT_VERSION,
+        "source": path.name,
+        "sha256": sha256 or file_sha256(path),
+        "stat": _stat_key(path),
+        "sheet_names": list(sheet_names),
+        "sheets": [],
+    }
+
+
+def open_manifest(path: Path) -> dict | None:
+    """Return the snapshot manifest if it is fresh for ``path``, else ``None``."""
+    if pa is None:
+        return None
+    manifest = _read_manifest(path)
+    return manifest if is_fresh(path, manifest) else None
+
+
+def write_snapshot(path: Path, sheets: dict[str, pd.DataFrame],
+                   sha256: str | None = None) -> Path | None:
+    """
+    Write ``sheets`` as the snapshot of ``path``; return the snapshot dir.
+    The directory is built in a temp dir and swapped in with a rename so
+    concurrent workers never see a half‑written snapshot. Returns ``None``
+    (and leaves any old snapshot alone) if pyarrow is missing, a sheet can't
+    be represented in Arrow, or the data directory is read‑only.
+    """
+    if pa is None:
+        return None
+
+    target = snapshot_dir(path)
+    try:
+        tmp = Path(tempfile.mkdtemp(prefix=target.name + ".", dir=path.parent))
+        tmp.chmod(0o755)  # mkdtemp is 0700; other workers must read it
+    except OSError as exc:
+        log.warning("snapshot: cannot write next to %s (%s)", path, exc)
+        return None
+
+    try:
+        manifest = _new_manifest(path, list(sheets), sha256)
+        manifest["sheets"] = [_write_sheet(tmp, name, df, manifest["sha256"])
+                              for name, df in sheets.items()]
+        _write_manifest(tmp, manifest)
+
+        old = target.with_name(target.name + ".old")
+        shutil.rmtree(old, ignore_errors=True)
+        if target.exists():
+            target.rename(old)
+        tmp.rename(target)
+        shutil.rmtree(old, ignore_errors=True)
+        return target
+    except (OSError, pa.ArrowException, TypeError, ValueError, OverflowError) as exc:
+        log.warning("snapshot: not written for %s (%s)", path.name, exc)
+        return None
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def add_snapshot_sheet(path: Path, name: str, df: pd.DataFrame,
+                       sheet_names: list[str]) -> bool:
+    """
+    Add a single parsed sheet to the snapshot of ``path``.
+    Used by the lazy registry so sheets reach the snapshot as they are first
+    read, without parsing the rest of the workbook. A stale manifest is
+    replaced by a fresh one; concurrent writers may drop each other's entry,
+    which only costs a re‑parse later. Returns ``True`` on success.
+    """
+    if pa is None:
+        return False
+
+    target = snapshot_dir(path)
+    try:
+        target.mkdir(exist_ok=True)
+        manifest = open_manifest(path) or _new_manifest(path, sheet_names, None)
+        entry = _write_sheet(target, name, df, manifest["sha256"])
+        manifest["sheets"] = [e for e in manifest["sheets"] if e["name"] != name]
+        manifest["sheets"].append(entry)
+        _write_manifest(target, manifest)
+        return True
+    except (OSError, pa.ArrowException, TypeError, ValueError, OverflowError) as exc:
+        log.warning("snapshot: sheet %r not cached (%s)", name, exc)
+        return False
+
+
+def carry_snapshot(path: Path, sheet_names: list[str], keep: list[str],
+                   old_sha256: str, sha256: str | None = None) -> dict | None:
+    """
+    Re‑key the snapshot of ``path`` to its new content after an edit,
+    keeping the entries of the ``keep`` sheets (unchanged since the
+    ``old_sha256`` version) and dropping the rest, so those sheets are
+    still memory‑mapped instead of re‑parsed. Their files stay in place;
+    files of versions before ``old_sha256`` are deleted (a worker that
+    still needs one re‑parses the sheet).
+    Returns the new manifest, or ``None`` if there is no snapshot of that
+    version or it can't be rewritten.
+    """
+    if pa is None:
+        return None
+    old = _read_manifest(path)
+    if old is None or old.get("sha256") != old_sha256:
+        return None
+    manifest = _new_manifest(path, sheet_names, sha256)
+    manifest["sheets"] = [e for e in old["sheets"] if e["name"] in set(keep)]
+    directory = snapshot_dir(path)
+    try:
+        _write_manifest(directory, manifest)
+    except OSError as exc:
+        log.warning("snapshot: not carried over for %s (%s)", path.name, exc)
+        return None
+    current = {e["file"] for e in old["sheets"]}
+    for f in directory.glob("*.arrow"):
+        if f.name not in current:
+            try:
+                f.unlink()
+            except OSError:
+                pass
+    return manifest
+
+
+def read_snapshot_sheet(path: Path, entry: dict) -> pd.DataFrame:
+    """
+    Memory‑map one sheet of the snapshot back into a DataFrame. Numeric
+    columns without nulls stay read‑only views of the mapped file (one
+    block per column, nothing copied); a file is never rewritten once its
+    version is in a manifest, so a mapping stays valid after an edit.
+    """
+    table = feather.read_table(snapshot_dir(path) / entry["file"], memory_map=True)
+    df = table.to_pandas(split_blocks=True)
+    if entry["columns"]:
+        df.columns = entry["columns"]
+    return df
+
+
+def load_snapshot(path: Path) -> dict[str, pd.DataFrame] | None:
+    """Return all sheets from a fresh, complete snapshot, or ``None``."""
+    manifest = open_manifest(path)
+    if manifest is None:
+        return None
+    entries = {e["name"]: e for e in manifest["sheets"]}
+    if set(entries) != set(manifest["sheet_names"]):
+        return None  # only partially filled by the lazy registry
+    try:
+        return {name: read_snapshot_sheet(path, entries[name])
+                for name in manifest["sheet_names"]}
+    except (OSError, pa.ArrowException, KeyError) as exc:
+        log.warning("snapshot: unreadable for %s (%s)", path.name, exc)
+        return None
+
+
+# ---------------------------------------------------------------------#
+# CLI
+# ---------------------------------------------------------------------#
+def main(argv: list[str] | None = None) -> int:
+    import argparse
+
+    default = Path(__file__).resolve().parent.parent / "data" / "climate_data.xlsx"
+    ap = argparse.ArgumentParser(description="Precompute the workbook snapshot.")
+    ap.add_argument("workbook", nargs="?", type=Path, default=default)
+    ap.add_argument("--force", action="store_true",
+                    help="rebuild even if the snapshot is fresh")
+    args = ap.parse_args(argv)
+
+    if pa is None:
+        print("pyarrow is not installed; snapshot unavailable", file=sys.stderr)
+        return 1
+    if not args.workbook.exists():
+        print(f"{args.workbook} does not exist", file=sys.stderr)
+        return 1
+    if not args.force and load_snapshot(args.workbook) is not None:
+        print(f"snapshot up to date: {snapshot_dir(args.workbook)}")
+        return 0
+
+    sheets = read_excel_sheets(args.workbook)
+    out = write_snapshot(args.workbook, sheets)
+    if out is None:
+        print("snapshot could not be written (see log)", file=sys.stderr)
+        return 1
+    print(f"snapshot written: {out} ({len(sheets)} sheets)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+"""Process‑wide, read‑only frames shared by every session.
+
+``st.cache_data`` hands each caller its own copy: a hit unpickles the
+cached frame again, so with many sessions every rerun allocates all of the
+tidy data anew. ``SharedStore`` is the ``cache_resource`` alternative for
+data that only depends on the workbook: each view is built once per
+process (per content version), frozen, and the same object is returned to
+every session.
+
+Frozen frames are backed by read‑only arrays, so an accidental in‑place
+write raises instead of leaking into other sessions. Reading, filtering,
+``query`` and the like work as usual and share memory under copy‑on‑write;
+code that really needs to modify a frame takes ``df.copy(deep=False)``
+first and only the columns it writes are copied.
+"""
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+
+import numpy as np
+import pandas as pd
+
+
+def _readonly(s: pd.Series):
+    if not isinstance(s.dtype, np.dtype):
+        return s.array
+    values = s.to_numpy().view()
+    values.flags.writeable = False
+    return values
+
+
+def freeze(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    ``df`` rebuilt on read‑only views of its own column arrays (no data is
+    copied). Extension arrays – Arrow‑backed strings, categoricals – are
+    shared as they are; copy‑on‑write keeps a write to one of them from
+    reaching the original.
+    """
+    frozen = pd.DataFrame({i: _readonly(df.iloc[:, i]) for i in range(df.shape[1])},
+                          index=df.index, copy=False)
+    frozen.columns = df.columns
+    frozen.attrs = df.attrs
+    return frozen
+
+
+class SharedStore:
+    """
+    Named, versioned read‑only views, built lazily on first use.
+    Only the latest version of each view is kept: when a sheet changes, the
+    first rerun that asks for the new version rebuilds it and the old frame
+    goes away with the last session still holding it.
+    """
+
+    def __init__(self):
+        self._views: dict[str, tuple[str, pd.DataFrame]] = {}
+        self._locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.builds: dict[str, int] = {}
+
+    def view(self, name: str, version: str,
+             build: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        """
+        The frozen result of ``build()`` for ``version`` of ``name``.
+        Concurrent callers of the same view wait for a single build; views
+        with different names build in parallel.
+        """
+        hit = self._views.get(name)
+        if hit is not None and hit[0] == version:
+            return hit[1]
+        with self._lock:
+            lock = self._locks.setdefault(name, threading.Lock())
+        with lock:
+            hit = self._views.get(name)
+            if hit is not None and hit[0] == version:
+                return hit[1]
+            df = freeze(build())
+            self._views[name] = (version, df)
+            self.builds[name] = self.builds.get(name, 0) + 1
+        return df
+
+    def nbytes(self) -> int:
+        """Deep memory of all current views."""
+        return sum(int(df.memory_usage(deep=True).sum()) for _, df in list(self._views.values()))
@@ -0,0 +1,102 @@
+"""Background hot‑reload of the workbook.
+
+``WorkbookWatcher`` polls the workbook's size/mtime from a daemon thread.
+When the file changes (and has stopped changing for one poll, so a save in
+progress is not picked up half‑written) it calls ``LazyWorkbook.refresh``
+on that thread – only sheets whose XML part changed are re‑parsed – and
+then swaps ``current`` to the new workbook in a single assignment. Request
+code only ever reads ``current``, so it never waits on a parse and always
+sees one consistent workbook. Subscribers are told which sheets changed so
+they can drop exactly the derived caches that depend on them.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import zipfile
+from collections.abc import Callable
+from pathlib import Path
+
+from dashboard.workbook import LazyWorkbook
+
+log = logging.getLogger(__name__)
+
+# (old workbook, new workbook, changed sheet names) → None
+Listener = Callable[[LazyWorkbook, LazyWorkbook, list[str]], None]
+
+
+def _stat(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+class WorkbookWatcher:
+    """Keeps ``current`` in sync with the workbook on disk."""
+
+    def __init__(self, path: Path, interval: float = 2.0):
+        self.path = Path(path)
+        self.interval = interval
+        self.current = LazyWorkbook(self.path)
+        self.reloads = 0
+        self.last_changed: list[str] = []
+        self._seen = _stat(self.path)
+        self._pending: tuple[int, int] | None = None
+        self._listeners: dict[str, Listener] = {}
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def subscribe(self, key: str, listener: Listener) -> None:
+        """Register (or replace) the listener called after each reload."""
+        self._listeners[key] = listener
+
+    def start(self) -> WorkbookWatcher:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="workbook-watcher",
+                                            daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def check(self) -> list[str] | None:
+        """
+        One poll. Returns the changed sheet names if a reload happened, else
+        ``None``. A failed reload (file mid‑write, unreadable) keeps the old
+        workbook and is retried on the next poll.
+        """
+        stat = _stat(self.path)
+        if stat is None or stat == self._seen:
+            self._pending = None
+            return None
+        if stat != self._pending:   # still being written? look again next poll
+            self._pending = stat
+            return None
+
+        old = self.current
+        try:
+            new, changed = old.refresh()
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile) as exc:
+            log.warning("watcher: reload of %s failed (%s)", self.path.name, exc)
+            return None
+        self._seen, self._pending = stat, None
+        self.current = new
+        self.reloads += 1
+        self.last_changed = changed
+        log.info("watcher: %s reloaded, changed sheets %s", self.path.name, changed)
+        for listener in list(self._listeners.values()):
+            try:
+                listener(old, new, changed)
+            except Exception:  # a broken listener must not stop the watcher
+                log.exception("watcher: listener failed")
+        return changed
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.check()
@@ -0,0 +1,186 @@
+"""Lazy, per‑sheet access to the Excel workbook.
+
+``LazyWorkbook`` behaves like the ``dict[str, DataFrame]`` that
+``load_sheets`` used to return, but only the sheet *names* are read up front
+(from the snapshot manifest or the workbook index). A sheet is parsed the
+first time it is accessed and then cached on its own, so a visitor who only
+opens one tab never pays for the others. Load times per sheet are kept in
+``timings``.
+
+Each sheet also has its own content version (``sheet_version``), taken
+from the hash of its XML part inside the xlsx zip. ``refresh`` uses it to
+re‑open an edited workbook while keeping the frames of untouched sheets,
+and derived caches keyed on it survive edits to unrelated sheets.
+
+Sheets are parsed with the values‑only ``xlsx.SheetReader`` (shared strings
+decoded once per workbook, no openpyxl cell objects); ``pd.read_excel``
+is only the fallback for markup the reader does not handle.
+
+The frames are shared by every session, so they are frozen
+(``store.freeze``): reading is zero‑copy and an in‑place write raises.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import zipfile
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from xml.etree import ElementTree as ET
+
+import pandas as pd
+
+from dashboard import snapshot, xlsx
+from dashboard.store import freeze
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SheetTiming:
+    """Wall time spent loading one sheet and where it came from."""
+    seconds: float
+    source: str  # "snapshot" | "excel" | "reused" (kept across a refresh)
+
+
+class LazyWorkbook(Mapping):
+    """Read‑only mapping of sheet name → DataFrame, parsed on first access."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.timings: dict[str, SheetTiming] = {}
+        self._frames: dict[str, pd.DataFrame] = {}
+        self._lock = threading.Lock()
+        self._xls: pd.ExcelFile | None = None
+        self._reader: xlsx.SheetReader | None = None
+
+        self._manifest = snapshot.open_manifest(self.path)
+        if self._manifest is not None:
+            self._names = list(self._manifest["sheet_names"])
+        else:
+            # only workbook.xml and its rels are read for the names
+            try:
+                self._names = self._sheet_reader().sheet_names
+            except (KeyError, zipfile.BadZipFile, ET.ParseError):
+                self._names = list(self._excel().sheet_names)
+        self.part_hashes: dict[str, str] = {}
+        try:
+            self.part_hashes = xlsx.sheet_part_hashes(self.path)
+        except (OSError, KeyError, zipfile.BadZipFile, ValueError) as exc:
+            log.warning("workbook: no per-sheet hashes for %s (%s)", self.path.name, exc)
+        # pinned now rather than on first use: ``refresh`` needs the hash of
+        # the content this workbook was opened with after the file changed
+        self._version = (self._manifest["sha256"] if self._manifest is not None
+                         else snapshot.file_sha256(self.path))
+
+    # -- Mapping interface -------------------------------------------------
+    def __getitem__(self, name: str) -> pd.DataFrame:
+        df = self._frames.get(name)
+        if df is not None:
+            return df
+        if name not in self._names:
+            raise KeyError(name)
+        with self._lock:
+            if name not in self._frames:
+                self._frames[name] = self._load(name)
+        return self._frames[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    # -- helpers -----------------------------------------------------------
+    @property
+    def version(self) -> str:
+        """Content hash of the workbook; use it as a cache key for derived data."""
+        return self._version
+
+    def sheet_version(self, keywords: list[str]) -> str:
+        """
+        Content hash of the sheet ``find(keywords)`` picks ("" if none), for
+        caches that depend on that sheet only. Falls back to ``version``
+        when per‑sheet hashes are unavailable.
+        """
+        name = self.find(keywords)
+        if name is None:
+            return ""
+        return self.part_hashes.get(name) or self.version
+
+    def find(self, keywords: list[str]) -> str | None:
+        """Name of the first sheet containing ANY keyword; nothing is parsed."""
+        return next((n for n in self._names if any(k in n for k in keywords)), None)
+
+    def loaded(self) -> list[str]:
+        """Sheets parsed so far, in workbook order."""
+        return [n for n in self._names if n in self._frames]
+
+    def _excel(self) -> pd.ExcelFile:
+        if self._xls is None:
+            self._xls = pd.ExcelFile(self.path)
+        return self._xls
+
+    def _sheet_reader(self) -> xlsx.SheetReader:
+        if self._reader is None:
+            self._reader = xlsx.SheetReader(self.path)
+        return self._reader
+
+    def _parse(self, name: str) -> pd.DataFrame:
+        """One sheet from the xlsx itself (no snapshot)."""
+        try:
+            return self._sheet_reader().read(name)
+        except (KeyError, ValueError, zipfile.BadZipFile, ET.ParseError) as exc:
+            log.warning("workbook: %r via openpyxl (%s)", name, exc)
+            return pd.read_excel(self._excel(), sheet_name=name)
+
+    def _load(self, name: str) -> pd.DataFrame:
+        t0 = time.perf_counter()
+        entry = None
+        if self._manifest is not None:
+            entry = next((e for e in self._manifest["sheets"] if e["name"] == name), None)
+
+        df = None
+        if entry is not None:
+            try:
+                df = snapshot.read_snapshot_sheet(self.path, entry)
+                source = "snapshot"
+            except (OSError, ValueError):  # file vanished / truncated
+                df = None
+        if df is None:
+            df = self._parse(name)
+            source = "excel"
+            snapshot.add_snapshot_sheet(self.path, name, df, self._names)
+
+        self.timings[name] = SheetTiming(time.perf_counter() - t0, source)
+        return freeze(df)
+
+    def refresh(self) -> tuple[LazyWorkbook, list[str]]:
+        """
+        Re‑open the workbook after it changed on disk.
+        Sheets whose part hash is unchanged keep this workbook's frame, or
+        stay lazy with their snapshot entry carried over to the new
+        version (mapping one back costs about a millisecond). Every changed
+        or added sheet is re‑parsed here, read before or not, so the caller
+        – a background watcher – pays for it and no request ever waits on
+        a parse of edited XML.
+        Returns the new workbook and the names of the changed sheets
+        (including added and removed ones).
+        """
+        new = LazyWorkbook(self.path)
+        changed = [n for n in new._names
+                   if not new.part_hashes.get(n)
+                   or new.part_hashes.get(n) != self.part_hashes.get(n)]
+        if new._manifest is None:
+            new._manifest = snapshot.carry_snapshot(
+                self.path, new._names, [n for n in new._names if n not in changed],
+                old_sha256=self.version, sha256=new.version)
+        for name in new._names:
+            if name in changed:
+                new._frames[name] = new._load(name)
+            elif name in self._frames:
+                new._frames[name] = self._frames[name]
+                new.timings[name] = SheetTiming(0.0, "reused")
+        return new, changed + [n for n in self._names if n not in new._names]
@@ -0,0 +1,99 @@
+"""Pure wrangling functions: raw sheet DataFrames in, tidy DataFrames out.
+
+Nothing here touches Streamlit, so ``app.py`` can memoise each step per
+workbook version and scripts can reuse the exact same transformations.
+"""
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+POLICY_COLUMNS = ["category", "party", "level", "description"]
+
+
+def tidy_emissions(em_raw: pd.DataFrame) -> pd.DataFrame:
+    """Sector × party emissions in long form (부문, 정당, 값)."""
+    if em_raw.empty:
+        return pd.DataFrame()
+    # wide → long 변환 여부 판단
+    if "정당" not in em_raw.columns:
+        return em_raw.melt(id_vars="부문", var_name="정당", value_name="값")
+    return em_raw.rename(columns=str).copy()
+
+
+def tidy_energy(en_raw: pd.DataFrame) -> pd.DataFrame:
+    """Energy mix in long form (에너지원, 시나리오, <value>) with clean names."""
+    if en_raw.empty:
+        return pd.DataFrame()
+    energy_df = (en_raw if "시나리오" in en_raw.columns
+                 else en_raw.melt(id_vars="에너지원",
+                                  var_name="시나리오",
+                                  value_name="비중"))
+    # --- Standardize column names -------------------------------------
+    return energy_df.rename(
+        columns=lambda c: c.strip().replace("(TWh)", "").replace(" ", ""))
+
+
+def value_column(energy_df: pd.DataFrame) -> str:
+    """'비중' if present, else the first numeric column of the energy mix."""
+    if "비중" in energy_df.columns:
+        return "비중"
+    numeric_cols = energy_df.select_dtypes("number").columns
+    return next(col for col in numeric_cols if col not in ["에너지원"])
+
+
+def tidy_temperature(tp_raw: pd.DataFrame) -> pd.DataFrame:
+    """Temperature / emission pathways in long form (연도, 경로, 배출량)."""
+    if tp_raw.empty or "경로" in tp_raw.columns:
+        return tp_raw
+    return tp_raw.melt(id_vars="연도", var_name="경로", value_name="배출량")
+
+
+def split_paths(temp_df: pd.DataFrame) -> tuple[list[str], list[str]]:
+    """(reference °C pathways, party pathways) in sheet order."""
+    paths_all = temp_df["경로"].unique()
+    ref_paths = [p for p in paths_all if "°C" in p]
+    party_paths = [p for p in paths_all if p not in ref_paths]
+    return ref_paths, party_paths
+
+
+def tidy_descriptions(desc_raw: pd.DataFrame) -> pd.DataFrame:
+    """Energy source descriptions, or an empty frame with the right columns."""
+    if not desc_raw.empty and {"energy_source", "description"}.issubset(desc_raw.columns):
+        return desc_raw.copy()
+    return pd.DataFrame(columns=["energy_source", "description"])
+
+
+def normalize_policy(df_raw: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return policy DataFrame in long format:
+    columns = ['category','party','level','description']
+    """
+    # Expect either already long‑form, or wide JSON‑like sheet
+    if set(POLICY_COLUMNS).issubset(df_raw.columns):
+        return df_raw.copy()
+
+    # Otherwise, try to normalize a nested JSON style:
+    # one row per category with parties = {party: {level, description}}
+    if "parties" not in df_raw.columns:
+        return pd.DataFrame()
+    cat = df_raw["category"] if "category" in df_raw.columns else df_raw.iloc[:, 0]
+    nested = pd.DataFrame({"category": cat.to_numpy(),
+                           "parties": df_raw["parties"].to_numpy()})
+    nested = nested[nested["parties"].map(lambda v: isinstance(v, dict))]
+    if nested.empty:
+        return pd.DataFrame()
+
+    # {party: {...}} → one row per party: repeat each category by its dict
+    # length (an explode without the per‑row Series), then build the inner
+    # dicts into columns in one go
+    parties = nested["parties"].to_numpy()
+    lengths = np.fromiter(map(len, parties), dtype=np.intp, count=len(parties))
+    fields = pd.DataFrame.from_records([d for row in parties for d in row.values()],
+                                       columns=["level", "description"])
+    return pd.DataFrame({
+        "category": np.repeat(nested["category"].to_numpy(), lengths),
+        "party": [p for row in parties for p in row],
+        "level": fields["level"].to_numpy(),
+        "description": fields["description"].to_numpy(),
+    })
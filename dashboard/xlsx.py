@@ -0,0 +1,436 @@
+"""Low‑level access to the parts inside an ``.xlsx`` zip.
+
+An xlsx file is a zip of XML parts: ``xl/workbook.xml`` lists the sheets,
+``xl/_rels/workbook.xml.rels`` maps each sheet to its
+``xl/worksheets/sheetN.xml`` part, and string cells point into
+``xl/sharedStrings.xml``. Reading these directly is much cheaper than
+opening the workbook with openpyxl when all we need is to know *which*
+sheets changed.
+
+``SheetReader`` goes one step further and reads sheet *values*: it
+scans a worksheet part chunk by chunk as it is decompressed (no cell
+objects, no styles beyond the few that mark dates), resolves the shared string table once per
+workbook, skips unrequested columns before decoding them and builds each
+column as a typed array. It is what ``LazyWorkbook`` parses sheets with;
+``pd.read_excel`` remains the fallback for anything it can't read.
+"""
+from __future__ import annotations
+
+import datetime as dt
+import hashlib
+import posixpath
+import re
+import zipfile
+from collections.abc import Iterable
+from pathlib import Path
+from xml.etree import ElementTree as ET
+from xml.sax.saxutils import escape as xml_escape
+from xml.sax.saxutils import unescape as xml_unescape
+
+import numpy as np
+import pandas as pd
+
+NS_MAIN = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+NS_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+NS_PKG = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+_SHEET_DATA = re.compile(rb"<sheetData\b[^>]*?(?:/>|>.*?</sheetData>)", re.S)
+_SHARED_REF = re.compile(rb'(<c\b[^>]*\bt="s"[^>]*>\s*<v>)(\d+)(</v>)')
+
+
+def sheet_parts(zf: zipfile.ZipFile) -> dict[str, str]:
+    """Sheet name → zip member of its worksheet XML, in workbook order."""
+    rels = ET.fromstring(zf.read("xl/_rels/workbook.xml.rels"))
+    targets = {r.get("Id"): r.get("Target") for r in rels.iter(f"{{{NS_PKG}}}Relationship")}
+    book = ET.fromstring(zf.read("xl/workbook.xml"))
+    parts = {}
+    for sheet in book.iter(f"{{{NS_MAIN}}}sheet"):
+        target = targets[sheet.get(f"{{{NS_REL}}}id")]
+        # targets are relative to xl/ unless absolute ("/xl/worksheets/…")
+        parts[sheet.get("name")] = (target.lstrip("/") if target.startswith("/")
+                                    else posixpath.normpath(posixpath.join("xl", target)))
+    return parts
+
+
+def shared_strings(zf: zipfile.ZipFile) -> list[str]:
+    """The shared string table (rich text runs concatenated)."""
+    try:
+        data = zf.read("xl/sharedStrings.xml")
+    except KeyError:
+        return []
+    t = f"{{{NS_MAIN}}}t"
+    return ["".join(node.text or "" for node in si.iter(t))
+            for si in ET.fromstring(data).iter(f"{{{NS_MAIN}}}si")]
+
+
+def sheet_part_hashes(path: Path) -> dict[str, str]:
+    """
+    Content hash per sheet name, stable across saves that did not touch it.
+    Only ``<sheetData>`` is hashed (selection, scroll position and the
+    active‑tab flag live outside it), with the index of every shared‑string
+    cell replaced by the string it points to – editing a label elsewhere
+    can renumber the shared string table without changing what this sheet
+    shows.
+    Raises ``zipfile.BadZipFile`` / ``KeyError`` for a file that is not a
+    (complete) xlsx, e.g. one caught mid‑write.
+    """
+    with zipfile.ZipFile(path) as zf:
+        parts = sheet_parts(zf)
+        strings = None
+        out = {}
+        for name, member in parts.items():
+            xml = zf.read(member)
+            m = _SHEET_DATA.search(xml)
+            data = m.group(0) if m else xml
+            if _SHARED_REF.search(data):
+                if strings is None:
+                    strings = [xml_escape(s).encode("utf-8") for s in shared_strings(zf)]
+                data = _SHARED_REF.sub(lambda c: c[1] + strings[int(c[2])] + c[3], data)
+            out[name] = hashlib.sha256(data).hexdigest()
+    return out
+
+
+# ---------------------------------------------------------------------#
+# Values‑only sheet reader
+# ---------------------------------------------------------------------#
+# Built‑in number formats that display a date or time (ECMA‑376 §18.8.30)
+_DATE_FORMAT_IDS = {*range(14, 23), *range(45, 48)}
+_DATE_CODE = re.compile(r"[dmyhs]", re.I)
+_QUOTED = re.compile(r'"[^"]*"|\\.|\[[^\]]*\]')
+# Strings ``pd.read_excel`` reads as missing (its default ``na_values``)
+NA_STRINGS = frozenset({
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a",
+    "nan", "null",
+})
+
+
+def _column_index(letters: str) -> int:
+    n = 0
+    for ch in letters:
+        n = n * 26 + ord(ch) - 64
+    return n - 1
+
+
+def date_styles(zf: zipfile.ZipFile) -> set[int]:
+    """Indices into ``cellXfs`` whose number format shows a date/time."""
+    try:
+        styles = ET.fromstring(zf.read("xl/styles.xml"))
+    except KeyError:
+        return set()
+    custom = {int(f.get("numFmtId")): f.get("formatCode", "")
+              for f in styles.iter(f"{{{NS_MAIN}}}numFmt")}
+    date_ids = _DATE_FORMAT_IDS | {i for i, code in custom.items()
+                                   if _DATE_CODE.search(_QUOTED.sub("", code))}
+    xfs = styles.find(f"{{{NS_MAIN}}}cellXfs")
+    if xfs is None:
+        return set()
+    return {i for i, xf in enumerate(xfs) if int(xf.get("numFmtId", 0)) in date_ids}
+
+
+def _header(values: dict[int, object]) -> dict[int, object]:
+    """Column index → name as ``pd.read_excel`` would label it."""
+    names, seen = {}, {}
+    for i in range(max(values, default=-1) + 1):
+        v = values.get(i)
+        name = f"Unnamed: {i}" if v is None else v
+        if name in seen:              # duplicate headers get .1, .2 …
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        names[i] = name
+    return names
+
+
+# One <c> element: column letters, row, style, type, <v> text, plain
+# inline text, rich inline xml.
+# Writers emit the attributes in schema order (r, s, t); ``_scan`` raises
+# if any cell does not match, so callers can fall back to openpyxl.
+_CELL = re.compile(
+    rb'<c r="([A-Z]{1,3})(\d+)"(?: s="(\d+)")?(?: t="(\w+)")?[^>]*?'
+    rb'(?:/>|>(?:<f\b[^>]*?(?:/>|>[^<]*</f>))?(?:<v>([^<]*)</v>|<v\s*/>|<is><t>([^<]*)</t></is>|<is>(.*?)</is>)?\s*</c>)',
+    re.S)
+_T_TEXT = re.compile(rb"<t\b[^>]*>([^<]*)</t>")
+
+
+def _scan(zf: zipfile.ZipFile, member: str, chunk_size: int = 1 << 21):
+    """
+    Lists of ``(letters, row, style, type, v, text, rich)`` byte tuples, one
+    list per ``chunk_size`` of decompressed XML (cut at a ``</row>`` so no
+    cell is split).
+    """
+    with zf.open(member) as fh:
+        tail = b""
+        while True:
+            chunk = fh.read(chunk_size)
+            buf = tail + chunk
+            cut = len(buf) if not chunk else buf.rfind(b"</row>") + len(b"</row>")
+            if chunk and cut < len(b"</row>"):     # no complete row yet
+                tail = buf
+                continue
+            cells = _CELL.findall(buf, 0, cut)
+            if len(cells) != buf.count(b"<c ", 0, cut):
+                raise ValueError(f"{member}: unsupported cell markup")
+            if cells:
+                yield cells
+            tail = buf[cut:]
+            if not chunk:
+                return
+
+
+def _unescape(text: bytes) -> str:
+    s = text.decode("utf-8")
+    return xml_unescape(s, {"&quot;": '"', "&apos;": "'"}) if "&" in s else s
+
+
+def _inline(xml: bytes) -> str:
+    """Plain (``text``) or rich (``<r>…`` runs) inline string content."""
+    if not xml.startswith(b"<"):
+        return _unescape(xml)
+    return "".join(_unescape(t) for t in _T_TEXT.findall(xml))
+
+
+def _decoded(keys, decode, memo: dict[bytes, str]) -> list[str]:
+    """``decode`` each distinct key once; repeated text shares one ``str``."""
+    out = []
+    for key in keys:
+        s = memo.get(key)
+        if s is None:
+            s = memo[key] = decode(key)
+        out.append(s)
+    return out
+
+
+class _Cells:
+    """Decoded cells of one chunk as parallel arrays, split numeric / other."""
+
+    def __init__(self, cells: list[tuple], strings: np.ndarray, dates: set[int],
+                 epoch: dt.datetime, memo: dict[bytes, str], keep=None):
+        letters, rows, styles, types, vs, text, rich = zip(*cells)
+        uniq, inv = np.unique(np.array(letters), return_inverse=True)
+        col = np.array([_column_index(u.decode()) for u in uniq])[inv]
+        row = np.fromiter(map(int, rows), np.int64, len(rows))
+        t = np.array(types)
+        v = np.array(vs, dtype=object)
+        m = v != b""
+        if keep is not None:
+            m &= keep(col, row)
+
+        num = m & ((t == b"") | (t == b"n"))
+        vals = np.fromiter(map(float, v[num]), float, int(num.sum()))
+        objs = []                         # (mask, values) of non‑numeric cells
+        if dates and num.any():
+            s = np.array(styles, dtype=object)[num]
+            is_date = np.isin(np.fromiter((int(x or -1) for x in s), np.int64, len(s)),
+                              list(dates))
+            if is_date.any():
+                d = num.copy()
+                d[num] = is_date
+                objs.append((d, list((epoch + pd.to_timedelta(vals[is_date], unit="D"))
+                                     .to_pydatetime())))
+                num[num] = ~is_date
+                vals = vals[~is_date]
+        sst = m & (t == b"s")
+        if sst.any():
+            objs.append((sst, strings[np.fromiter(map(int, v[sst]), np.int64, int(sst.sum()))]))
+        k = m & (t == b"b")
+        if k.any():
+            objs.append((k, (v[k] == b"1").tolist()))
+        k = m & (t == b"str")
+        if k.any():
+            objs.append((k, _decoded(v[k], _unescape, memo)))
+        k = t == b"inlineStr"
+        if keep is not None:
+            k &= keep(col, row)
+        if k.any():
+            plain, rich = np.array(text, dtype=object)[k], np.array(rich, dtype=object)[k]
+            objs.append((k, _decoded([r or p for p, r in zip(plain, rich)], _inline, memo)))
+
+        if (m & (t == b"d")).any():
+            # ISO 8601 text that openpyxl turns into datetime, date or time
+            # objects depending on its form; leave those sheets to it
+            raise ValueError("unsupported date cells (t=\"d\")")
+        err = m & (t == b"e")           # #DIV/0!, #N/A …: missing, as read_excel reads them
+        if err.any():
+            num |= err
+            is_err = err[num]
+            merged = np.full(len(is_err), np.nan)
+            merged[~is_err] = vals
+            vals = merged
+
+        self.num_col, self.num_row, self.num_val = col[num], row[num], vals
+        if objs:
+            o_col = np.concatenate([col[k] for k, _ in objs])
+            o_row = np.concatenate([row[k] for k, _ in objs])
+            o_val = np.empty(len(o_col), dtype=object)
+            o_val[:] = [x for _, vals_ in objs for x in vals_]
+            present = ~pd.Series(o_val).isin(NA_STRINGS).to_numpy()
+            self.obj_col, self.obj_row, self.obj_val = o_col[present], o_row[present], o_val[present]
+        else:
+            self.obj_col = self.obj_row = np.empty(0, dtype=np.int64)
+            self.obj_val = np.empty(0, dtype=object)
+
+
+def _split(col: np.ndarray, *arrays: np.ndarray) -> dict[int, tuple]:
+    """Group parallel arrays by ``col``: column → tuple of sub‑arrays."""
+    if not len(col):
+        return {}
+    order = np.argsort(col, kind="stable")
+    col = col[order]
+    arrays = [a[order] for a in arrays]
+    starts = np.flatnonzero(np.r_[True, col[1:] != col[:-1]])
+    bounds = np.r_[starts, len(col)]
+    return {int(col[a]): tuple(x[a:b] for x in arrays) for a, b in zip(bounds[:-1], bounds[1:])}
+
+
+def _joined(segments: list[tuple] | None) -> tuple | None:
+    if not segments:
+        return None
+    return tuple(np.concatenate(parts) for parts in zip(*segments))
+
+
+# Integers are exact in a float64 below this; openpyxl parses integer text
+# exactly at any size (and read_excel keeps what int64 can't hold as Python
+# ints), so sheets with larger numbers are left to it.
+_EXACT_BOUND = float(2 ** 53)
+
+
+def _column(nrows: int, num: tuple | None, obj: tuple | None):
+    """One typed column from its numeric and other (row, value) cells."""
+    if num is not None and (np.abs(num[1]) >= _EXACT_BOUND).any():
+        raise ValueError("numbers beyond 2**53: not exact as float64")
+    if obj is None:
+        arr = np.full(nrows, np.nan)
+        if num is not None:
+            arr[num[0]] = num[1]
+            if len(num[0]) == nrows and np.equal(np.mod(arr, 1), 0).all():
+                return arr.astype(np.int64)       # in range: |values| < 2**53
+        return arr
+    if all(type(x) is bool for x in obj[1]):
+        # booleans alone stay bool; with blanks or numbers read_excel gives
+        # a numeric column (True → 1), so they join the numbers
+        if num is None and len(obj[0]) == nrows:
+            return np.array(obj[1], dtype=bool)
+        as_num = (obj[0], np.array(obj[1], dtype=float))
+        return _column(nrows, as_num if num is None else _joined([num, as_num]), None)
+    out = np.full(nrows, np.nan, dtype=object)
+    if num is not None:         # integral numbers come back as int, as openpyxl gives them
+        vals = num[1]
+        integral = np.equal(np.mod(vals, 1), 0)
+        boxed = vals.astype(object)
+        boxed[integral] = vals[integral].astype(np.int64).tolist()
+        out[num[0]] = boxed
+    out[obj[0]] = obj[1]
+    return pd.Series(out.tolist())
+
+
+class SheetReader:
+    """
+    Values‑only reader of the sheets of one xlsx file. ``read`` gives the
+    same frame as ``pd.read_excel(path, sheet_name=name)`` for the plain
+    tables this project keeps (header in the first row; integral numbers as
+    ``int64``; date‑formatted numbers as timestamps).
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._zf = zipfile.ZipFile(self.path)
+        try:
+            self.parts = sheet_parts(self._zf)
+            book = self._zf.read("xl/workbook.xml")
+        except BaseException:
+            self._zf.close()
+            raise
+        self._epoch = (dt.datetime(1904, 1, 1) if re.search(rb'date1904="(1|true)"', book)
+                       else dt.datetime(1899, 12, 30))
+        self._strings: np.ndarray | None = None
+        self._dates: set[int] | None = None
+
+    @property
+    def sheet_names(self) -> list[str]:
+        return list(self.parts)
+
+    @property
+    def strings(self) -> np.ndarray:
+        """The shared string table, decoded once for every sheet read."""
+        if self._strings is None:
+            table = shared_strings(self._zf)
+            self._strings = np.empty(len(table), dtype=object)
+            self._strings[:] = table
+        return self._strings
+
+    def close(self) -> None:
+        self._zf.close()
+
+    def __enter__(self) -> SheetReader:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def read(self, name: str, usecols: Iterable | None = None) -> pd.DataFrame:
+        """
+        One sheet as a DataFrame; ``usecols`` (header names) limits the
+        columns decoded. Raises ``KeyError`` for an unknown sheet and
+        ``ValueError`` for cell markup the scanner does not handle or
+        numbers a float64 can't hold exactly.
+        """
+        if self._dates is None:
+            self._dates = date_styles(self._zf)
+        wanted = None if usecols is None else set(usecols)
+
+        header = None
+        memo: dict[bytes, str] = {}
+        # column → [(rows, values), …] per chunk, numeric and other apart
+        num: dict[int, list] = {}
+        obj: dict[int, list] = {}
+        for cells in _scan(self._zf, self.parts[name]):
+            if header is None:
+                # the header is row 1 even when it is empty, as read_excel reads it
+                top = [c for c in cells if c[1] == b"1"]
+                values = {}
+                if top:
+                    top = _Cells(top, self.strings, self._dates, self._epoch, memo)
+                    values = dict(zip(top.num_col.tolist(), top.num_val.tolist()))
+                    values.update(zip(top.obj_col.tolist(), top.obj_val.tolist()))
+                header = _header({c: int(v) if isinstance(v, float) and v.is_integer() else v
+                                  for c, v in values.items()})
+                keep_cols = (None if wanted is None else
+                             np.array([i for i, n in header.items() if n in wanted]))
+
+                def keep(col, row, keep_cols=keep_cols):
+                    m = row > 1
+                    return m if keep_cols is None else m & np.isin(col, keep_cols)
+            c = _Cells(cells, self.strings, self._dates, self._epoch, memo, keep)
+            del cells
+            for parts, col, row, val in ((num, c.num_col, c.num_row, c.num_val),
+                                         (obj, c.obj_col, c.obj_row, c.obj_val)):
+                for i, seg in _split(col, (row - 2).astype(np.int32), val).items():
+                    parts.setdefault(i, []).append(seg)
+
+        if header is None:
+            return pd.DataFrame()
+        nrows = max((int(seg[0].max()) + 1 for segs in [*num.values(), *obj.values()]
+                     for seg in segs), default=0)
+        order = sorted(i for i in set(header) | set(num) | set(obj)
+                       if wanted is None or header.get(i) in wanted)
+        if not order:
+            return pd.DataFrame()
+        names = [header.get(i, f"Unnamed: {i}") for i in order]
+        if not nrows:           # header only: read_excel leaves the columns object
+            return pd.DataFrame({n: pd.Series([], dtype=object) for n in names}, columns=names)
+        # Build (and free the cell segments of) one column at a time
+        return pd.DataFrame({n: _column(nrows, _joined(num.pop(i, None)), _joined(obj.pop(i, None)))
+                             for n, i in zip(names, order)}, columns=names)
+
+
+def read_sheets(path: Path, names: Iterable[str] | None = None,
+                usecols: dict[str, Iterable] | None = None) -> dict[str, pd.DataFrame]:
+    """
+    ``names`` (default: every sheet) of ``path`` read with one
+    ``SheetReader``, so the shared strings are decoded once.
+    """
+    with SheetReader(path) as reader:
+        return {n: reader.read(n, (usecols or {}).get(n))
+                for n in (reader.sheet_names if names is None else names)}
@@ -0,0 +1,32 @@
+"""Query parsing of ``DataApi.get`` on the numeric filters."""
+from __future__ import annotations
+
+import json
+from http import HTTPStatus
+from pathlib import Path
+
+import pytest
+
+from dashboard.api import DataApi
+from dashboard.watcher import WorkbookWatcher
+
+WORKBOOK = Path(__file__).resolve().parent.parent / "data" / "climate_data.xlsx"
+
+
+@pytest.fixture(scope="module")
+def api():
+    return DataApi(WorkbookWatcher(WORKBOOK))
+
+
+@pytest.mark.parametrize("query", ["year=2030.0", "year=2030,2030.0", "from=2030.0&to=2030"])
+def test_integral_float_years_are_accepted(api, query):
+    resp = api.get("/api/temperature", query)
+    assert resp.status == HTTPStatus.OK
+    assert resp.body == api.get("/api/temperature", "year=2030").body
+
+
+@pytest.mark.parametrize("query", ["year=2030.5", "year=soon", "from=nan", "to=inf"])
+def test_other_years_are_a_bad_request(api, query):
+    resp = api.get("/api/temperature", query)
+    assert resp.status == HTTPStatus.BAD_REQUEST
+    assert "expected an integer year" in json.loads(resp.body)["error"]
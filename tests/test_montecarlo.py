@@ -0,0 +1,28 @@
+"""Percentiles read off the Monte Carlo histograms."""
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from dashboard import montecarlo, wrangle
+from dashboard.workbook import LazyWorkbook
+
+WORKBOOK = Path(__file__).resolve().parent.parent / "data" / "climate_data.xlsx"
+
+
+@pytest.mark.parametrize("value, bin", [(0.0, 0), (7.3, 7), (9.99, 9)])
+def test_point_mass_is_exact(value, bin):
+    hist = np.zeros(10, dtype=np.int64)
+    hist[bin] = 1000
+    q = montecarlo.hist_percentiles(hist, (5, 50, 95), 10.0, lo=value, hi=value)
+    np.testing.assert_array_equal(q, value)
+
+
+def test_net_zero_pathways_report_zero():
+    wb = LazyWorkbook(WORKBOOK)
+    energy = wrangle.tidy_energy(wb[wb.find(["에너지믹스"])])
+    bands = montecarlo.run(energy, 2_000, chunk=500, workers=1)
+    zero = bands[(bands["경로"] == "민주노동당") & (bands["연도"] == 2050)]
+    assert (zero.filter(like="p") == 0).all(axis=None)
@@ -0,0 +1,42 @@
+"""The pathway engine against the pre‑baked 온도경로 sheet, every year."""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from dashboard import pathways, wrangle
+from dashboard.workbook import LazyWorkbook
+
+WORKBOOK = Path(__file__).resolve().parent.parent / "data" / "climate_data.xlsx"
+
+
+@pytest.fixture(scope="module")
+def frames():
+    wb = LazyWorkbook(WORKBOOK)
+    energy = wrangle.tidy_energy(wb[wb.find(["에너지믹스"])])
+    temp = wrangle.tidy_temperature(wb[wb.find(["온도경로"])])
+    return temp, pathways.compute_pathways(energy)
+
+
+def test_every_sheet_point_within_tolerance(frames):
+    temp, computed = frames
+    cmp = pathways.compare_to_sheet(temp, computed)
+    party_rows = temp[temp["경로"].isin(pathways.PARTY_SPECS)]
+    assert len(cmp) == len(party_rows)              # no year or party left out
+    over = cmp[cmp["rel_err"] > cmp["tol"]]
+    assert over.empty, over.to_string()
+
+
+def test_people_power_2035_gap_is_the_sheet(frames):
+    """The one loose point: the sheet, not the engine, leaves the line."""
+    temp, computed = frames
+
+    def at(df, col, year):
+        return df.loc[(df["경로"] == "국민의힘") & (df["연도"] == year), col].item()
+
+    sheet_mid = (at(temp, "배출량", 2030) + at(temp, "배출량", 2040)) / 2
+    assert at(temp, "배출량", 2035) == pytest.approx(sheet_mid, rel=0.012)
+    assert at(temp, "배출량", 2035) != pytest.approx(sheet_mid, rel=0.005)
+    model_mid = (at(computed, "배출량", 2030) + at(computed, "배출량", 2040)) / 2
+    assert at(computed, "배출량", 2035) == pytest.approx(model_mid)
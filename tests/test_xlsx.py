@@ -0,0 +1,69 @@
+"""``xlsx.SheetReader`` must read sheets as ``pd.read_excel`` does, or refuse."""
+from __future__ import annotations
+
+import zipfile
+
+import openpyxl
+import pandas as pd
+import pytest
+
+from dashboard import xlsx
+from dashboard.workbook import LazyWorkbook
+
+
+class Number(str):
+    """``<v>`` text written as is (``1E+20``), not as an inline string."""
+
+
+def _cell(ref: str, value) -> str:
+    if isinstance(value, str) and not isinstance(value, Number):
+        return f'<c r="{ref}" t="inlineStr"><is><t>{value}</t></is></c>'
+    return f'<c r="{ref}"><v>{value}</v></c>'
+
+
+def _workbook(path, rows: dict[int, list]) -> str:
+    """One sheet ``A`` with ``rows`` (row number → values from column A)."""
+    openpyxl.Workbook().save(path)
+    xml = "".join(f'<row r="{r}">'
+                  + "".join(_cell(f"{chr(65 + i)}{r}", v) for i, v in enumerate(values)
+                            if v is not None)
+                  + "</row>" for r, values in rows.items())
+    with zipfile.ZipFile(path) as zf:
+        parts = {i: zf.read(i.filename) for i in zf.infolist()}
+    with zipfile.ZipFile(path, "w") as zf:
+        for info, data in parts.items():
+            if info.filename == "xl/worksheets/sheet1.xml":
+                data = data.replace(b"<sheetData></sheetData>",
+                                    f"<sheetData>{xml}</sheetData>".encode())
+            zf.writestr(info, data)
+    with zipfile.ZipFile(path) as zf:
+        return next(iter(xlsx.sheet_parts(zf)))
+
+
+SHEETS = {
+    "plain": {1: ["a", "b"], 2: [1, 2.5], 3: [3, None]},
+    "row 1 empty": {2: ["a", "b"], 3: [1, 2], 5: [3, 4]},
+    "header only": {1: ["a", "b"]},
+    "header only, gap": {1: ["a", None, "c"]},
+    "empty column": {1: ["a", "b"], 2: [1, None]},
+    "int64 edge": {1: ["a"], 2: [2 ** 53 - 1], 3: [-(2 ** 53 - 1)]},
+}
+
+
+@pytest.mark.parametrize("rows", SHEETS.values(), ids=SHEETS.keys())
+def test_reader_matches_read_excel(tmp_path, rows):
+    path = tmp_path / "wb.xlsx"
+    name = _workbook(path, rows)
+    with xlsx.SheetReader(path) as reader:
+        got = reader.read(name)
+    pd.testing.assert_frame_equal(got, pd.read_excel(path, sheet_name=name))
+
+
+@pytest.mark.parametrize("value", ["1E+20", "9223372036854775807", "9007199254740993"])
+def test_numbers_beyond_float_precision_fall_back(tmp_path, value):
+    path = tmp_path / "wb.xlsx"
+    name = _workbook(path, {1: ["a", "b"], 2: [Number(value), 1], 3: [3, 2]})
+    with xlsx.SheetReader(path) as reader, pytest.raises(ValueError):
+        reader.read(name)
+    expected = pd.read_excel(path, sheet_name=name)
+    pd.testing.assert_frame_equal(LazyWorkbook(path)[name], expected)